@@ -1,188 +1,1398 @@
-return None, None, pd.DataFrame()
-    
-    return None, None, pd.DataFrame()
+import streamlit as st
+import pandas as pd
+import plotly.express as px
+import plotly.graph_objects as go
+from plotly.subplots import make_subplots
+from datetime import datetime
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
+import json
+import os
+import tempfile
+import threading
+import io
+import numpy as np
+import pyarrow as pa
+import pyarrow.feather as feather
 
-def main():
-    st.title("📊 ATS Recruitment Dashboard")
-    st.markdown("Upload je ATS export CSV om uitgebreide recruitment analytics te bekijken")
+from ats_core import (
+    PIPELINE_VERSION, CLOSE_TYPES, StageProfiler, ACTIVE_PROFILER, profile_stage, profiled,
+    submit_with_context, get_predefined_periods, compute_data_hash, process_ats_data,
+    get_date_range_from_data, filter_data_by_date_range, calculate_metrics, DailyEventIndex,
+    VacatureCube, compute_daily_activity, count_values, create_vacature_performance_table,
+    format_performance_table, compute_recruiter_stats, create_detailed_vacature_analysis,
+    AFDELING_LEVELS, build_afdeling_cube, create_afdeling_summary, discover_channel_columns,
+    get_channel_columns, compute_channel_stats, DETAIL_COUNT_COLUMNS, EXPORT_FORMATS, TEXT_EXPORT_FORMATS, XLSX_MAX_ROWS,
+    write_export, VACANCY_KEY_COLUMNS
+)
+
+# Configuratie van de pagina
+st.set_page_config(
+    page_title="ATS Recruitment Dashboard",
+    page_icon="📊",
+    layout="wide",
+    initial_sidebar_state="expanded"
+)
+
+# Grenzen voor de cache met verwerkte datasets (gedeeld over alle sessies)
+INGEST_CACHE_MAX_ENTRIES = 8
+INGEST_CACHE_MAX_BYTES = 512 * 1024 * 1024
+
+# Lokale snapshot store met verwerkte (geanonimiseerde) datasets als Arrow IPC bestanden
+SNAPSHOT_DIR = os.environ.get(
+    'ATS_SNAPSHOT_DIR',
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), '.snapshots')
+)
+SNAPSHOT_MAX_COUNT = 20
+
+# Vacature historie: basis segment plus delta segmenten met alleen nieuwe/gewijzigde vacatures
+HISTORY_DIR = os.path.join(SNAPSHOT_DIR, 'historie')
+HISTORY_KEY_COLUMNS = VACANCY_KEY_COLUMNS
+HISTORY_FALLBACK_KEY_COLUMNS = ['Functie', 'Datum aanmaak', 'Afdeling', 'Locatie']
+HISTORY_COMPACT_AFTER = 10
+HISTORY_SOURCE = 'historie'
+
+# Optioneel JSON lines bestand waar profiling resultaten aan toegevoegd worden
+PROFILE_LOG_PATH = os.environ.get('ATS_PROFILE_LOG')
+
+# Grenzen voor de klaargemaakte downloads (per dataset, periode, tabel en formaat)
+EXPORT_CACHE_MAX_ENTRIES = 8
+EXPORT_CACHE_MAX_BYTES = 256 * 1024 * 1024
+
+# Custom CSS voor betere styling
+st.markdown("""
+<style>
+    .metric-card {
+        background-color: #f0f2f6;
+        padding: 1rem;
+        border-radius: 0.5rem;
+        border-left: 4px solid #1f77b4;
+    }
+    .success-metric {
+        border-left-color: #2ca02c;
+    }
+    .warning-metric {
+        border-left-color: #ff7f0e;
+    }
+    .danger-metric {
+        border-left-color: #d62728;
+    }
+    .vacature-card {
+        background-color: #f8f9fa;
+        padding: 1rem;
+        border-radius: 0.5rem;
+        border: 1px solid #dee2e6;
+        margin-bottom: 0.5rem;
+    }
+</style>
+""", unsafe_allow_html=True)
+
+def report_gdpr_compliance(removed_columns, anonymized_columns):
+    """Meldt welke kolommen verwijderd en geanonimiseerd zijn"""
+    # Log removed columns for transparency
+    if removed_columns:
+        st.warning(f"🔒 GDPR Fallback: Volgende gevoelige kolommen automatisch verwijderd: {', '.join(removed_columns)}")
     
-    # Sidebar voor file upload en filters
-    with st.sidebar:
-        st.header("📁 Data Upload")
-        uploaded_file = st.file_uploader(
-            "Upload je ATS CSV bestand",
-            type=['csv'],
-            help="Upload het CSV bestand geëxporteerd uit je ATS systeem"
+    # Log anonymized columns for transparency
+    if anonymized_columns:
+        st.info(f"🔒 Namen geanonimiseerd (voornaam alleen): {', '.join(anonymized_columns)}")
+
+def process_uploaded_data(data):
+    """Verwerkt een export met voortgangsbalk en meldingen in het dashboard"""
+    progress = st.progress(0.0, text="Export inlezen...")
+    try:
+        df = process_ats_data(
+            data,
+            on_progress=lambda fraction, rows: progress.progress(fraction, text=f"Export inlezen... {rows:,} rijen")
         )
-        
-        if uploaded_file:
-            st.success("✅ Bestand succesvol geladen!")
-            
-            # Data info
-            file_details = {
-                "Bestandsnaam": uploaded_file.name,
-                "Bestandsgrootte": f"{uploaded_file.size / 1024:.1f} KB"
+    except Exception as e:
+        st.error(f"Fout bij het laden van data: {str(e)}")
+        return None
+    finally:
+        progress.empty()
+    
+    report_gdpr_compliance(df.attrs['gdpr']['verwijderd'], df.attrs['gdpr']['geanonimiseerd'])
+    return df
+
+class IngestCache:
+    """LRU cache voor verwerkte datasets, begrensd op aantal entries en geheugen"""
+    
+    def __init__(self, max_entries=INGEST_CACHE_MAX_ENTRIES, max_bytes=INGEST_CACHE_MAX_BYTES):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+    
+    def get(self, key):
+        """Geeft de gecachte dataset terug (of None) en markeert hem als recent gebruikt"""
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key][0]
+            self.misses += 1
+            return None
+    
+    def entry_size(self, df):
+        return int(df.memory_usage(deep=True).sum())
+    
+    def put(self, key, df):
+        """Slaat een verwerkte dataset op en verwijdert de minst recent gebruikte entries"""
+        size = self.entry_size(df)
+        with self._lock:
+            self._entries[key] = (df, size)
+            self._entries.move_to_end(key)
+            # Evict tot we binnen de grenzen vallen, maar houd altijd de nieuwste entry
+            while len(self._entries) > 1 and (
+                len(self._entries) > self.max_entries or self.total_bytes() > self.max_bytes
+            ):
+                self._entries.popitem(last=False)
+                self.evictions += 1
+    
+    def total_bytes(self):
+        return sum(size for _, size in self._entries.values())
+    
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+    
+    def stats(self):
+        """Hit/miss statistieken voor weergave in de sidebar"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'hit_rate': (self.hits / lookups * 100) if lookups > 0 else 0,
+                'entries': len(self._entries),
+                'size_mb': self.total_bytes() / (1024 * 1024)
             }
-            st.json(file_details)
+
+class ExportCache(IngestCache):
+    """LRU cache voor klaargemaakte downloads (bytes), begrensd op aantal entries en totale grootte"""
     
-    if uploaded_file is not None:
-        # Laad data
-        with st.spinner('Data aan het verwerken...'):
-            df_full = load_and_process_data(uploaded_file)
+    def __init__(self, max_entries=EXPORT_CACHE_MAX_ENTRIES, max_bytes=EXPORT_CACHE_MAX_BYTES):
+        super().__init__(max_entries, max_bytes)
+    
+    def entry_size(self, data):
+        return len(data)
+
+@st.cache_resource
+def get_ingest_cache():
+    """Eén gedeelde ingest cache per Streamlit server proces"""
+    return IngestCache()
+
+@st.cache_resource
+def get_export_cache():
+    """Eén gedeelde export cache per Streamlit server proces"""
+    return ExportCache()
+
+def get_snapshot_paths(data_hash):
+    """Pad naar het Arrow bestand en de metadata van een snapshot"""
+    return (
+        os.path.join(SNAPSHOT_DIR, f"{data_hash}.arrow"),
+        os.path.join(SNAPSHOT_DIR, f"{data_hash}.json")
+    )
+
+def write_file_atomically(path, write):
+    """Schrijft via een uniek tijdelijk bestand in dezelfde map en vervangt path daarna in één keer
+
+    Gelijktijdige schrijvers van hetzelfde bestand krijgen elk een eigen tijdelijk bestand;
+    de laatste os.replace wint en een half geschreven bestand is nooit zichtbaar.
+    """
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), prefix=os.path.basename(path) + '.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as tmp_file:
+            write(tmp_file)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+@profiled("Snapshot opslaan")
+def save_snapshot(data_hash, df, source_name):
+    """Schrijft een verwerkte dataset als ongecomprimeerd Arrow IPC bestand weg"""
+    arrow_path, meta_path = get_snapshot_paths(data_hash)
+    os.makedirs(SNAPSHOT_DIR, exist_ok=True)
+    
+    metadata = {
+        'data_hash': data_hash,
+        'bestandsnaam': source_name,
+        'rijen': len(df),
+        'pipeline_version': PIPELINE_VERSION,
+        'aangemaakt': datetime.now().isoformat(timespec='seconds'),
+        'attrs': df.attrs
+    }
+    
+    # Schrijf eerst naar tijdelijke bestanden zodat een half geschreven snapshot nooit zichtbaar is
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    write_file_atomically(arrow_path, lambda file: feather.write_feather(table, file, compression='uncompressed'))
+    meta_bytes = json.dumps(metadata, ensure_ascii=False).encode('utf-8')
+    write_file_atomically(meta_path, lambda file: file.write(meta_bytes))
+    
+    prune_snapshots()
+
+def prune_snapshots():
+    """Houdt de store begrensd: verwijdert snapshots van andere pipeline versies en de oudste van de huidige"""
+    outdated = []
+    for file_name in os.listdir(SNAPSHOT_DIR):
+        if not file_name.endswith('.json'):
+            continue
+        try:
+            with open(os.path.join(SNAPSHOT_DIR, file_name), encoding='utf-8') as meta_file:
+                metadata = json.load(meta_file)
+        except (OSError, ValueError):
+            metadata = {}
+        if metadata.get('pipeline_version') != PIPELINE_VERSION:
+            outdated.append(file_name[:-len('.json')])
+    
+    outdated += [snapshot['data_hash'] for snapshot in list_snapshots()[SNAPSHOT_MAX_COUNT:]]
+    for data_hash in outdated:
+        for path in get_snapshot_paths(data_hash):
+            if os.path.exists(path):
+                os.remove(path)
+
+@profiled("Snapshot laden")
+def load_snapshot(data_hash):
+    """Leest een snapshot via memory mapping in, of None als hij (nog) niet bestaat"""
+    arrow_path, meta_path = get_snapshot_paths(data_hash)
+    if not (os.path.exists(arrow_path) and os.path.exists(meta_path)):
+        return None
+    
+    try:
+        with open(meta_path, encoding='utf-8') as meta_file:
+            metadata = json.load(meta_file)
+        if metadata.get('pipeline_version') != PIPELINE_VERSION:
+            return None
+        df = feather.read_table(arrow_path, memory_map=True).to_pandas()
+    except (OSError, ValueError, pa.ArrowException):
+        return None
+    
+    df.attrs = metadata['attrs']
+    return df
+
+def list_snapshots():
+    """Alle snapshots van de huidige pipeline versie, nieuwste eerst"""
+    if not os.path.isdir(SNAPSHOT_DIR):
+        return []
+    
+    snapshots = []
+    for file_name in os.listdir(SNAPSHOT_DIR):
+        if not file_name.endswith('.json'):
+            continue
+        try:
+            with open(os.path.join(SNAPSHOT_DIR, file_name), encoding='utf-8') as meta_file:
+                metadata = json.load(meta_file)
+        except (OSError, ValueError):
+            continue
+        if metadata.get('pipeline_version') == PIPELINE_VERSION:
+            snapshots.append(metadata)
+    
+    return sorted(snapshots, key=lambda snapshot: snapshot['aangemaakt'], reverse=True)
+
+def get_processed_data(data_hash, data=None, source_name=None):
+    """Haalt een verwerkte dataset uit de ingest cache, de snapshot store of verwerkt de bytes"""
+    cache = get_ingest_cache()
+    
+    df = cache.get(data_hash)
+    if df is not None:
+        return df
+    
+    df = load_snapshot(data_hash)
+    if df is None:
+        if data is None:
+            st.error("Snapshot niet gevonden. Upload het bestand opnieuw.")
+            return None
+        df = process_uploaded_data(data)
+        if df is None:
+            return None
+        df.attrs['data_hash'] = data_hash
+        try:
+            save_snapshot(data_hash, df, source_name)
+        except (OSError, pa.ArrowException) as e:
+            st.warning(f"Snapshot kon niet worden opgeslagen: {str(e)}")
+    
+    cache.put(data_hash, df)
+    return df
+
+def get_composite_keys(df):
+    """Samengestelde sleutel uit vaste velden plus volgnummer voor identieke vacatures"""
+    key_columns = [col for col in HISTORY_FALLBACK_KEY_COLUMNS if col in df.columns]
+    keys = df[key_columns].astype(str).agg('|'.join, axis=1)
+    keys = keys + '#' + keys.groupby(keys).cumcount().astype(str)
+    return keys.to_numpy(dtype=object)
+
+def get_vacancy_keys(df):
+    """Sleutel per vacature: het vacaturenummer, of een samengestelde sleutel als dat ontbreekt"""
+    for col in HISTORY_KEY_COLUMNS:
+        if col in df.columns:
+            numbers = df[col].astype('string').str.strip()
+            missing = (numbers.isna() | (numbers == '')).to_numpy()
+            keys = numbers.to_numpy(dtype=object)
+            # Rijen zonder nummer mogen niet samenvallen op een lege sleutel
+            if missing.any():
+                keys[missing] = get_composite_keys(df[missing])
+            return keys
+    
+    return get_composite_keys(df)
+
+def compute_row_hashes(df):
+    """Hash per rij over alle kolommen, voor het detecteren van gewijzigde vacatures"""
+    return pd.util.hash_pandas_object(df, index=False).to_numpy()
+
+# Herbruikbaar: het samenvoegen houdt de lock vast terwijl het manifest (en zo nodig een migratie) gelezen wordt
+_HISTORY_LOCK = threading.RLock()
+
+def read_history_manifest():
+    """Manifest van de vacature historie (segmenten en samengevoegde exports)"""
+    manifest_path = os.path.join(HISTORY_DIR, 'manifest.json')
+    if os.path.exists(manifest_path):
+        with _HISTORY_LOCK:
+            with open(manifest_path, encoding='utf-8') as manifest_file:
+                manifest = json.load(manifest_file)
+            if manifest.get('pipeline_version') != PIPELINE_VERSION:
+                manifest = migrate_history(manifest)
+            return manifest
+    return {'pipeline_version': PIPELINE_VERSION, 'segments': [], 'exports': []}
+
+def migrate_history(manifest):
+    """Zet een historie van een oudere pipeline versie om naar één basis segment met nieuwe sleutels en rij hashes
+
+    De ruwe exports zijn niet bewaard, dus vacatures behouden de opschoning van hun oude
+    versie tot ze in een nieuwere export terugkomen. Lukt het lezen niet, dan begint de
+    historie opnieuw. Segmenten die niet meer in het manifest staan worden verwijderd.
+    """
+    migrated = {
+        'pipeline_version': PIPELINE_VERSION,
+        'segments': [],
+        'exports': manifest.get('exports', []),
+        'gemigreerd_van': manifest.get('pipeline_version')
+    }
+    try:
+        history = read_history_segments(manifest)
+    except (OSError, ValueError, KeyError, pa.ArrowException):
+        history = None
+    
+    if history is not None:
+        data = history.drop(columns=['_vacature_sleutel', '_rij_hash'])
+        rows = data.assign(_vacature_sleutel=get_vacancy_keys(data), _rij_hash=compute_row_hashes(data))
+        base_name = f"basis_{len(migrated['exports']):05d}_v{PIPELINE_VERSION}.arrow"
+        write_history_segment(rows.drop_duplicates('_vacature_sleutel', keep='last'), base_name)
+        migrated['segments'] = [base_name]
+    elif manifest.get('segments'):
+        migrated['exports'] = []
+        migrated['gereset_van'] = migrated.pop('gemigreerd_van')
+    write_history_manifest(migrated)
+    
+    for file_name in os.listdir(HISTORY_DIR):
+        if file_name.endswith('.arrow') and file_name not in migrated['segments']:
+            os.remove(os.path.join(HISTORY_DIR, file_name))
+    return migrated
+
+def write_history_manifest(manifest):
+    manifest_path = os.path.join(HISTORY_DIR, 'manifest.json')
+    manifest_bytes = json.dumps(manifest, ensure_ascii=False).encode('utf-8')
+    write_file_atomically(manifest_path, lambda file: file.write(manifest_bytes))
+
+def write_history_segment(segment, name):
+    """Schrijft een historie segment (met sleutel- en hashkolom) als Arrow IPC bestand"""
+    path = os.path.join(HISTORY_DIR, name)
+    table = pa.Table.from_pandas(segment, preserve_index=False)
+    write_file_atomically(path, lambda file: feather.write_feather(table, file, compression='uncompressed'))
+
+def read_history_segments(manifest, columns=None):
+    """Combineert alle segmenten; bij dubbele sleutels wint het nieuwste segment"""
+    if not manifest['segments']:
+        return None
+    
+    segments = [
+        feather.read_table(os.path.join(HISTORY_DIR, name), columns=columns, memory_map=True).to_pandas()
+        for name in manifest['segments']
+    ]
+    history = pd.concat(segments, ignore_index=True) if len(segments) > 1 else segments[0]
+    history = history.drop_duplicates('_vacature_sleutel', keep='last').reset_index(drop=True)
+    
+    # Categorieën van verschillende segmenten worden bij concat object; zet ze terug
+    for col in segments[-1].columns:
+        if isinstance(segments[-1][col].dtype, pd.CategoricalDtype) and not isinstance(history[col].dtype, pd.CategoricalDtype):
+            history[col] = history[col].astype('category')
+    
+    return history
+
+def merge_export_into_history(df, data_hash, source_name):
+    """Voegt een verwerkte export toe aan de historie; alleen nieuwe en gewijzigde vacatures worden geschreven"""
+    with _HISTORY_LOCK:
+        os.makedirs(HISTORY_DIR, exist_ok=True)
+        manifest = read_history_manifest()
+        for export in manifest['exports']:
+            if export['data_hash'] == data_hash:
+                return export
         
-        if df_full is not None:
-            # Datumfilter in sidebar
-            with st.sidebar:
-                st.header("📅 Periode Selectie")
-                
-                # Bepaal datum range van data
-                min_date, max_date = get_date_range_from_data(df_full)
-                
-                # Standaard periode opties
-                periods = get_predefined_periods()
-                
-                # Filter periods die binnen data range vallen
-                available_periods = {}
-                for name, period_range in periods.items():
-                    if period_range is None:  # "Aangepast" optie
-                        available_periods[name] = None
-                        st.error(f"🔴 **Beperkte data kwaliteit.** Gemiddelde completeness: {avg_completeness:.1f}%")
-                st.info("Overweeg een meer complete data export voor betere inzichten.")
-            
-            # Download opties
-            with st.expander("📥 Export Opties"):
-                col1, col2 = st.columns(2)
-                
-                with col1:
-                    if st.button("📊 Download Performance Rapport"):
-                        performance_table = create_vacature_performance_table(df)
-                        csv_buffer = io.StringIO()
-                        performance_table.to_csv(csv_buffer, index=False, sep=';')
-                        csv_data = csv_buffer.getvalue()
-                        
-                        st.download_button(
-                            label="💾 Download Performance CSV",
-                            data=csv_data,
-                            file_name=f"vacature_performance_{start_date}_{end_date}.csv",
-                            mime="text/csv"
-                        )
-                
-                with col2:
-                    if st.button("📈 Download Gefilterde Data"):
-                        csv_buffer = io.StringIO()
-                        df.to_csv(csv_buffer, index=False, sep=';')
-                        csv_data = csv_buffer.getvalue()
-                        
-                        st.download_button(
-                            label="💾 Download Gefilterde CSV",
-                            data=csv_data,
-                            file_name=f"ats_data_filtered_{start_date}_{end_date}.csv",
-                            mime="text/csv"
-                        )
+        keys = get_vacancy_keys(df)
+        row_hashes = compute_row_hashes(df)
+        export_rows = df.assign(_vacature_sleutel=keys, _rij_hash=row_hashes)
+        export_rows = export_rows.drop_duplicates('_vacature_sleutel', keep='last')
+        
+        # Voor de vergelijking zijn alleen sleutel en hash nodig, niet de volledige historie
+        history = read_history_segments(manifest, columns=['_vacature_sleutel', '_rij_hash'])
+        if history is None:
+            changed_mask = np.ones(len(export_rows), dtype=bool)
+            is_new = changed_mask
+        else:
+            # Vergelijk per sleutel de rij hash met de laatst bekende versie
+            positions = pd.Index(history['_vacature_sleutel']).get_indexer(export_rows['_vacature_sleutel'])
+            is_new = positions == -1
+            known_hashes = history['_rij_hash'].to_numpy()[np.maximum(positions, 0)]
+            changed_mask = is_new | (known_hashes != export_rows['_rij_hash'].to_numpy())
+        
+        delta = export_rows[changed_mask]
+        if len(delta) > 0:
+            segment_name = f"segment_{len(manifest['exports']):05d}_{data_hash[:12]}.arrow"
+            write_history_segment(delta, segment_name)
+            manifest['segments'].append(segment_name)
+        
+        export_info = {
+            'data_hash': data_hash,
+            'bestandsnaam': source_name,
+            'samengevoegd': datetime.now().isoformat(timespec='seconds'),
+            'nieuw': int(is_new.sum()),
+            'gewijzigd': int((changed_mask & ~is_new).sum()),
+            'ongewijzigd': int((~changed_mask).sum())
+        }
+        manifest['exports'].append(export_info)
+        # De melding over een migratie is getoond zolang er sindsdien niets is samengevoegd
+        manifest.pop('gemigreerd_van', None)
+        manifest.pop('gereset_van', None)
+        
+        # Compacteer naar één basis segment als er te veel delta's zijn
+        if len(manifest['segments']) > HISTORY_COMPACT_AFTER:
+            old_segments = manifest['segments']
+            base_name = f"basis_{len(manifest['exports']):05d}.arrow"
+            write_history_segment(read_history_segments(manifest), base_name)
+            manifest['segments'] = [base_name]
+            write_history_manifest(manifest)
+            for name in old_segments:
+                os.remove(os.path.join(HISTORY_DIR, name))
+        else:
+            write_history_manifest(manifest)
+        
+        return export_info
+
+def load_history_data():
+    """Laadt de samengevoegde vacature historie (gecachet per toestand van de historie)"""
+    manifest = read_history_manifest()
+    if manifest.get('gereset_van'):
+        st.warning(
+            f"De vacature historie van pipeline versie {manifest['gereset_van']} kon niet worden omgezet "
+            f"naar versie {PIPELINE_VERSION} en is opnieuw begonnen. Voeg de eerdere exports opnieuw samen."
+        )
+    if not manifest['segments']:
+        st.info("Nog geen vacature historie opgebouwd.")
+        return None
     
+    if manifest.get('gemigreerd_van'):
+        st.warning(
+            f"De vacature historie is omgezet van pipeline versie {manifest['gemigreerd_van']} naar {PIPELINE_VERSION}. "
+            "Vacatures die niet in een nieuwere export voorkomen houden de opschoning van de oude versie."
+        )
+    
+    history_hash = compute_data_hash('|'.join(manifest['segments']).encode())
+    cache = get_ingest_cache()
+    df = cache.get(history_hash)
+    if df is None:
+        df = read_history_segments(manifest).drop(columns=['_vacature_sleutel', '_rij_hash'])
+        df.attrs = {'data_hash': history_hash, 'channel_columns': discover_channel_columns(df.columns)}
+        cache.put(history_hash, df)
+    
+    with st.expander("📚 Vacature Historie Details", expanded=False):
+        st.write(f"**{len(df)} vacatures uit {len(manifest['exports'])} exports**")
+        for export in manifest['exports'][-5:]:
+            st.write(
+                f"• {export['bestandsnaam']} ({export['samengevoegd'][:10]}): "
+                f"{export['nieuw']} nieuw, {export['gewijzigd']} gewijzigd, {export['ongewijzigd']} ongewijzigd"
+            )
+    
+    return df
+
+def load_and_merge_history(uploaded_file):
+    """Verwerkt een upload en voegt hem samen met de vacature historie"""
+    data = uploaded_file.getvalue()
+    data_hash = compute_data_hash(data)
+    df_export = get_processed_data(data_hash, data, uploaded_file.name)
+    if df_export is None:
+        return None
+    
+    try:
+        export_info = merge_export_into_history(df_export, data_hash, uploaded_file.name)
+    except (OSError, ValueError, pa.ArrowException) as e:
+        st.error(f"Fout bij het bijwerken van de historie: {str(e)}")
+        return None
+    
+    st.success(
+        f"📚 Historie bijgewerkt met {export_info['bestandsnaam']}: "
+        f"{export_info['nieuw']} nieuw, {export_info['gewijzigd']} gewijzigd, {export_info['ongewijzigd']} ongewijzigd"
+    )
+    return load_history_data()
+
+def render_ingest_details(df):
+    """Toont de GDPR en inlees details van de geladen dataset"""
+    ingest_info = df.attrs.get('ingest', {})
+    with st.expander("🔒 GDPR Compliance Details", expanded=False):
+        st.write("**Automatische privacy bescherming toegepast:**")
+        st.write("✅ Contactgegevens verwijderd (telefoon, email)")
+        st.write("✅ Namen geanonimiseerd naar voornaam alleen")
+        st.write("✅ Client-side verwerking - data verlaat computer niet")
+        if ingest_info:
+            st.write("**Inlees details:**")
+            st.write(f"• Encoding: {ingest_info['encoding']} ({ingest_info['encoding_bron']})")
+            st.write(f"• Parse tijd: {ingest_info['parse_seconds'] * 1000:.0f} ms")
+            if 'chunks' in ingest_info:
+                st.write(f"• {ingest_info['chunks']} chunk(s), {ingest_info['workers']} worker(s)")
+            if 'geheugen_bytes' in ingest_info:
+                st.write(f"• Geheugen: {ingest_info['geheugen_bytes'] / 1024 / 1024:.1f} MB "
+                         f"({ingest_info['kolommen_overgeslagen']} ongebruikte kolommen niet ingelezen)")
+
+def load_and_process_data(uploaded_file):
+    """Laadt de ATS data uit cache of snapshot, of verwerkt hem en slaat het resultaat op"""
+    data = uploaded_file.getvalue()
+    df = get_processed_data(compute_data_hash(data), data, uploaded_file.name)
+    if df is not None:
+        render_ingest_details(df)
+    return df
+
+def load_snapshot_data(data_hash):
+    """Laadt een eerder verwerkte dataset uit de snapshot store"""
+    df = get_processed_data(data_hash)
+    if df is not None:
+        render_ingest_details(df)
+    return df
+
+# Kleur per soort sluiting in de dagelijkse activiteit chart
+CLOSE_TYPE_COLORS = {
+    'Vervuld': '#2ca02c',
+    'Niet vervuld': '#d62728',
+    'Ingetrokken': '#c7c7c7'
+}
+
+@st.cache_resource(max_entries=INGEST_CACHE_MAX_ENTRIES)
+def get_daily_event_index(data_hash, _df):
+    """Eén event index per geladen dataset, gedeeld over reruns en sessies"""
+    return DailyEventIndex(_df)
+
+@st.cache_resource(max_entries=INGEST_CACHE_MAX_ENTRIES)
+def get_vacature_cube(data_hash, _df):
+    """Eén vacature kubus per geladen dataset; elke periode en elk filter is daarna een som over cellen"""
+    return VacatureCube(_df)
+
+@profiled("Figuur dagelijkse activiteit")
+def create_daily_activity_chart(df, start_date, end_date, event_index=None):
+    """Maakt dagelijkse activiteit chart"""
+    if event_index is not None:
+        daily_data = event_index.daily_activity(start_date, end_date)
     else:
-        # Landing page
-        st.markdown("""
-        ## 🚀 Welkom bij het ATS Recruitment Dashboard
+        daily_data = compute_daily_activity(df, start_date, end_date)
+    
+    fig = go.Figure()
+    
+    fig.add_trace(go.Scatter(
+        x=daily_data['Datum'],
+        y=daily_data['Nieuwe_Vacatures'],
+        mode='lines+markers',
+        name='Nieuwe Vacatures',
+        line=dict(color='blue'),
+        fill='tozeroy'
+    ))
+    
+    # Gesloten vacatures gestapeld per type sluiting
+    for close_type in CLOSE_TYPES:
+        fig.add_trace(go.Scatter(
+            x=daily_data['Datum'],
+            y=daily_data[close_type],
+            mode='lines',
+            name=f'Gesloten: {close_type}',
+            line=dict(color=CLOSE_TYPE_COLORS[close_type]),
+            stackgroup='gesloten'
+        ))
+    
+    fig.update_layout(
+        title=f'Dagelijkse Vacature Activiteit ({start_date} - {end_date})',
+        xaxis_title='Datum',
+        yaxis_title='Aantal Vacatures',
+        height=400,
+        hovermode='x unified'
+    )
+    
+    return fig
+
+@profiled("Figuur status")
+def create_status_figure(status_counts):
+    """Maakt de status verdeling chart uit voorberekende aantallen per status"""
+    # Kleurenschema
+    colors = {
+        'Extern vervuld': '#2ca02c',
+        'Intern vervuld': '#17becf',
+        'Niet vervuld': '#d62728',
+        'Publicatie in- en extern': '#ff7f0e',
+        'In procedure': '#ffbb78',
+        'Ingetrokken': '#c7c7c7'
+    }
+    
+    fig = px.pie(
+        values=status_counts.values,
+        names=status_counts.index,
+        title="Verdeling Vacaturestatus",
+        color=status_counts.index,
+        color_discrete_map=colors
+    )
+    
+    fig.update_traces(textposition='inside', textinfo='percent+label')
+    fig.update_layout(height=400)
+    
+    return fig
+
+def create_status_chart(df):
+    """Maakt status verdeling chart"""
+    return create_status_figure(count_values(df['Status vacature']))
+
+# Recruiters per pagina in de recruitment performance chart
+RECRUITER_CHART_PAGE_SIZE = 25
+RECRUITER_CHART_PAGE_SIZES = [10, 25, 50]
+# Vacatures per pagina in de detail tabel
+DETAIL_PAGE_SIZE = 50
+DETAIL_PAGE_SIZES = [25, 50, 100, 250]
+
+@profiled("Figuur recruiters")
+def create_recruitment_performance_figure(recruiter_stats, page=0, page_size=RECRUITER_CHART_PAGE_SIZE):
+    """Maakt de recruitment performance figuur voor één pagina van de (op aantal vacatures gesorteerde) recruiter statistieken"""
+    page_stats = recruiter_stats.iloc[page * page_size:(page + 1) * page_size]
+    # Horizontale bars lopen van onder naar boven: omdraaien zodat de grootste recruiter bovenaan staat
+    page_stats = page_stats.iloc[::-1]
+    labels = page_stats['Eigenaar'].astype(str) + ' (' + page_stats['Afdeling'].astype(object).fillna('Onbekend').astype(str) + ')'
+    
+    fig = make_subplots(
+        rows=1, cols=2,
+        subplot_titles=('Aantal Vacatures per Recruiter', 'Fill Rate per Recruiter'),
+        specs=[[{"secondary_y": False}, {"secondary_y": False}]]
+    )
+    
+    # Aantal vacatures
+    fig.add_trace(
+        go.Bar(
+            y=labels,
+            x=page_stats['Totaal_Vacatures'],
+            name='Totaal Vacatures',
+            orientation='h',
+            marker_color='lightblue',
+            text=page_stats['Totaal_Vacatures'],
+            textposition='auto'
+        ),
+        row=1, col=1
+    )
+    
+    # Fill rate
+    fig.add_trace(
+        go.Bar(
+            y=labels,
+            x=page_stats['Fill_Rate'],
+            name='Fill Rate (%)',
+            orientation='h',
+            marker_color='lightgreen',
+            text=[f"{x:.1f}%" for x in page_stats['Fill_Rate']],
+            textposition='auto'
+        ),
+        row=1, col=2
+    )
+    
+    # Hoogte groeit met de pagina, niet met het totaal aantal recruiters
+    fig.update_layout(height=max(400, len(page_stats) * 35), showlegend=False)
+    fig.update_xaxes(title_text="Aantal Vacatures", row=1, col=1)
+    fig.update_xaxes(title_text="Fill Rate (%)", row=1, col=2)
+    
+    return fig
+
+def create_recruitment_performance_chart(df):
+    """Maakt recruitment performance chart (inclusief afdeling)"""
+    recruiter_stats = compute_recruiter_stats(df)
+    return create_recruitment_performance_figure(recruiter_stats), recruiter_stats
+
+@profiled("Figuren kanalen")
+def create_channel_figures(channel_df):
+    """Maakt de kanaal charts uit voorberekende kanaal statistieken"""
+    if len(channel_df) == 0:
+        return None, None
+    
+    # Chart voor totaal sollicitanten
+    fig1 = px.bar(
+        channel_df,
+        x='Kanaal',
+        y='Totaal_Sollicitanten',
+        title='Aantal Sollicitanten per Kanaal',
+        color='Totaal_Sollicitanten',
+        color_continuous_scale='Blues',
+        text='Totaal_Sollicitanten'
+    )
+    fig1.update_traces(textposition='outside')
+    fig1.update_xaxes(tickangle=45)
+    
+    # Chart voor conversie rates
+    fig2 = px.bar(
+        channel_df,
+        x='Kanaal',
+        y='Conversie_Rate',
+        title='Conversieratio per Kanaal (%)',
+        color='Conversie_Rate',
+        color_continuous_scale='Greens',
+        text=[f"{x:.1f}%" for x in channel_df['Conversie_Rate']]
+    )
+    fig2.update_traces(textposition='outside')
+    fig2.update_xaxes(tickangle=45)
+    
+    return fig1, fig2
+
+def create_channel_analysis(df):
+    """Analyseert wervingskanalen"""
+    channel_df = compute_channel_stats(df)
+    fig1, fig2 = create_channel_figures(channel_df)
+    return fig1, fig2, channel_df
+
+@profiled("Figuren afdelingen")
+def create_afdeling_charts(afdeling_stats):
+    """Maakt de vacature- en fill rate charts per afdeling"""
+    # Vacatures per afdeling
+    fig_afd1 = px.bar(
+        afdeling_stats,
+        x='Afdeling',
+        y='Totaal_Vacatures',
+        title='Aantal Vacatures per Afdeling',
+        color='Fill_Rate',
+        color_continuous_scale='RdYlGn',
+        text='Totaal_Vacatures'
+    )
+    fig_afd1.update_traces(textposition='outside')
+    fig_afd1.update_xaxes(tickangle=45)
+    
+    # Fill rate per afdeling
+    fig_afd2 = px.bar(
+        afdeling_stats,
+        x='Afdeling',
+        y='Fill_Rate',
+        title='Fill Rate per Afdeling (%)',
+        color='Fill_Rate',
+        color_continuous_scale='RdYlGn',
+        text=[f"{x:.1f}%" for x in afdeling_stats['Fill_Rate']]
+    )
+    fig_afd2.update_traces(textposition='outside')
+    fig_afd2.update_xaxes(tickangle=45)
+    
+    return fig_afd1, fig_afd2
+
+class AnalysisContext:
+    """Aggregaten en figuren van één gefilterde dataset, elk hooguit één keer en pas bij gebruik berekend"""
+    
+    def __init__(self, df, cube=None, start_date=None, end_date=None):
+        # Met een vacature kubus komen de overzichten uit opgetelde cellen in plaats van uit de rijen van df
+        self.df = df
+        self.cube = cube
+        self.start_date = start_date
+        self.end_date = end_date
+        self._recruiter_charts = {}
+        self._afdeling_breakdowns = {}
+        self._detail_orders = {}
+    
+    def prefetch(self, attributes):
+        """Berekent de opgegeven attributen alvast, zodat een latere render ze direct heeft"""
+        for attribute in attributes:
+            getattr(self, attribute)
+    
+    @cached_property
+    def status_counts(self):
+        if self.cube is not None:
+            return self.cube.status_counts(self.start_date, self.end_date)
+        return count_values(self.df['Status vacature'])
+    
+    @cached_property
+    def status_table(self):
+        with profile_stage("Status tabel", len(self.df)):
+            status_table = self.status_counts.reset_index()
+            status_table.columns = ['Status', 'Aantal']
+            status_table['Percentage'] = (status_table['Aantal'] / len(self.df) * 100).round(1)
+        return status_table
+    
+    @cached_property
+    def status_chart(self):
+        return create_status_figure(self.status_counts)
+    
+    @cached_property
+    def recruiter_stats(self):
+        if self.cube is not None:
+            return self.cube.recruiter_stats(self.start_date, self.end_date)
+        return compute_recruiter_stats(self.df)
+    
+    @cached_property
+    def recruiter_chart(self):
+        return self.get_recruiter_chart(0, RECRUITER_CHART_PAGE_SIZE)
+    
+    def get_recruiter_chart(self, page, page_size):
+        """Recruiter figuur per (pagina, paginagrootte); bladeren bouwt elke pagina maar één keer"""
+        key = (page, page_size)
+        if key not in self._recruiter_charts:
+            self._recruiter_charts[key] = create_recruitment_performance_figure(self.recruiter_stats, page, page_size)
+        return self._recruiter_charts[key]
+    
+    @cached_property
+    def channel_stats(self):
+        if self.cube is not None:
+            return self.cube.channel_stats(self.start_date, self.end_date)
+        return compute_channel_stats(self.df)
+    
+    @cached_property
+    def channel_charts(self):
+        return create_channel_figures(self.channel_stats)
+    
+    @cached_property
+    def detailed_analysis(self):
+        return create_detailed_vacature_analysis(self.df)
+    
+    def get_detail_order(self, sort_by):
+        """Rijposities van de detail analyse aflopend gesorteerd op sort_by, per kolom één keer berekend"""
+        if sort_by not in self._detail_orders:
+            sorted_index = self.detailed_analysis[sort_by].sort_values(ascending=False, kind='stable').index
+            self._detail_orders[sort_by] = sorted_index.to_numpy()
+        return self._detail_orders[sort_by]
+    
+    def get_detail_totals(self, status_filter, afdeling_filter, min_kandidaten, detailed_analysis):
+        """Totalen voor de detailfilters; een drempel op kandidaten per vacature volgt niet uit cellen, dan tellen de gefilterde rijen"""
+        if self.cube is None or min_kandidaten > 0:
+            return detailed_analysis[list(DETAIL_COUNT_COLUMNS)].sum()
+        return self.cube.detail_totals(self.start_date, self.end_date, status_filter, afdeling_filter)
+    
+    def get_summary_stats(self, attribute):
+        """Overzicht voor de analytics samenvatting: uit de kubus, of None zolang de sectie het niet berekend heeft"""
+        if self.cube is not None or attribute in self.__dict__:
+            return getattr(self, attribute)
+        return None
+    
+    @cached_property
+    def period_detail_totals(self):
+        """Kandidaat totalen over de hele periode, zonder de detail analyse per vacature op te bouwen"""
+        if self.cube is not None:
+            return self.cube.detail_totals(self.start_date, self.end_date)
+        return pd.Series({name: int(self.df[col].sum()) if col in self.df.columns else 0
+                          for name, col in DETAIL_COUNT_COLUMNS.items()})
+    
+    @cached_property
+    def doorlooptijden(self):
+        """Doorlooptijd in dagen van de vacatures met een aanmaak- en sluitdatum"""
+        return (self.df['Sluitdatum'] - self.df['Datum aanmaak']).dt.days.dropna()
+    
+    @cached_property
+    def performance_table(self):
+        return create_vacature_performance_table(self.df)
+    
+    @cached_property
+    def afdeling_cube(self):
+        if self.cube is not None:
+            return self.cube.afdeling_cube(self.start_date, self.end_date)
+        return build_afdeling_cube(self.df)
+    
+    @cached_property
+    def afdeling_stats(self):
+        return create_afdeling_summary(self.df, cube=self.afdeling_cube)
+    
+    def get_afdeling_breakdown(self, depth):
+        """Afdeling samenvatting uitgesplitst tot depth niveaus, opgeteld uit dezelfde kubus"""
+        if depth == 1:
+            return self.afdeling_stats
+        if depth not in self._afdeling_breakdowns:
+            self._afdeling_breakdowns[depth] = create_afdeling_summary(self.df, depth, cube=self.afdeling_cube)
+        return self._afdeling_breakdowns[depth]
+    
+    @cached_property
+    def afdeling_charts(self):
+        return create_afdeling_charts(self.afdeling_stats)
+
+def get_performance_export(analysis, export_format):
+    """Performance tabel voor een download: leesbaar opgemaakt voor CSV, getypeerd voor Parquet en Excel"""
+    if export_format in TEXT_EXPORT_FORMATS:
+        return format_performance_table(analysis.performance_table)
+    return analysis.performance_table
+
+def get_export_file(data_hash, start_date, end_date, table_name, export_format, build_table):
+    """Eén download per (dataset, periode, tabel, formaat), direct als bytes geschreven en daarna hergebruikt"""
+    cache = get_export_cache()
+    key = (data_hash, start_date, end_date, table_name, export_format)
+    data = cache.get(key)
+    if data is None:
+        buffer = io.BytesIO()
+        write_export(build_table(), export_format, buffer, sheet_name=table_name)
+        data = buffer.getvalue()
+        cache.put(key, data)
+    return data
+
+@st.cache_resource(max_entries=16)
+def get_analysis_context(data_hash, start_date, end_date, _df, _cube=None):
+    """Eén analysis context per (dataset, periode), hergebruikt over reruns"""
+    return AnalysisContext(_df, _cube, start_date, end_date)
+
+def select_page(total, key, label, page_sizes, default_size):
+    """Paginagrootte en paginanummer voor een lijst van total rijen; geeft (pagina, paginagrootte) terug
+
+    Alleen de gekozen pagina hoeft naar de browser. Een andere paginagrootte of een
+    ander totaal (bijvoorbeeld door een filter) begint weer op pagina 1.
+    """
+    if total <= page_sizes[0]:
+        return 0, default_size
+    
+    col1, col2 = st.columns([1, 1])
+    with col1:
+        page_size = st.selectbox(
+            f"{label} per pagina",
+            page_sizes,
+            index=page_sizes.index(default_size),
+            key=f"{key}_page_size"
+        )
+    page_count = -(-total // page_size)
+    with col2:
+        page = st.number_input("Pagina", min_value=1, max_value=page_count, value=1, key=f"{key}_page_{page_size}_{total}") - 1
+    first = page * page_size
+    st.caption(f"{label} {first + 1}–{min(first + page_size, total)} van {total}")
+    return page, page_size
+
+def render_status_section(df, analysis):
+    """Tab: vacaturestatus verdeling"""
+    st.header("Vacaturestatus Verdeling")
+    col1, col2 = st.columns([1, 1])
+    
+    with col1:
+        st.plotly_chart(analysis.status_chart, use_container_width=True)
+    
+    with col2:
+        # Status tabel met aantallen
+        st.subheader("Status Details")
+        st.dataframe(analysis.status_table, use_container_width=True)
+
+def render_recruitment_section(df, analysis):
+    """Tab: recruitment performance per recruiter"""
+    st.header("Recruitment Performance (inclusief Afdeling)")
+    recruiter_stats = analysis.recruiter_stats
+    
+    # Chart en tabel tonen dezelfde pagina recruiters, gesorteerd op aantal vacatures
+    page, page_size = select_page(
+        len(recruiter_stats), "recruiter", "Recruiters", RECRUITER_CHART_PAGE_SIZES, RECRUITER_CHART_PAGE_SIZE
+    )
+    st.plotly_chart(analysis.get_recruiter_chart(page, page_size), use_container_width=True)
+    
+    st.subheader("Recruitment Team Statistieken")
+    if len(recruiter_stats) > 0:
+        page_stats = recruiter_stats.iloc[page * page_size:(page + 1) * page_size]
+        recruiter_display = page_stats[['Eigenaar', 'Afdeling', 'Totaal_Vacatures', 'Aantal reacties', 'Vervulde_Vacatures', 'Fill_Rate', 'Gem_Reacties']].copy()
+        recruiter_display.columns = ['Recruiter', 'Afdeling', 'Totaal Vacatures', 'Totaal Reacties', 'Vervulde Vacatures', 'Fill Rate (%)', 'Gem. Reacties']
+        st.dataframe(recruiter_display, use_container_width=True, hide_index=True)
+    else:
+        st.info("Geen recruiter data beschikbaar voor de geselecteerde periode.")
+
+def render_channel_section(df, analysis):
+    """Tab: wervingskanaal analyse"""
+    st.header("Wervingskanaal Analyse")
+    channel_df = analysis.channel_stats
+    channel_fig1, channel_fig2 = analysis.channel_charts
+    
+    if channel_fig1 is not None:
+        col1, col2 = st.columns(2)
+        with col1:
+            st.plotly_chart(channel_fig1, use_container_width=True)
+        with col2:
+            st.plotly_chart(channel_fig2, use_container_width=True)
         
-        Deze applicatie helpt je om waardevolle inzichten te krijgen uit je ATS (Applicant Tracking System) export data.
+        st.subheader("Kanaal Performance Tabel")
+        channel_display = channel_df.copy()
+        channel_display['Conversie_Rate'] = channel_display['Conversie_Rate'].round(1)
+        channel_display.columns = ['Kanaal', 'Totaal Sollicitanten', 'Aangenomen', 'Afgewezen', 'Conversie Rate (%)']
+        st.dataframe(channel_display, use_container_width=True)
+    else:
+        st.info("Geen kanaaldata beschikbaar in de huidige export.")
+
+def render_vacature_details_section(df, analysis):
+    """Tab: gedetailleerde vacature performance met filters"""
+    st.header("Gedetailleerde Vacature Performance")
+    
+    # Filter opties
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        status_filter = st.multiselect(
+            "Filter op Status",
+            options=df['Status vacature'].unique(),
+            default=df['Status vacature'].unique()
+        )
+    
+    with col2:
+        if 'Afdeling' in df.columns:
+            afdeling_filter = st.multiselect(
+                "Filter op Afdeling",
+                options=df['Afdeling'].dropna().unique(),
+                default=df['Afdeling'].dropna().unique()
+            )
+        else:
+            afdeling_filter = []
+    
+    with col3:
+        min_kandidaten = st.number_input(
+            "Minimaal aantal kandidaten",
+            min_value=0,
+            value=0,
+            step=1
+        )
+    
+    # Filter data; lege reacties tellen als 0 kandidaten, net als in de tabel
+    filter_mask = df['Status vacature'].isin(status_filter)
+    if afdeling_filter and 'Afdeling' in df.columns:
+        filter_mask &= df['Afdeling'].isin(afdeling_filter)
+    filter_mask = filter_mask.to_numpy() & (analysis.detailed_analysis['Totaal_Kandidaten'] >= min_kandidaten).to_numpy()
+    
+    st.subheader(f"Vacature Performance Analyse ({int(filter_mask.sum())} vacatures)")
+    
+    # Sorteer opties
+    sort_options = ['Totaal_Kandidaten', 'Gesprekken', 'Aangenomen', 'Hire_Rate', 'Aanmaakdatum']
+    sort_by = st.selectbox(
+        "Sorteer op",
+        options=sort_options,
+        index=0
+    )
+    
+    # Voorberekende sorteervolgorde, gefilterd op positie (rijen lopen gelijk met df)
+    order = analysis.get_detail_order(sort_by)
+    detailed_analysis = analysis.detailed_analysis.iloc[order[filter_mask[order]]]
+    
+    # Alleen de zichtbare pagina gaat naar de browser
+    page, page_size = select_page(len(detailed_analysis), "detail", "Vacatures", DETAIL_PAGE_SIZES, DETAIL_PAGE_SIZE)
+    st.dataframe(
+        detailed_analysis.iloc[page * page_size:(page + 1) * page_size],
+        use_container_width=True,
+        hide_index=True,
+        column_config={
+            "Vacature": st.column_config.TextColumn("Vacature", width="large"),
+            "Totaal_Kandidaten": st.column_config.NumberColumn("👥 Kandidaten", format="%d"),
+            "Gesprekken": st.column_config.NumberColumn("💬 Gesprekken", format="%d"),
+            "Afgewezen_na_Brief": st.column_config.NumberColumn("❌ Afgewezen (Brief)", format="%d"),
+            "Afgewezen_na_Gesprek": st.column_config.NumberColumn("❌ Afgewezen (Gesprek)", format="%d"),
+            "Aangenomen": st.column_config.NumberColumn("✅ Aangenomen", format="%d"),
+            "Hire_Rate": st.column_config.NumberColumn("📈 Hire Rate", format="%.1f%%"),
+            "Gesprek_Rate": st.column_config.NumberColumn("💬 Gesprek Rate", format="%.1f%%"),
+            "Aanmaakdatum": st.column_config.DateColumn("Aanmaakdatum", format="DD-MM-YYYY"),
+        }
+    )
+    
+    # Performance insights uitgebreid
+    if len(detailed_analysis) > 0:
+        st.subheader("📊 Performance Insights")
         
-        ### 📋 Nieuwe Features:
+        # Bereken totalen
+        totals = analysis.get_detail_totals(status_filter, afdeling_filter, min_kandidaten, detailed_analysis)
+        totaal_kandidaten = totals['Totaal_Kandidaten']
+        totaal_gesprekken = totals['Gesprekken']
+        totaal_aangenomen = totals['Aangenomen']
+        totaal_afgewezen_brief = totals['Afgewezen_na_Brief']
+        totaal_afgewezen_gesprek = totals['Afgewezen_na_Gesprek']
         
-        🗓️ **Slimme Periode Selectie** - Kies uit standaard periodes of maak aangepaste selecties  
-        📈 **Dagelijkse Activiteit** - Zie nieuwe en gesloten vacatures per dag  
-        📋 **Vacature Details** - Gedetailleerde performance per individuele vacature  
-        📊 **Uitgebreide Analytics** - Volledig overzicht van beschikbare inzichten  
-        🧹 **Automatische Data Cleaning** - HTML entities worden automatisch geconverteerd  
+        col1, col2, col3, col4 = st.columns(4)
         
-        ### 📊 Dashboard Functionaliteiten:
+        with col1:
+            st.metric(
+                "Totaal Kandidaten",
+                f"{totaal_kandidaten:,}",
+                help="Som van alle kandidaten voor gefilterde vacatures"
+            )
+            
+            overall_hire_rate = (totaal_aangenomen / totaal_kandidaten * 100) if totaal_kandidaten > 0 else 0
+            st.metric(
+                "Overall Hire Rate",
+                f"{overall_hire_rate:.1f}%"
+            )
         
-        ✅ **Status Overzicht** - Pie charts en KPIs voor vacaturestatus  
-        ✅ **Recruitment Performance** - Vergelijk prestaties tussen recruiters  
-        ✅ **Kanaal Analyse** - Ontdek welke wervingskanalen het beste werken  
-        ✅ **Vacature Breakdown** - Performance metrics per individuele vacature  
-        ✅ **Data Completeness Rapport** - Zie de kwaliteit van je data  
+        with col2:
+            st.metric(
+                "Totaal Gesprekken",
+                f"{totaal_gesprekken:,}"
+            )
+            
+            gesprek_to_hire = (totaal_aangenomen / totaal_gesprekken * 100) if totaal_gesprekken > 0 else 0
+            st.metric(
+                "Gesprek → Hire Rate",
+                f"{gesprek_to_hire:.1f}%"
+            )
         
-        ### 🗓️ Periode Opties:
-        - **Laatste 7, 14, 30, 90 dagen** - Recente activiteit
-        - **Huidige/vorige maand** - Maandelijkse analyses  
-        - **Huidige kwartaal** - Kwartaal rapportage
-        - **Kalenderjaar** - Jaarlijkse trends
-        - **Aangepast** - Kies je eigen periode
+        with col3:
+            st.metric(
+                "Afgewezen na Brief",
+                f"{totaal_afgewezen_brief:,}",
+                delta=f"{(totaal_afgewezen_brief/totaal_kandidaten*100):.1f}% van totaal" if totaal_kandidaten > 0 else None
+            )
+            
+            st.metric(
+                "Afgewezen na Gesprek",
+                f"{totaal_afgewezen_gesprek:,}",
+                delta=f"{(totaal_afgewezen_gesprek/totaal_gesprekken*100):.1f}% van gesprekken" if totaal_gesprekken > 0 else None
+            )
         
-        ### 📁 Hoe te gebruiken:
-        1. **Upload** je CSV export vanuit je ATS systeem via de sidebar
-        2. **Selecteer** een standaard periode of kies "Aangepast" voor specifieke datums
-        3. **Navigeer** door de verschillende tabs voor verschillende analyses
-        4. **Bekijk** de Uitgebreide Analytics voor een volledig overzicht
-        5. **Export** rapporten voor verdere analyse
+        with col4:
+            st.metric(
+                "Totaal Aangenomen",
+                f"{totaal_aangenomen:,}",
+                delta=f"{overall_hire_rate:.1f}% van kandidaten"
+            )
+            
+            # Gemiddelde kandidaten per hire
+            kandidaten_per_hire = (totaal_kandidaten / totaal_aangenomen) if totaal_aangenomen > 0 else 0
+            st.metric(
+                "Kandidaten per Hire",
+                f"{kandidaten_per_hire:.1f}",
+                help="Hoeveel kandidaten gemiddeld nodig voor 1 hire"
+            )
         
-        ### 🔧 Ondersteunde formaten:
-        - CSV bestanden met puntkomma (;) als delimiter
-        - Multiple encodings (UTF-8, CP1252, etc.)
-        - Datum formaten: DD-MM-YYYY
-        - **Automatische HTML entity cleaning** (bijv. Co&ouml;rdinator → Coördinator)
+        # Top performers
+        st.subheader("🏆 Top Performers")
+        col1, col2, col3 = st.columns(3)
         
-        ### 🔒 GDPR Compliance:
-        - **Automatische anonimisering** - contactgegevens worden verwijderd
-        - **Voornaam-only** - "Ilja Noltee" wordt "Ilja"  
-        - **Client-side processing** - persoonlijke data verlaat je computer niet
-        - **Privacy by design** - alleen relevante data voor analyses
+        with col1:
+            # Beste hire rate (alleen vacatures met kandidaten)
+            vacatures_met_kandidaten = detailed_analysis[detailed_analysis['Totaal_Kandidaten'] > 0]
+            if len(vacatures_met_kandidaten) > 0:
+                beste_hire = vacatures_met_kandidaten.loc[vacatures_met_kandidaten['Hire_Rate'].idxmax()]
+                st.success(f"**Beste Hire Rate:** {beste_hire['Vacature'][:25]}... ({beste_hire['Hire_Rate']:.1f}%)")
         
-        ### 💡 Pro Tips:
-        - Begin met **"Laatste 30 dagen"** voor een snel overzicht
-        - Gebruik **"Huidige kwartaal"** voor management rapportage
-        - Check de **Uitgebreide Analytics** voor data completeness
-        - **Export** performance rapporten voor presentaties
-        - Vergelijk verschillende periodes voor trend analyse
+        with col2:
+            # Meeste gesprekken
+            if detailed_analysis['Gesprekken'].max() > 0:
+                meeste_gesprekken = detailed_analysis.loc[detailed_analysis['Gesprekken'].idxmax()]
+                st.info(f"**Meeste Gesprekken:** {meeste_gesprekken['Vacature'][:25]}... ({meeste_gesprekken['Gesprekken']} gesprekken)")
         
-        ### 📊 Beschikbare Inzichten:
+        with col3:
+            # Meeste hires
+            if detailed_analysis['Aangenomen'].max() > 0:
+                meeste_hires = detailed_analysis.loc[detailed_analysis['Aangenomen'].idxmax()]
+                st.success(f"**Meeste Hires:** {meeste_hires['Vacature'][:25]}... ({meeste_hires['Aangenomen']} hires)")
+
+def render_afdeling_section(df, analysis):
+    """Tab: performance per afdeling"""
+    st.header("Afdeling Analyse")
+    
+    # Afdeling samenvatting
+    afdeling_stats = analysis.afdeling_stats
+    
+    if len(afdeling_stats) > 0:
+        st.subheader("Performance per Afdeling")
         
-        **✅ Volledig Ondersteund:**
-        - Vacaturestatus verdelingen en trends
-        - Fill rates per recruiter en overall  
-        - Kanaal performance en conversie ratio's
-        - Dagelijkse activiteit tracking
-        - Individuele vacature performance
-        - Doorlooptijd analyses (waar data beschikbaar)
+        # Visualisatie
+        fig_afd1, fig_afd2 = analysis.afdeling_charts
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            st.plotly_chart(fig_afd1, use_container_width=True)
+        
+        with col2:
+            st.plotly_chart(fig_afd2, use_container_width=True)
+        
+        # Afdeling tabel, optioneel uitgesplitst naar eigenaar afdeling en locatie
+        st.subheader("Afdeling Statistieken")
+        levels = [level for level in AFDELING_LEVELS if level in analysis.afdeling_cube.columns]
+        depth = 1
+        if len(levels) > 1:
+            depth = st.selectbox(
+                "Uitsplitsen naar",
+                options=range(1, len(levels) + 1),
+                format_func=lambda d: " → ".join(levels[:d]),
+                key="afdeling_depth"
+            )
+        afdeling_display = analysis.get_afdeling_breakdown(depth).rename(columns={
+            'Totaal_Vacatures': 'Totaal Vacatures',
+            'Aantal reacties': 'Totaal Reacties',
+            'Aantal_Recruiters': 'Aantal Recruiters',
+            'Vervulde_Vacatures': 'Vervulde Vacatures',
+            'Fill_Rate': 'Fill Rate (%)',
+            'Gem_Reacties_per_Vacature': 'Gem. Reacties per Vacature'
+        })
+        st.dataframe(afdeling_display, use_container_width=True, hide_index=True)
+        
+        # Afdeling insights
+        st.subheader("🏢 Afdeling Insights")
+        
+        col1, col2, col3 = st.columns(3)
+        
+        with col1:
+            # Grootste afdeling
+            grootste_afdeling = afdeling_stats.loc[afdeling_stats['Totaal_Vacatures'].idxmax()]
+            st.info(f"**Meeste Vacatures:** {grootste_afdeling['Afdeling']} ({grootste_afdeling['Totaal_Vacatures']} vacatures)")
+        
+        with col2:
+            # Beste fill rate
+            beste_fill_rate = afdeling_stats.loc[afdeling_stats['Fill_Rate'].idxmax()]
+            st.success(f"**Beste Fill Rate:** {beste_fill_rate['Afdeling']} ({beste_fill_rate['Fill_Rate']:.1f}%)")
+        
+        with col3:
+            # Meeste recruiters
+            meeste_recruiters = afdeling_stats.loc[afdeling_stats['Aantal_Recruiters'].idxmax()]
+            st.info(f"**Meeste Recruiters:** {meeste_recruiters['Afdeling']} ({meeste_recruiters['Aantal_Recruiters']} recruiters)")
+    
+    else:
+        st.info("Geen afdeling data beschikbaar in de huidige dataset.")
+
+# Dashboard secties: render functie plus de AnalysisContext attributen die hij gebruikt
+DASHBOARD_SECTIONS = {
+    "📊 Status Overzicht": (render_status_section, ['status_chart', 'status_table']),
+    "👥 Recruitment Performance": (render_recruitment_section, ['recruiter_stats', 'recruiter_chart']),
+    "🌐 Kanaal Analyse": (render_channel_section, ['channel_stats', 'channel_charts']),
+    "📋 Vacature Details": (render_vacature_details_section, ['detailed_analysis']),
+    "🏢 Afdeling Analyse": (render_afdeling_section, ['afdeling_cube', 'afdeling_stats', 'afdeling_charts'])
+}
+
+@st.cache_resource
+def get_prefetch_executor():
+    """Kleine thread pool voor het vooraf berekenen van buursecties"""
+    return ThreadPoolExecutor(max_workers=2, thread_name_prefix="section-prefetch")
+
+def prefetch_sections(analysis, section_names):
+    """Berekent de aggregaten en figuren van de opgegeven secties op de achtergrond"""
+    attributes = [attr for name in section_names for attr in DASHBOARD_SECTIONS[name][1]]
+    submit_with_context(get_prefetch_executor(), analysis.prefetch, attributes)
+
+def render_profile_panel(profiler):
+    """Inklapbaar Performance paneel met de metingen van deze run"""
+    summary = profiler.summary()
+    json_lines = profiler.to_json_lines()
+    if PROFILE_LOG_PATH and json_lines:
+        with open(PROFILE_LOG_PATH, 'a', encoding='utf-8') as log_file:
+            log_file.write(json_lines)
+    
+    with st.expander("⏱️ Performance", expanded=False):
+        if summary.empty:
+            st.info("Geen metingen in deze run (alles kwam uit de cache).")
+            return
+        st.caption(
+            "Gemeten stappen van deze run · piekgeheugen via tracemalloc, inclusief geneste stappen. "
+            "De piek is proces-breed: gelijktijdige sessies en ingest threads tellen mee, "
+            "dus het is geen exacte waarde per stap of per sessie."
+        )
+        st.dataframe(summary, use_container_width=True, hide_index=True)
+        st.download_button(
+            label="📥 Download metingen (JSON lines)",
+            data=json_lines,
+            file_name=f"ats_profiel_{datetime.now().strftime('%Y%m%d_%H%M%S')}.jsonl",
+            mime="application/x-ndjson"
+        )
+
+def main():
+    # Profiling is opt-in via de toggle in de sidebar en geldt voor de hele run
+    profiler = StageProfiler() if st.session_state.get('profiling') else None
+    token = ACTIVE_PROFILER.set(profiler)
+    try:
+        render_dashboard()
+    finally:
+        ACTIVE_PROFILER.reset(token)
+        if profiler is not None:
+            profiler.close()
+    if profiler is not None:
+        render_profile_panel(profiler)
+
+def render_dashboard():
+    """Bouwt het dashboard op: upload, periode selectie, KPI's en analyses"""
+    st.title("📊 ATS Recruitment Dashboard")
+    st.markdown("Upload je ATS export CSV om uitgebreide recruitment analytics te bekijken")
+    
+    # Sidebar voor file upload en filters
+    with st.sidebar:
+        st.header("📁 Data Upload")
+        uploaded_file = st.file_uploader(
+            "Upload je ATS CSV bestand",
+            type=['csv'],
+            help="Upload het CSV bestand geëxporteerd uit je ATS systeem"
+        )
         
-        **⚠️ Beperkt Ondersteund:**
-        - Tijdlijn trends (afhankelijk van periode lengte)
-        - Procesfase analyses (afhankelijk van status data)
+        if uploaded_file:
+            st.success("✅ Bestand succesvol geladen!")
+            
+            # Data info
+            file_details = {
+                "Bestandsnaam": uploaded_file.name,
+                "Bestandsgrootte": f"{uploaded_file.size / 1024:.1f} KB"
+            }
+            st.json(file_details)
+            
+            merge_history = st.checkbox(
+                "Samenvoegen met vacature historie",
+                help="Voegt alleen nieuwe en gewijzigde vacatures toe aan de opgebouwde historie en analyseert de volledige historie"
+            )
         
-        **❌ Niet Ondersteund:**
-        - Kandidaat journey tracking (vereist kandidaat-level data)
-        - Funnel analyses (vereist web analytics)
-        - Kosten analyses (niet in standaard export)
+        # Eerder verwerkte exports of de historie direct openen zonder opnieuw te uploaden
+        snapshot_hash = None
+        snapshots = list_snapshots()
+        history_manifest = read_history_manifest()
+        if uploaded_file is None and (snapshots or history_manifest['segments']):
+            st.header("🗂️ Snapshots")
+            snapshot_labels = {
+                snapshot['data_hash']: f"{snapshot['bestandsnaam']} · {snapshot['rijen']} rijen · {snapshot['aangemaakt'][:16].replace('T', ' ')}"
+                for snapshot in snapshots
+            }
+            if history_manifest['segments']:
+                snapshot_labels = {
+                    HISTORY_SOURCE: f"📚 Vacature historie ({len(history_manifest['exports'])} exports)",
+                    **snapshot_labels
+                }
+            snapshot_hash = st.selectbox(
+                "Open eerder verwerkte export",
+                options=[None] + list(snapshot_labels),
+                format_func=lambda data_hash: "—" if data_hash is None else snapshot_labels[data_hash]
+            )
         
-        **Upload je bestand om te beginnen! →**
-        """)
+        st.toggle(
+            "⏱️ Performance meten",
+            key='profiling',
+            help="Meet per stap de duur, verwerkte rijen en het piekgeheugen en toont ze onderaan in het Performance paneel (maakt de app trager)"
+        )
+    
+    if uploaded_file is not None or snapshot_hash is not None:
+        # Laad data
+        with st.spinner('Data aan het verwerken...'):
+            if uploaded_file is not None and merge_history:
+                df_full = load_and_merge_history(uploaded_file)
+            elif uploaded_file is not None:
+                df_full = load_and_process_data(uploaded_file)
+            elif snapshot_hash == HISTORY_SOURCE:
+                df_full = load_history_data()
+            else:
+                df_full = load_snapshot_data(snapshot_hash)
         
-        # Voorbeeld data structure
-        with st.expander("📋 Verwachte Data Structuur"):
-            st.markdown("""
-            **Verplichte kolommen:**
-            - `Functie` - Vacaturetitel
-            - `Status vacature` - Huidige status
-            - `Eigenaar` - Recruiter
-            - `Datum aanmaak` - Aanmaakdatum vacature
-            - `Aantal reacties` - Aantal sollicitaties
+        if df_full is not None:
+            profiler = ACTIVE_PROFILER.get()
+            if profiler is not None:
+                profiler.context.update(data_hash=df_full.attrs['data_hash'], dataset_rijen=len(df_full))
             
-            **Optionele kolommen voor uitgebreide analyse:**
-            - `Extern vervuld`, `Intern vervuld` - Vervuldatums voor doorlooptijd
-            - `Niet vervuld`, `Ingetrokken` - Sluitdatums voor completeness
-            - `Totaal per wervingskanaal: [KANAAL]` - Voor kanaal effectiviteit
-            - `Totaal per wervingskanaal (aangenomen): [KANAAL]` - Voor conversie rates
-            - `Locatie` - Voor geografische analyses
+            # Event index per dataset voor snelle periode wissels
+            event_index = get_daily_event_index(df_full.attrs['data_hash'], df_full)
             
-            **Automatische Cleaning:**
-            - HTML entities worden automatisch geconverteerd
-            - Datums in DD-MM-YYYY formaat worden herkend
-            - Lege waarden en 0000-00-00 datums worden gefilterd
-            """)
-
-if __name__ == "__main__":
-    main()        period_start, period_end = period_range
+            # Datumfilter in sidebar
+            with st.sidebar:
+                st.header("📅 Periode Selectie")
+                
+                # Bepaal datum range van data
+                min_date, max_date = get_date_range_from_data(df_full)
+                
+                # Standaard periode opties
+                periods = get_predefined_periods()
+                
+                # Filter periods die binnen data range vallen
+                available_periods = {}
+                for name, period_range in periods.items():
+                    if period_range is None:  # "Aangepast" optie
+                        available_periods[name] = None
+                    else:
+                        period_start, period_end = period_range
                         # Check of periode overlapt met beschikbare data
                         if period_end >= min_date and period_start <= max_date:
                             # Adjust to data boundaries
@@ -224,9 +1434,33 @@ if __name__ == "__main__":
                 
                 st.info(f"**Geselecteerde periode:** {(end_date - start_date).days + 1} dagen")
                 st.caption(f"{start_date.strftime('%d-%m-%Y')} tot {end_date.strftime('%d-%m-%Y')}")
+                
+                with st.expander("⚡ Ingest Cache"):
+                    cache_stats = get_ingest_cache().stats()
+                    st.caption(
+                        f"Hits: {cache_stats['hits']} · Misses: {cache_stats['misses']} · "
+                        f"Hit rate: {cache_stats['hit_rate']:.0f}%"
+                    )
+                    st.caption(
+                        f"{cache_stats['entries']} dataset(s) in cache · {cache_stats['size_mb']:.1f} MB · "
+                        f"{cache_stats['evictions']} evictions"
+                    )
+                
+                st.header("⚙️ Weergave")
+                lazy_navigation = st.toggle(
+                    "Alleen zichtbare sectie berekenen",
+                    value=True,
+                    help="Toont de analyses als losse secties in plaats van tabs, zodat alleen de gekozen sectie wordt opgebouwd"
+                )
+                prefetch_neighbours = st.checkbox(
+                    "Buursecties vooraf laden",
+                    value=True,
+                    disabled=not lazy_navigation,
+                    help="Berekent de vorige en volgende sectie op de achtergrond voor snel wisselen"
+                )
             
             # Filter data op geselecteerde periode
-            df = filter_data_by_date_range(df_full, start_date, end_date)
+            df = filter_data_by_date_range(df_full, start_date, end_date, event_index)
             
             if len(df) == 0:
                 st.warning("Geen data beschikbaar voor de geselecteerde periode.")
@@ -234,7 +1468,7 @@ if __name__ == "__main__":
                 return
             
             # Key Metrics
-            metrics = calculate_metrics(df_full, start_date, end_date)  # Gebruik volledige dataset voor context
+            metrics = calculate_metrics(df_full, start_date, end_date, event_index)  # Gebruik volledige dataset voor context
             
             st.header(f"🎯 KPIs voor Periode ({start_date} t/m {end_date})")
             
@@ -278,536 +1512,92 @@ if __name__ == "__main__":
             
             # Dagelijkse activiteit chart
             st.header("📈 Dagelijkse Activiteit")
-            daily_chart = create_daily_activity_chart(df_full, start_date, end_date)
+            daily_chart = create_daily_activity_chart(df_full, start_date, end_date, event_index)
             st.plotly_chart(daily_chart, use_container_width=True)
-            
-            # Charts in tabs
-            tab1, tab2, tab3, tab4, tab5 = st.tabs([
-                "📊 Status Overzicht", 
-                "👥 Recruitment Performance", 
-                "🌐 Kanaal Analyse", 
-                "📋 Vacature Details",
-                "🏢 Afdeling Analyse"
-            ])
-            
-            with tab1:
-                st.header("Vacaturestatus Verdeling")
-                col1, col2 = st.columns([1, 1])
-                
-                with col1:
-                    status_fig = create_status_chart(df)
-                    st.plotly_chart(status_fig, use_container_width=True)
-                
-                with col2:
-                    # Status tabel met aantallen
-                    st.subheader("Status Details")
-                    status_table = df['Status vacature'].value_counts().reset_index()
-                    status_table.columns = ['Status', 'Aantal']
-                    status_table['Percentage'] = (status_table['Aantal'] / len(df) * 100).round(1)
-                    st.dataframe(status_table, use_container_width=True)
-            
-            with tab2:
-                st.header("Recruitment Performance (inclusief Afdeling)")
-                perf_fig, recruiter_stats = create_recruitment_performance_chart(df)
-                st.plotly_chart(perf_fig, use_container_width=True)
-                
-                st.subheader("Recruitment Team Statistieken")
-                if len(recruiter_stats) > 0:
-                    recruiter_display = recruiter_stats[['Eigenaar', 'Afdeling', 'Totaal_Vacatures', 'Aantal reacties', 'Vervulde_Vacatures', 'Fill_Rate', 'Gem_Reacties']].copy()
-                    recruiter_display.columns = ['Recruiter', 'Afdeling', 'Totaal Vacatures', 'Totaal Reacties', 'Vervulde Vacatures', 'Fill Rate (%)', 'Gem. Reacties']
-                    st.dataframe(recruiter_display, use_container_width=True)
-                else:
-                    st.info("Geen recruiter data beschikbaar voor de geselecteerde periode.")
-            
-            with tab3:
-                st.header("Wervingskanaal Analyse")
-                channel_fig1, channel_fig2, channel_df = create_channel_analysis(df)
-                
-                if channel_fig1 is not None:
-                    col1, col2 = st.columns(2)
-                    with col1:
-                        st.plotly_chart(channel_fig1, use_container_width=True)
-                    with col2:
-                        st.plotly_chart(channel_fig2, use_container_width=True)
-                    
-                    st.subheader("Kanaal Performance Tabel")
-                    channel_display = channel_df.copy()
-                    channel_display['Conversie_Rate'] = channel_display['Conversie_Rate'].round(1)
-                    channel_display.columns = ['Kanaal', 'Totaal Sollicitanten', 'Aangenomen', 'Afgewezen', 'Conversie Rate (%)']
-                    st.dataframe(channel_display, use_container_width=True)
-                else:
-                    st.info("Geen kanaaldata beschikbaar in de huidige export.")
-            
-            with tab4:
-                st.header("Gedetailleerde Vacature Performance")
-                
-                # Filter opties
-                col1, col2, col3 = st.columns(3)
-                
-                with col1:
-                    status_filter = st.multiselect(
-                        "Filter op Status",
-                        options=df['Status vacature'].unique(),
-                        default=df['Status vacature'].unique()
-                    )
-                
-                with col2:
-                    if 'Afdeling' in df.columns:
-                        afdeling_filter = st.multiselect(
-                            "Filter op Afdeling",
-                            options=df['Afdeling'].dropna().unique(),
-                            default=df['Afdeling'].dropna().unique()
-                        )
-                    else:
-                        afdeling_filter = []
-                
-                with col3:
-                    min_kandidaten = st.number_input(
-                        "Minimaal aantal kandidaten",
-                        min_value=0,
-                        value=0,
-                        step=1
-                    )
-                
-                # Filter data
-                filtered_df = df[df['Status vacature'].isin(status_filter)]
-                if afdeling_filter and 'Afdeling' in df.columns:
-                    filtered_df = filtered_df[filtered_df['Afdeling'].isin(afdeling_filter)]
-                if 'Aantal reacties' in filtered_df.columns:
-                    filtered_df = filtered_df[filtered_df['Aantal reacties'] >= min_kandidaten]
-                
-                # Gedetailleerde analyse tabel
-                detailed_analysis = create_detailed_vacature_analysis(filtered_df)
-                
-                st.subheader(f"Vacature Performance Analyse ({len(detailed_analysis)} vacatures)")
-                
-                # Sorteer opties
-                sort_options = ['Totaal_Kandidaten', 'Gesprekken', 'Aangenomen', 'Hire_Rate', 'Aanmaakdatum']
-                sort_by = st.selectbox(
-                    "Sorteer op",
-                    options=sort_options,
-                    index=0
-                )
-                
-                if sort_by in ['Hire_Rate', 'Gesprek_Rate']:
-                    # Speciale behandeling voor percentage sorting
-                    detailed_analysis['Sort_Value'] = detailed_analysis[sort_by].str.replace('%', '').astype(float)
-                    detailed_analysis = detailed_analysis.sort_values('Sort_Value', ascending=False)
-                    detailed_analysis = detailed_analysis.drop('Sort_Value', axis=1)
-                else:
-                    detailed_analysis = detailed_analysis.sort_values(sort_by, ascending=False)
-                
-                # Toon tabel met nieuwe kolommen
-                st.dataframe(
-                    detailed_analysis,
-                    use_container_width=True,
-                    column_config={
-                        "Vacature": st.column_config.TextColumn("Vacature", width="large"),
-                        "Totaal_Kandidaten": st.column_config.NumberColumn("👥 Kandidaten", format="%d"),
-                        "Gesprekken": st.column_config.NumberColumn("💬 Gesprekken", format="%d"),
-                        "Afgewezen_na_Brief": st.column_config.NumberColumn("❌ Afgewezen (Brief)", format="%d"),
-                        "Afgewezen_na_Gesprek": st.column_config.NumberColumn("❌ Afgewezen (Gesprek)", format="%d"),
-                        "Aangenomen": st.column_config.NumberColumn("✅ Aangenomen", format="%d"),
-                        "Hire_Rate": st.column_config.TextColumn("📈 Hire Rate"),
-                        "Gesprek_Rate": st.column_config.TextColumn("💬 Gesprek Rate"),
-                    }
-                )
-                
-                # Performance insights uitgebreid
-                if len(detailed_analysis) > 0:
-                    st.subheader("📊 Performance Insights")
-                    
-                    # Bereken totalen
-                    totaal_kandidaten = detailed_analysis['Totaal_Kandidaten'].sum()
-                    totaal_gesprekken = detailed_analysis['Gesprekken'].sum()
-                    totaal_aangenomen = detailed_analysis['Aangenomen'].sum()
-                    totaal_afgewezen_brief = detailed_analysis['Afgewezen_na_Brief'].sum()
-                    totaal_afgewezen_gesprek = detailed_analysis['Afgewezen_na_Gesprek'].sum()
-                    
-                    col1, col2, col3, col4 = st.columns(4)
-                    
-                    with col1:
-                        st.metric(
-                            "Totaal Kandidaten",
-                            f"{totaal_kandidaten:,}",
-                            help="Som van alle kandidaten voor gefilterde vacatures"
-                        )
-                        
-                        overall_hire_rate = (totaal_aangenomen / totaal_kandidaten * 100) if totaal_kandidaten > 0 else 0
-                        st.metric(
-                            "Overall Hire Rate",
-                            f"{overall_hire_rate:.1f}%"
-                        )
-                    
-                    with col2:
-                        st.metric(
-                            "Totaal Gesprekken",
-                            f"{totaal_gesprekken:,}"
-                        )
-                        
-                        gesprek_to_hire = (totaal_aangenomen / totaal_gesprekken * 100) if totaal_gesprekken > 0 else 0
-                        st.metric(
-                            "Gesprek → Hire Rate",
-                            f"{gesprek_to_hire:.1f}%"
-                        )
-                    
-                    with col3:
-                        st.metric(
-                            "Afgewezen na Brief",
-                            f"{totaal_afgewezen_brief:,}",
-                            delta=f"{(totaal_afgewezen_brief/totaal_kandidaten*100):.1f}% van totaal" if totaal_kandidaten > 0 else None
-                        )
-                        
-                        st.metric(
-                            "Afgewezen na Gesprek",
-                            f"{totaal_afgewezen_gesprek:,}",
-                            delta=f"{(totaal_afgewezen_gesprek/totaal_gesprekken*100):.1f}% van gesprekken" if totaal_gesprekken > 0 else None
-                        )
-                    
-                    with col4:
-                        st.metric(
-                            "Totaal Aangenomen",
-                            f"{totaal_aangenomen:,}",
-                            delta=f"{overall_hire_rate:.1f}% van kandidaten"
-                        )
-                        
-                        # Gemiddelde kandidaten per hire
-                        kandidaten_per_hire = (totaal_kandidaten / totaal_aangenomen) if totaal_aangenomen > 0 else 0
-                        st.metric(
-                            "Kandidaten per Hire",
-                            f"{kandidaten_per_hire:.1f}",
-                            help="Hoeveel kandidaten gemiddeld nodig voor 1 hire"
-                        )
-                    
-                    # Top performers
-                    st.subheader("🏆 Top Performers")
-                    col1, col2, col3 = st.columns(3)
-                    
-                    with col1:
-                        # Beste hire rate (alleen vacatures met kandidaten)
-                        vacatures_met_kandidaten = detailed_analysis[detailed_analysis['Totaal_Kandidaten'] > 0]
-                        if len(vacatures_met_kandidaten) > 0:
-                            vacatures_met_kandidaten['Hire_Rate_Numeric'] = vacatures_met_kandidaten['Hire_Rate'].str.replace('%', '').astype(float)
-                            beste_hire = vacatures_met_kandidaten.loc[vacatures_met_kandidaten['Hire_Rate_Numeric'].idxmax()]
-                            st.success(f"**Beste Hire Rate:** {beste_hire['Vacature'][:25]}... ({beste_hire['Hire_Rate']})")
-                    
-                    with col2:
-                        # Meeste gesprekken
-                        if detailed_analysis['Gesprekken'].max() > 0:
-                            meeste_gesprekken = detailed_analysis.loc[detailed_analysis['Gesprekken'].idxmax()]
-                            st.info(f"**Meeste Gesprekken:** {meeste_gesprekken['Vacature'][:25]}... ({meeste_gesprekken['Gesprekken']} gesprekken)")
-                    
-                    with col3:
-                        # Meeste hires
-                        if detailed_analysis['Aangenomen'].max() > 0:
-                            meeste_hires = detailed_analysis.loc[detailed_analysis['Aangenomen'].idxmax()]
-                            st.success(f"**Meeste Hires:** {meeste_hires['Vacature'][:25]}... ({meeste_hires['Aangenomen']} hires)")
-            
-            with tab5:
-                st.header("Afdeling Analyse")
-                
-                # Afdeling samenvatting
-                afdeling_stats = create_afdeling_summary(df)
-                
-                if len(afdeling_stats) > 0:
-                    st.subheader("Performance per Afdeling")
-                    
-                    # Visualisatie
-                    col1, col2 = st.columns(2)
-                    
-                    with col1:
-                        # Vacatures per afdeling
-                        fig_afd1 = px.bar(
-                            afdeling_stats,
-                            x='Afdeling',
-                            y='Totaal_Vacatures',
-                            title='Aantal Vacatures per Afdeling',
-                            color='Fill_Rate',
-                            color_continuous_scale='RdYlGn',
-                            text='Totaal_Vacatures'
-                        )
-                        fig_afd1.update_traces(textposition='outside')
-                        fig_afd1.update_xaxes(tickangle=45)
-                        st.plotly_chart(fig_afd1, use_container_width=True)
-                    
-                    with col2:
-                        # Fill rate per afdeling
-                        fig_afd2 = px.bar(
-                            afdeling_stats,
-                            x='Afdeling',
-                            y='Fill_Rate',
-                            title='Fill Rate per Afdeling (%)',
-                            color='Fill_Rate',
-                            color_continuous_scale='RdYlGn',
-                            text=[f"{x:.1f}%" for x in afdeling_stats['Fill_Rate']]
-                        )
-                        fig_afd2.update_traces(textposition='outside')
-                        fig_afd2.update_xaxes(tickangle=45)
-                        st.plotly_chart(fig_afd2, use_container_width=True)
-                    
-                    # Afdeling tabel
-                    st.subheader("Afdeling Statistieken")
-                    afdeling_display = afdeling_stats.copy()
-                    afdeling_display.columns = [
-                        'Afdeling', 'Totaal Vacatures', 'Totaal Reacties', 'Aantal Recruiters',
-                        'Vervulde Vacatures', 'Fill Rate (%)', 'Gem. Reacties per Vacature'
-                    ]
-                    st.dataframe(afdeling_display, use_container_width=True)
-                    
-                    # Afdeling insights
-                    st.subheader("🏢 Afdeling Insights")
-                    
-                    col1, col2, col3 = st.columns(3)
-                    
-                    with col1:
-                        # Grootste afdeling
-                        grootste_afdeling = afdeling_stats.loc[afdeling_stats['Totaal_Vacatures'].idxmax()]
-                        st.info(f"**Meeste Vacatures:** {grootste_afdeling['Afdeling']} ({grootste_afdeling['Totaal_Vacatures']} vacatures)")
-                    
-                    with col2:
-                        # Beste fill rate
-                        beste_fill_rate = afdeling_stats.loc[afdeling_stats['Fill_Rate'].idxmax()]
-                        st.success(f"**Beste Fill Rate:** {beste_fill_rate['Afdeling']} ({beste_fill_rate['Fill_Rate']:.1f}%)")
-                    
-                    with col3:
-                        # Meeste recruiters
-                        meeste_recruiters = afdeling_stats.loc[afdeling_stats['Aantal_Recruiters'].idxmax()]
-                        st.info(f"**Meeste Recruiters:** {meeste_recruiters['Afdeling']} ({meeste_recruiters['Aantal_Recruiters']} recruiters)")
-                
-                else:
-                    st.info("Geen afdeling data beschikbaar in de huidige dataset.")
-            
-            # Uitgebreide Analytics Sectie
-            st.header("📊 Uitgebreide Analytics")
-            
-            # Controleer welke inzichten we kunnen tonen
-            col1, col2 = st.columns(2)
-            
-            with col1:
-                st.subheader("📈 Beschikbare Analyses")
-                
-                # Vacaturestatistieken
-                st.write("✅ **Vacaturestatistieken**")
-                st.write(f"• Openstaande rollen: {metrics['openstaande_vacatures']}")
-                st.write(f"• Gesloten rollen: {metrics['vervulde_vacatures'] + metrics['niet_vervulde_vacatures']}")
-                st.write(f"• Fill rate: {metrics['fill_rate']:.1f}%")
-                st.write(f"• Actieve vacatures per recruiter: ✅ (zie Recruiter tab)")
-                
-                # Kanaalanalyse 
-                channel_df = create_channel_analysis(df)[2]
-                st.write("✅ **Kanaalanalyse**")
-                if len(channel_df) > 0:
-                    st.write(f"• Aantal actieve kanalen: {len(channel_df)}")
-                    best_channel = channel_df.loc[channel_df['Conversie_Rate'].idxmax()]
-                    st.write(f"• Beste kanaal: {best_channel['Kanaal']} ({best_channel['Conversie_Rate']:.1f}%)")
-                    st.write(f"• Totaal sollicitanten: {channel_df['Totaal_Sollicitanten'].sum():,}")
-                else:
-                    st.write("• Geen kanaaldata beschikbaar")
-                
-                # Recruiter Performance
-                st.write("✅ **Recruitment Performance**")
-                recruiter_stats = create_recruitment_performance_chart(df)[1]
-                if len(recruiter_stats) > 0:
-                    top_recruiter = recruiter_stats.sort_values('Fill_Rate', ascending=False).iloc[0]
-                    st.write(f"• Actieve recruiters: {len(recruiter_stats)}")
-                    st.write(f"• Beste fill rate: {top_recruiter['Eigenaar']} ({top_recruiter['Fill_Rate']:.1f}%)")
-                    st.write(f"• Totaal reacties: {recruiter_stats['Aantal reacties'].sum():,}")
-                
-                # Gedetailleerde kandidaat metrics
-                detailed_analysis = create_detailed_vacature_analysis(df)
-                if len(detailed_analysis) > 0:
-                    st.write("✅ **Kandidaat Proces Analyse**")
-                    totaal_gesprekken = detailed_analysis['Gesprekken'].sum()
-                    totaal_afgewezen_brief = detailed_analysis['Afgewezen_na_Brief'].sum()
-                    totaal_afgewezen_gesprek = detailed_analysis['Afgewezen_na_Gesprek'].sum()
-                    totaal_aangenomen = detailed_analysis['Aangenomen'].sum()
-                    st.write(f"• Totaal gesprekken: {totaal_gesprekken:,}")
-                    st.write(f"• Afgewezen na brief: {totaal_afgewezen_brief:,}")
-                    st.write(f"• Afgewezen na gesprek: {totaal_afgewezen_gesprek:,}")
-                    st.write(f"• Totaal aangenomen: {totaal_aangenomen:,}")
-                
-                # Afdeling analyse
-                if 'Afdeling' in df.columns:
-                    afdeling_stats = create_afdeling_summary(df)
-                    if len(afdeling_stats) > 0:
-                        st.write("✅ **Afdeling Analyse**")
-                        st.write(f"• Aantal afdelingen: {len(afdeling_stats)}")
-                        beste_afdeling = afdeling_stats.loc[afdeling_stats['Fill_Rate'].idxmax()]
-                        st.write(f"• Beste afdeling: {beste_afdeling['Afdeling']} ({beste_afdeling['Fill_Rate']:.1f}%)")
-                        st.write(f"• Totaal recruiters: {afdeling_stats['Aantal_Recruiters'].sum()}")
-            
-            with col2:
-                st.subheader("⚠️ Beperkte Analyses")
-                
-                # Tijdlijn analyses
-                st.write("⚠️ **Tijdlijn Analyses**")
-                period_days = (end_date - start_date).days
-                if period_days < 30:
-                    st.write("• Beperkte periode voor trends")
-                elif period_days < 90:
-                    st.write("• Korte periode - trends zichtbaar")
-                else:
-                    st.write("• Voldoende periode voor trend analyse")
-                
-                # Doorlooptijd analyses
-                st.write("⚠️ **Doorlooptijd Analyses**")
-                performance_table = create_vacature_performance_table(df)
-                doorlooptijden = performance_table[performance_table['Doorlooptijd'] != '-']
-                if len(doorlooptijden) > 0:
-                    st.write(f"• Vacatures met doorlooptijd: {len(doorlooptijden)}")
-                    st.write("• Gemiddelde doorlooptijd berekening mogelijk")
-                else:
-                    st.write("• Onvoldoende sluitdatums voor doorlooptijd")
-                
-                st.write("❌ **Niet Beschikbaar**")
-                st.write("• Candidate journey tracking")
-                st.write("• Funnel analyses (bezoekers → sollicitaties)")
-                st.write("• Kosten per kanaal")
-                st.write("• Time-to-reject specifiek")
-                st.write("• Procesfase tijdsduur")
-            
-            # Summary van data completeness
-            st.subheader("📋 Data Completeness Rapport")
-            
-            # Bereken data completeness scores
-            completeness_scores = {}
-            
-            # Basis data
-            completeness_scores['Basis Vacature Info'] = 100  # Altijd beschikbaar
-            
-            # Status data
-            status_complete = (df['Status vacature'].notna().sum() / len(df)) * 100
-            completeness_scores['Status Informatie'] = status_complete
-            
-            # Datum data  
-            date_complete = (df['Datum aanmaak'].notna().sum() / len(df)) * 100
-            completeness_scores['Datum Informatie'] = date_complete
-            
-            # Recruiter data
-            recruiter_complete = (df['Eigenaar'].notna().sum() / len(df)) * 100
-            completeness_scores['Recruiter Informatie'] = recruiter_complete
-            
-            # Reactie data
-            reactie_complete = ((df['Aantal reacties'] > 0).sum() / len(df)) * 100
-            completeness_scores['Sollicitatie Data'] = reactie_complete
-            
-            # Kanaal data
-            kanaal_cols = [col for col in df.columns if 'wervingskanaal' in col and not col.endswith(('aangenomen)', 'afgewezen)'))]
-            if kanaal_cols:
-                kanaal_data = df[kanaal_cols].sum(axis=1) > 0
-                kanaal_complete = (kanaal_data.sum() / len(df)) * 100
-                completeness_scores['Kanaal Data'] = kanaal_complete
-            else:
-                completeness_scores['Kanaal Data'] = 0
-            
-            # Toon completeness scores
-            completeness_df = pd.DataFrame(list(completeness_scores.items()), 
-                                         columns=['Data Categorie', 'Completeness %'])
-            completeness_df['Completeness %'] = completeness_df['Completeness %'].round(1)
-            completeness_df['Status'] = completeness_df['Completeness %'].apply(
-                lambda x: '🟢 Excellent' if x >= 90 else '🟡 Good' if x >= 70 else '🔴 Limited'
-            )
-            
-            st.dataframe(completeness_df, use_container_width=True)
-            
-            # Gemiddelde completeness
-            avg_completeness = completeness_df['Completeness %'].mean()
-            
-            if avg_completeness >= 85:
-                st.success(f"🎉 **Uitstekende data kwaliteit!** Gemiddelde completeness: {avg_completeness:.1f}%")
-                st.info("Je kunt alle beschikbare analyses gebruiken voor betrouwbare inzichten.")
-            elif avg_completeness >= 70:
-                st.warning(f"⚠️ **Goede data kwaliteit.** Gemiddelde completeness: {avg_completeness:.1f}%")
-                st.info("De meeste analyses zijn betrouwbaar, maar sommige kunnen beperkt zijn.")
+            
+            # Aggregaten en figuren worden per (dataset, periode) één keer berekend
+            cube = get_vacature_cube(df_full.attrs['data_hash'], df_full)
+            analysis = get_analysis_context(df_full.attrs['data_hash'], start_date, end_date, df, cube)
+            
+            # Charts in secties; in lazy modus wordt alleen de zichtbare sectie opgebouwd
+            section_names = list(DASHBOARD_SECTIONS)
+            if lazy_navigation:
+                section_choice = st.radio(
+                    "Sectie",
+                    options=section_names,
+                    horizontal=True,
+                    label_visibility="collapsed",
+                    key="dashboard_section"
+                )
+                with profile_stage(f"Sectie {section_choice}", len(df)):
+                    DASHBOARD_SECTIONS[section_choice][0](df, analysis)
+                
+                if prefetch_neighbours:
+                    section_index = section_names.index(section_choice)
+                    neighbours = [section_names[i] for i in (section_index - 1, section_index + 1) if 0 <= i < len(section_names)]
+                    prefetch_sections(analysis, neighbours)
             else:
-                def create_channel_analysis(df):
-    """Analyseert wervingskanalen"""
-    channels = ['V&VN', 'Indeed', 'Infopuntzorg', 'Zorgselect', 'Facebook', 
-               'Linkedin', 'Twitter', 'Instagram', 'Via medewerker van SEIN', 'Anders']
-    
-    channel_data = []
-    
-    for channel in channels:
-        total_col = f'Totaal per wervingskanaal: {channel}'
-        hired_col = f'Totaal per wervingskanaal (aangenomen): {channel}'
-        rejected_col = f'Totaal per wervingskanaal (afgewezen): {channel}'
-        
-        if total_col in df.columns:
-            total = df[total_col].sum()
-            hired = df[hired_col].sum() if hired_col in df.columns else 0
-            rejected = df[rejected_col].sum() if rejected_col in df.columns else 0
+                tabs = st.tabs(section_names)
+                for tab, section_name in zip(tabs, section_names):
+                    with tab, profile_stage(f"Sectie {section_name}", len(df)):
+                        DASHBOARD_SECTIONS[section_name][0](df, analysis)
             
-            if total > 0:
-                conversion_rate = (hired / total * 100)
-                channel_data.append({
-                    'Kanaal': channel,
-                    'Totaal_Sollicitanten': total,
-                    'Aangenomen': hired,
-                    'Afgewezen': rejected,
-                    'Conversie_Rate': conversion_rate
-                })
-    
-    channel_df = pd.DataFrame(channel_data)
-    channel_df = channel_df[channel_df['Totaal_Sollicitanten'] > 0].sort_values('Totaal_Sollicitanten', ascending=False)
-    
-    if len(channel_df) > 0:
-        # Chart voor totaal sollicitanten
-        fig1 = px.bar(
-            channel_df,
-            x='Kanaal',
-            y='Totaal_Sollicitanten',
-            title='Aantal Sollicitanten per Kanaal',
-            color='Totaal_Sollicitanten',
-            color_continuous_scale='Blues',
-            text='Totaal_Sollicitanten'
-        )
-        fig1.update_traces(textposition='outside')
-        fig1.update_xaxes(tickangle=45)
-        
-        # Chart voor conversie rates
-        fig2 = px.bar(
-            channel_df,
-            x='Kanaal',
-            y='Conversie_Rate',
-            title='Conversieratio per Kanaal (%)',
-            color='Conversie_Rate',
-            color_continuous_scale='Greens',
-            text=[f"{x:.1f}%" for x in channel_df['Conversie_Rate']]
-        )
-        fig2.update_traces(textposition='outside')
-        fig2.update_xaxes(tickangle=45)
-        
-        return fig1, fig2, channel_df
+            # Uitgebreide Analytics Sectie
+            st.header("📊 Uitgebreide Analytics")
+            
+            # Controleer welke inzichten we kunnen tonen
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                st.subheader("📈 Beschikbare Analyses")
+                
+                # Vacaturestatistieken
+                st.write("✅ **Vacaturestatistieken**")
+                st.write(f"• Openstaande rollen: {metrics['openstaande_vacatures']}")
+                st.write(f"• Gesloten rollen: {metrics['vervulde_vacatures'] + metrics['niet_vervulde_vacatures']}")
+                st.write(f"• Fill rate: {metrics['fill_rate']:.1f}%")
+                st.write(f"• Actieve vacatures per recruiter: ✅ (zie Recruiter tab)")
+                
+                # Kanaalanalyse 
+                channel_df = analysis.get_summary_stats('channel_stats')
+                st.write("✅ **Kanaalanalyse**")
+                if channel_df is None:
+                    st.write("• Open de sectie Kanaal Analyse voor details")
+                elif len(channel_df) > 0:
+                    st.write(f"• Aantal actieve kanalen: {len(channel_df)}")
+                    best_channel = channel_df.loc[channel_df['Conversie_Rate'].idxmax()]
+                    st.write(f"• Beste kanaal: {best_channel['Kanaal']} ({best_channel['Conversie_Rate']:.1f}%)")
                     st.write(f"• Totaal sollicitanten: {channel_df['Totaal_Sollicitanten'].sum():,}")
                 else:
                     st.write("• Geen kanaaldata beschikbaar")
                 
                 # Recruiter Performance
                 st.write("✅ **Recruitment Performance**")
-                recruiter_stats = create_recruitment_performance_chart(df)[1]
-                if len(recruiter_stats) > 0:
+                recruiter_stats = analysis.get_summary_stats('recruiter_stats')
+                if recruiter_stats is None:
+                    st.write("• Open de sectie Recruitment Performance voor details")
+                elif len(recruiter_stats) > 0:
                     top_recruiter = recruiter_stats.sort_values('Fill_Rate', ascending=False).iloc[0]
                     st.write(f"• Actieve recruiters: {len(recruiter_stats)}")
                     st.write(f"• Beste fill rate: {top_recruiter['Eigenaar']} ({top_recruiter['Fill_Rate']:.1f}%)")
                     st.write(f"• Totaal reacties: {recruiter_stats['Aantal reacties'].sum():,}")
                 
-                # Gedetailleerde kandidaat metrics
-                detailed_analysis = create_detailed_vacature_analysis(df)
-                if len(detailed_analysis) > 0:
+                # Gedetailleerde kandidaat metrics, als totalen over de periode
+                if len(df) > 0:
+                    detail_totals = analysis.period_detail_totals
                     st.write("✅ **Kandidaat Proces Analyse**")
-                    totaal_gesprekken = detailed_analysis['Gesprekken'].sum()
-                    totaal_afgewezen_brief = detailed_analysis['Afgewezen_na_Brief'].sum()
-                    totaal_afgewezen_gesprek = detailed_analysis['Afgewezen_na_Gesprek'].sum()
-                    totaal_aangenomen = detailed_analysis['Aangenomen'].sum()
-                    st.write(f"• Totaal gesprekken: {totaal_gesprekken:,}")
-                    st.write(f"• Afgewezen na brief: {totaal_afgewezen_brief:,}")
-                    st.write(f"• Afgewezen na gesprek: {totaal_afgewezen_gesprek:,}")
-                    st.write(f"• Totaal aangenomen: {totaal_aangenomen:,}")
+                    st.write(f"• Totaal gesprekken: {detail_totals['Gesprekken']:,}")
+                    st.write(f"• Afgewezen na brief: {detail_totals['Afgewezen_na_Brief']:,}")
+                    st.write(f"• Afgewezen na gesprek: {detail_totals['Afgewezen_na_Gesprek']:,}")
+                    st.write(f"• Totaal aangenomen: {detail_totals['Aangenomen']:,}")
                 
                 # Afdeling analyse
                 if 'Afdeling' in df.columns:
-                    afdeling_stats = create_afdeling_summary(df)
-                    if len(afdeling_stats) > 0:
+                    afdeling_stats = analysis.get_summary_stats('afdeling_stats')
+                    if afdeling_stats is None:
+                        st.write("✅ **Afdeling Analyse**")
+                        st.write("• Open de sectie Afdeling Analyse voor details")
+                    elif len(afdeling_stats) > 0:
                         st.write("✅ **Afdeling Analyse**")
                         st.write(f"• Aantal afdelingen: {len(afdeling_stats)}")
                         beste_afdeling = afdeling_stats.loc[afdeling_stats['Fill_Rate'].idxmax()]
@@ -829,11 +1619,10 @@ if __name__ == "__main__":
                 
                 # Doorlooptijd analyses
                 st.write("⚠️ **Doorlooptijd Analyses**")
-                performance_table = create_vacature_performance_table(df)
-                doorlooptijden = performance_table[performance_table['Doorlooptijd'] != '-']
+                doorlooptijden = analysis.doorlooptijden
                 if len(doorlooptijden) > 0:
                     st.write(f"• Vacatures met doorlooptijd: {len(doorlooptijden)}")
-                    st.write("• Gemiddelde doorlooptijd berekening mogelijk")
+                    st.write(f"• Gemiddelde doorlooptijd: {doorlooptijden.mean():.0f} dagen")
                 else:
                     st.write("• Onvoldoende sluitdatums voor doorlooptijd")
                 
@@ -870,7 +1659,7 @@ if __name__ == "__main__":
             completeness_scores['Sollicitatie Data'] = reactie_complete
             
             # Kanaal data
-            kanaal_cols = [col for col in df.columns if 'wervingskanaal' in col and not col.endswith(('aangenomen)', 'afgewezen)'))]
+            kanaal_cols = [cols['totaal'] for cols in get_channel_columns(df).values() if 'totaal' in cols]
             if kanaal_cols:
                 kanaal_data = df[kanaal_cols].sum(axis=1) > 0
                 kanaal_complete = (kanaal_data.sum() / len(df)) * 100
@@ -903,34 +1692,46 @@ if __name__ == "__main__":
             
             # Download opties
             with st.expander("📥 Export Opties"):
+                export_format = st.radio(
+                    "Formaat",
+                    options=list(EXPORT_FORMATS),
+                    format_func=lambda export_format: EXPORT_FORMATS[export_format][0],
+                    horizontal=True,
+                    key="export_format"
+                )
+                _, extension, mime = EXPORT_FORMATS[export_format]
+                data_hash = df_full.attrs['data_hash']
+                
+                # Bestanden worden pas bij een klik gebouwd (zonder rerun) en per dataset en periode bewaard
                 col1, col2 = st.columns(2)
                 
                 with col1:
-                    if st.button("📊 Download Performance Rapport"):
-                        performance_table = create_vacature_performance_table(df)
-                        csv_buffer = io.StringIO()
-                        performance_table.to_csv(csv_buffer, index=False, sep=';')
-                        csv_data = csv_buffer.getvalue()
-                        
-                        st.download_button(
-                            label="💾 Download Performance CSV",
-                            data=csv_data,
-                            file_name=f"vacature_performance_{start_date}_{end_date}.csv",
-                            mime="text/csv"
-                        )
+                    # Het performance rapport heeft één rij per vacature
+                    too_large = export_format == 'xlsx' and len(analysis.performance_table) > XLSX_MAX_ROWS
+                    st.download_button(
+                        label="📊 Download Performance Rapport",
+                        data=lambda: get_export_file(
+                            data_hash, start_date, end_date, 'Performance', export_format,
+                            lambda: get_performance_export(analysis, export_format)
+                        ),
+                        file_name=f"vacature_performance_{start_date}_{end_date}.{extension}",
+                        mime=mime,
+                        on_click="ignore",
+                        disabled=too_large,
+                        help=f"Excel ondersteunt maximaal {XLSX_MAX_ROWS:,} rijen" if too_large else None
+                    )
                 
                 with col2:
-                    if st.button("📈 Download Gefilterde Data"):
-                        csv_buffer = io.StringIO()
-                        df.to_csv(csv_buffer, index=False, sep=';')
-                        csv_data = csv_buffer.getvalue()
-                        
-                        st.download_button(
-                            label="💾 Download Gefilterde CSV",
-                            data=csv_data,
-                            file_name=f"ats_data_filtered_{start_date}_{end_date}.csv",
-                            mime="text/csv"
-                        )
+                    too_large = export_format == 'xlsx' and len(df) > XLSX_MAX_ROWS
+                    st.download_button(
+                        label="📈 Download Gefilterde Data",
+                        data=lambda: get_export_file(data_hash, start_date, end_date, 'Vacatures', export_format, lambda: df),
+                        file_name=f"ats_data_filtered_{start_date}_{end_date}.{extension}",
+                        mime=mime,
+                        on_click="ignore",
+                        disabled=too_large,
+                        help=f"Excel ondersteunt maximaal {XLSX_MAX_ROWS:,} rijen" if too_large else None
+                    )
     
     else:
         # Landing page
@@ -1035,583 +1836,3 @@ if __name__ == "__main__":
 
 if __name__ == "__main__":
     main()
-
-# Configuratie van de pagina
-st.set_page_config(
-    page_title="ATS Recruitment Dashboard",
-    page_icon="📊",
-    layout="wide",
-    initial_sidebar_state="expanded"
-)
-
-# Custom CSS voor betere styling
-st.markdown("""
-<style>
-    .metric-card {
-        background-color: #f0f2f6;
-        padding: 1rem;
-        border-radius: 0.5rem;
-        border-left: 4px solid #1f77b4;
-    }
-    .success-metric {
-        border-left-color: #2ca02c;
-    }
-    .warning-metric {
-        border-left-color: #ff7f0e;
-    }
-    .danger-metric {
-        border-left-color: #d62728;
-    }
-    .vacature-card {
-        background-color: #f8f9fa;
-        padding: 1rem;
-        border-radius: 0.5rem;
-        border: 1px solid #dee2e6;
-        margin-bottom: 0.5rem;
-    }
-</style>
-""", unsafe_allow_html=True)
-
-def clean_html_entities(text):
-    """Converteert HTML entities naar normale tekst"""
-    if pd.isna(text) or not isinstance(text, str):
-        return text
-    
-    # HTML entities decoderen
-    text = html.unescape(text)
-    
-    # Extra cleanup voor veelvoorkomende encoding issues
-    replacements = {
-        '&ouml;': 'ö',
-        '&euml;': 'ë', 
-        '&uuml;': 'ü',
-        '&auml;': 'ä',
-        '&iuml;': 'ï',
-        '&eacute;': 'é',
-        '&egrave;': 'è',
-        '&aacute;': 'á',
-        '&agrave;': 'à',
-        '&uacute;': 'ú',
-        '&ugrave;': 'ù',
-        '&oacute;': 'ó',
-        '&ograve;': 'ò',
-        '&iacute;': 'í',
-        '&igrave;': 'ì',
-        '&ccedil;': 'ç',
-        '&ntilde;': 'ñ',
-        '&amp;': '&',
-        '&quot;': '"',
-        '&lt;': '<',
-        '&gt;': '>',
-        '&nbsp;': ' '
-    }
-    
-    for entity, char in replacements.items():
-        text = text.replace(entity, char)
-    
-    # Remove HTML tags
-    text = re.sub(r'<[^>]+>', '', text)
-    
-    return text
-
-def apply_gdpr_compliance(df):
-    """Applies GDPR compliance by removing sensitive data and anonymizing names"""
-    df_clean = df.copy()
-    
-    # 🔴 REMOVE HIGH RISK COLUMNS (FALLBACK - always remove if present)
-    high_risk_columns = [
-        'Mobiel', 'E-mail', 'E-mail werk', 'Gekoppelde kandidaten',
-        'Contactpersoon telefoonnummer', 'Contactpersoon e-mail',
-        'Tweede contactpersoon telefoonnummer', 'Tweede contactpersoon e-mail'
-    ]
-    
-    removed_columns = []
-    for col in high_risk_columns:
-        if col in df_clean.columns:
-            df_clean = df_clean.drop(columns=[col])
-            removed_columns.append(col)
-    
-    # Log removed columns for transparency
-    if removed_columns:
-        st.warning(f"🔒 GDPR Fallback: Volgende gevoelige kolommen automatisch verwijderd: {', '.join(removed_columns)}")
-    
-    # 🟡 ANONYMIZE MEDIUM RISK COLUMNS (first name only)
-    medium_risk_columns = [
-        'Eigenaar', 'Vacaturehouder', 'HR-adviseur', 'Eigenaar afdeling',
-        'Selectiecommissielid 1', 'Selectiecommissielid 2', 'Selectiecommissielid 3',
-        'Contactpersoon voor sollicitanten', 'Tweede contactpersoon voor sollicitanten'
-    ]
-    
-    def anonymize_name(name):
-        """Extract first name only for GDPR compliance"""
-        if pd.isna(name) or not isinstance(name, str) or name.strip() == '':
-            return name
-        
-        # Clean HTML entities first
-        name = clean_html_entities(name)
-        
-        # Extract first word (first name)
-        first_name = name.split()[0] if name.split() else name
-        
-        # Remove any remaining special characters but keep letters and common name characters
-        import re
-        first_name = re.sub(r'[^a-zA-ZàáâãäåæçèéêëìíîïðñòóôõöøùúûüýþÿĀāĂăĄąĆćĈĉĊċČčĎďĐđĒēĔĕĖėĘęĚěĜĝĞğĠġĢģĤĥĦħĨĩĪīĬĭĮįİıĲĳĴĵĶķĸĹĺĻļĽľĿŀŁłŃńŅņŇňŉŊŋŌōŎŏŐőŒœŔŕŖŗŘřŚśŜŝŞşŠšŢţŤťŦŧŨũŪūŬŭŮůŰűŲųŴŵŶŷŸŹźŻżŽž\-\'\.]', '', first_name)
-        
-        return first_name if first_name else 'Anoniem'
-    
-    anonymized_columns = []
-    for col in medium_risk_columns:
-        if col in df_clean.columns:
-            original_count = df_clean[col].notna().sum()
-            df_clean[col] = df_clean[col].apply(anonymize_name)
-            if original_count > 0:
-                anonymized_columns.append(col)
-    
-    # Log anonymized columns for transparency
-    if anonymized_columns:
-        st.info(f"🔒 Namen geanonimiseerd (voornaam alleen): {', '.join(anonymized_columns)}")
-    
-    return df_clean
-
-def get_predefined_periods():
-    """Definieert standaard periode opties"""
-    today = date.today()
-    
-    periods = {
-        "Laatste 7 dagen": (today - timedelta(days=7), today),
-        "Laatste 14 dagen": (today - timedelta(days=14), today),
-        "Laatste 30 dagen": (today - timedelta(days=30), today),
-        "Laatste 90 dagen": (today - timedelta(days=90), today),
-        "Huidige maand": (today.replace(day=1), today),
-        "Vorige maand": get_previous_month_range(today),
-        "Huidige kwartaal": get_current_quarter_range(today),
-        "Huidige kalenderjaar": (date(today.year, 1, 1), today),
-        "Laatste jaar": (today - timedelta(days=365), today),
-        "Aangepast": None  # Voor custom date selection
-    }
-    
-    return periods
-
-def get_previous_month_range(current_date):
-    """Berekent vorige maand periode"""
-    if current_date.month == 1:
-        start = date(current_date.year - 1, 12, 1)
-        end = date(current_date.year, 1, 1) - timedelta(days=1)
-    else:
-        start = date(current_date.year, current_date.month - 1, 1)
-        if current_date.month == 2:
-            end = date(current_date.year, 2, 1) - timedelta(days=1)
-        else:
-            end = date(current_date.year, current_date.month, 1) - timedelta(days=1)
-    return start, end
-
-def get_current_quarter_range(current_date):
-    """Berekent huidige kwartaal periode"""
-    quarter = (current_date.month - 1) // 3 + 1
-    start_month = 3 * (quarter - 1) + 1
-    start = date(current_date.year, start_month, 1)
-    return start, current_date
-
-def load_and_process_data(uploaded_file):
-    """Laadt en verwerkt de ATS CSV data met GDPR compliance"""
-    try:
-        # Probeer verschillende encodings
-        encodings = ['utf-8', 'cp1252', 'iso-8859-1', 'latin-1']
-        df = None
-        
-        for encoding in encodings:
-            try:
-                uploaded_file.seek(0)
-                df = pd.read_csv(uploaded_file, encoding=encoding, delimiter=';')
-                break
-            except UnicodeDecodeError:
-                continue
-        
-        if df is None:
-            st.error("Kon bestand niet inlezen. Controleer de encoding.")
-            return None
-        
-        # Data cleaning
-        df.columns = df.columns.str.strip()
-        
-        # Clean HTML entities in tekst kolommen BEFORE GDPR processing
-        text_columns = ['Functie', 'Functietitel', 'Eigenaar', 'Vacaturehouder', 'HR-adviseur', 'Locatie']
-        for col in text_columns:
-            if col in df.columns:
-                df[col] = df[col].apply(clean_html_entities)
-        
-        # 🔒 APPLY GDPR COMPLIANCE (including fallback removal)
-        with st.expander("🔒 GDPR Compliance Details", expanded=False):
-            st.write("**Automatische privacy bescherming toegepast:**")
-            st.write("✅ Contactgegevens verwijderd (telefoon, email)")
-            st.write("✅ Namen geanonimiseerd naar voornaam alleen")
-            st.write("✅ Client-side verwerking - data verlaat computer niet")
-            
-        df = apply_gdpr_compliance(df)
-        
-        # Converteer datums
-        date_columns = ['Datum aanmaak', 'Startdatum intern', 'Einddatum intern', 
-                       'Startdatum extern', 'Einddatum extern']
-        
-        # Status datum kolommen
-        status_date_columns = [col for col in df.columns if col in [
-            'Nieuw', 'Intake', 'Tekst bij vacaturehouder', 'Tekst akkoord', 
-            'Publicatie intern', 'Publicatie in- en extern', 'In procedure',
-            'Intern vervuld', 'Extern vervuld', 'Ingetrokken', 'Niet vervuld'
-        ]]
-        
-        all_date_columns = date_columns + status_date_columns
-        
-        for col in all_date_columns:
-            if col in df.columns:
-                # Converteer verschillende datumformaten
-                df[col] = pd.to_datetime(df[col], format='%d-%m-%Y', errors='coerce')
-                # Vervang 0000-00-00 datums met NaT
-                mask = df[col].dt.year == 1900
-                df.loc[mask, col] = pd.NaT
-        
-        # Bepaal vervuldatum (wanneer vacature werd gesloten)
-        df['Vervuldatum'] = df['Extern vervuld'].fillna(df['Intern vervuld'])
-        df['Sluitdatum'] = df['Vervuldatum'].fillna(df['Niet vervuld']).fillna(df['Ingetrokken'])
-        
-        return df
-    
-    except Exception as e:
-        st.error(f"Fout bij het laden van data: {str(e)}")
-        return None
-
-def get_date_range_from_data(df):
-    """Bepaalt de datum range van de dataset"""
-    date_columns = ['Datum aanmaak', 'Startdatum intern', 'Startdatum extern']
-    all_dates = []
-    
-    for col in date_columns:
-        if col in df.columns:
-            valid_dates = df[col].dropna()
-            all_dates.extend(valid_dates.tolist())
-    
-    if all_dates:
-        min_date = min(all_dates).date()
-        max_date = max(all_dates).date()
-        return min_date, max_date
-    
-    return date.today() - timedelta(days=365), date.today()
-
-def filter_data_by_date_range(df, start_date, end_date):
-    """Filtert data op basis van geselecteerde datum range"""
-    start_date = pd.Timestamp(start_date)
-    end_date = pd.Timestamp(end_date)
-    
-    # Filter op aanmaakdatum
-    mask = (df['Datum aanmaak'] >= start_date) & (df['Datum aanmaak'] <= end_date)
-    return df[mask].copy()
-
-def calculate_metrics(df, start_date, end_date):
-    """Berekent key metrics voor de geselecteerde periode"""
-    total_vacatures = len(df)
-    vervulde_vacatures = len(df[df['Status vacature'].isin(['Extern vervuld', 'Intern vervuld'])])
-    openstaande_vacatures = len(df[df['Status vacature'].isin(['Publicatie in- en extern', 'In procedure', 'Publicatie intern'])])
-    niet_vervulde_vacatures = len(df[df['Status vacature'] == 'Niet vervuld'])
-    
-    fill_rate = (vervulde_vacatures / total_vacatures * 100) if total_vacatures > 0 else 0
-    
-    # Nieuwe vacatures in periode
-    periode_start = pd.Timestamp(start_date)
-    periode_end = pd.Timestamp(end_date)
-    nieuwe_vacatures = len(df[(df['Datum aanmaak'] >= periode_start) & (df['Datum aanmaak'] <= periode_end)])
-    
-    # Gesloten vacatures in periode (vervuld of niet vervuld)
-    gesloten_in_periode = len(df[
-        ((df['Vervuldatum'] >= periode_start) & (df['Vervuldatum'] <= periode_end)) |
-        ((df['Niet vervuld'] >= periode_start) & (df['Niet vervuld'] <= periode_end)) |
-        ((df['Ingetrokken'] >= periode_start) & (df['Ingetrokken'] <= periode_end))
-    ])
-    
-    return {
-        'total_vacatures': total_vacatures,
-        'vervulde_vacatures': vervulde_vacatures,
-        'openstaande_vacatures': openstaande_vacatures,
-        'niet_vervulde_vacatures': niet_vervulde_vacatures,
-        'fill_rate': fill_rate,
-        'nieuwe_vacatures': nieuwe_vacatures,
-        'gesloten_vacatures': gesloten_in_periode
-    }
-
-def create_daily_activity_chart(df, start_date, end_date):
-    """Maakt dagelijkse activiteit chart"""
-    periode_start = pd.Timestamp(start_date)
-    periode_end = pd.Timestamp(end_date)
-    
-    # Maak datum range
-    date_range = pd.date_range(start=periode_start, end=periode_end, freq='D')
-    daily_data = pd.DataFrame({'Datum': date_range})
-    
-    # Tel nieuwe vacatures per dag
-    nieuwe_per_dag = df.groupby(df['Datum aanmaak'].dt.date).size().reset_index()
-    nieuwe_per_dag.columns = ['Datum', 'Nieuwe_Vacatures']
-    nieuwe_per_dag['Datum'] = pd.to_datetime(nieuwe_per_dag['Datum'])
-    
-    # Tel gesloten vacatures per dag
-    gesloten_data = []
-    for _, row in df.iterrows():
-        if pd.notna(row['Vervuldatum']):
-            gesloten_data.append({'Datum': row['Vervuldatum'].date(), 'Type': 'Vervuld'})
-        elif pd.notna(row['Niet vervuld']):
-            gesloten_data.append({'Datum': row['Niet vervuld'].date(), 'Type': 'Niet vervuld'})
-        elif pd.notna(row['Ingetrokken']):
-            gesloten_data.append({'Datum': row['Ingetrokken'].date(), 'Type': 'Ingetrokken'})
-    
-    if gesloten_data:
-        gesloten_df = pd.DataFrame(gesloten_data)
-        gesloten_df['Datum'] = pd.to_datetime(gesloten_df['Datum'])
-        gesloten_per_dag = gesloten_df.groupby('Datum').size().reset_index()
-        gesloten_per_dag.columns = ['Datum', 'Gesloten_Vacatures']
-    else:
-        gesloten_per_dag = pd.DataFrame(columns=['Datum', 'Gesloten_Vacatures'])
-    
-    # Merge data
-    daily_data = daily_data.merge(nieuwe_per_dag, on='Datum', how='left')
-    daily_data = daily_data.merge(gesloten_per_dag, on='Datum', how='left')
-    daily_data = daily_data.fillna(0)
-    
-    # Filter op periode
-    daily_data = daily_data[(daily_data['Datum'] >= periode_start) & (daily_data['Datum'] <= periode_end)]
-    
-    fig = go.Figure()
-    
-    fig.add_trace(go.Scatter(
-        x=daily_data['Datum'],
-        y=daily_data['Nieuwe_Vacatures'],
-        mode='lines+markers',
-        name='Nieuwe Vacatures',
-        line=dict(color='blue'),
-        fill='tonexty'
-    ))
-    
-    fig.add_trace(go.Scatter(
-        x=daily_data['Datum'],
-        y=daily_data['Gesloten_Vacatures'],
-        mode='lines+markers',
-        name='Gesloten Vacatures',
-        line=dict(color='green'),
-        fill='tonexty'
-    ))
-    
-    fig.update_layout(
-        title=f'Dagelijkse Vacature Activiteit ({start_date} - {end_date})',
-        xaxis_title='Datum',
-        yaxis_title='Aantal Vacatures',
-        height=400,
-        hovermode='x unified'
-    )
-    
-    return fig
-
-def create_status_chart(df):
-    """Maakt status verdeling chart"""
-    status_counts = df['Status vacature'].value_counts()
-    
-    # Kleurenschema
-    colors = {
-        'Extern vervuld': '#2ca02c',
-        'Intern vervuld': '#17becf',
-        'Niet vervuld': '#d62728',
-        'Publicatie in- en extern': '#ff7f0e',
-        'In procedure': '#ffbb78',
-        'Ingetrokken': '#c7c7c7'
-    }
-    
-    fig = px.pie(
-        values=status_counts.values,
-        names=status_counts.index,
-        title="Verdeling Vacaturestatus",
-        color=status_counts.index,
-        color_discrete_map=colors
-    )
-    
-    fig.update_traces(textposition='inside', textinfo='percent+label')
-    fig.update_layout(height=400)
-    
-    return fig
-
-def create_vacature_performance_table(df):
-    """Maakt gedetailleerde vacature performance tabel"""
-    performance_data = []
-    
-    for _, row in df.iterrows():
-        # Bereken doorlooptijd
-        doorlooptijd = None
-        if pd.notna(row['Sluitdatum']) and pd.notna(row['Datum aanmaak']):
-            doorlooptijd = (row['Sluitdatum'] - row['Datum aanmaak']).days
-        
-        # Bepaal conversie rate
-        totaal_reacties = row['Aantal reacties'] if pd.notna(row['Aantal reacties']) else 0
-        aangenomen = 1 if row['Status vacature'] in ['Extern vervuld', 'Intern vervuld'] else 0
-        conversie_rate = (aangenomen / totaal_reacties * 100) if totaal_reacties > 0 else 0
-        
-        # Bepaal status categorie
-        status_categorie = 'Actief'
-        if row['Status vacature'] in ['Extern vervuld', 'Intern vervuld']:
-            status_categorie = 'Vervuld'
-        elif row['Status vacature'] in ['Niet vervuld', 'Ingetrokken']:
-            status_categorie = 'Gesloten'
-        
-        performance_data.append({
-            'Vacature': row['Functie'][:50] + '...' if len(str(row['Functie'])) > 50 else row['Functie'],
-            'Status': row['Status vacature'],
-            'Status_Categorie': status_categorie,
-            'Recruiter': row['Eigenaar'],
-            'Aanmaakdatum': row['Datum aanmaak'].strftime('%d-%m-%Y') if pd.notna(row['Datum aanmaak']) else 'Onbekend',
-            'Sluitdatum': row['Sluitdatum'].strftime('%d-%m-%Y') if pd.notna(row['Sluitdatum']) else '-',
-            'Doorlooptijd': f"{doorlooptijd} dagen" if doorlooptijd is not None else '-',
-            'Totaal_Reacties': int(totaal_reacties),
-            'Conversie_Rate': f"{conversie_rate:.1f}%" if totaal_reacties > 0 else '-',
-            'Locatie': row['Locatie'] if 'Locatie' in row and pd.notna(row['Locatie']) else 'Onbekend'
-        })
-    
-    return pd.DataFrame(performance_data)
-
-def create_recruitment_performance_chart(df):
-    """Maakt recruitment performance chart (inclusief afdeling)"""
-    # Filter alleen actieve recruiters
-    df_clean = df[df['Eigenaar'].notna() & (df['Eigenaar'] != ' ') & (df['Eigenaar'] != '')]
-    
-    recruiter_stats = df_clean.groupby(['Eigenaar', 'Afdeling']).agg({
-        'Functie': 'count',
-        'Aantal reacties': 'sum'
-    }).rename(columns={'Functie': 'Totaal_Vacatures'})
-    
-    # Flatten multi-index
-    recruiter_stats = recruiter_stats.reset_index()
-    
-    # Bereken vervulde vacatures
-    vervulde_per_recruiter = df_clean[df_clean['Status vacature'].isin(['Extern vervuld', 'Intern vervuld'])].groupby(['Eigenaar', 'Afdeling']).size().reset_index(name='Vervulde_Vacatures')
-    
-    # Merge data
-    recruiter_stats = recruiter_stats.merge(vervulde_per_recruiter, on=['Eigenaar', 'Afdeling'], how='left')
-    recruiter_stats['Vervulde_Vacatures'] = recruiter_stats['Vervulde_Vacatures'].fillna(0)
-    recruiter_stats['Fill_Rate'] = (recruiter_stats['Vervulde_Vacatures'] / recruiter_stats['Totaal_Vacatures'] * 100).round(1)
-    recruiter_stats['Gem_Reacties'] = (recruiter_stats['Aantal reacties'] / recruiter_stats['Totaal_Vacatures']).round(1)
-    
-    # Combineer naam en afdeling voor display
-    recruiter_stats['Display_Name'] = recruiter_stats['Eigenaar'] + ' (' + recruiter_stats['Afdeling'].fillna('Onbekend') + ')'
-    
-    # Filter recruiters met minimaal 3 vacatures voor relevantie
-    recruiter_stats = recruiter_stats[recruiter_stats['Totaal_Vacatures'] >= 3].sort_values('Totaal_Vacatures', ascending=True)
-    
-    fig = make_subplots(
-        rows=1, cols=2,
-        subplot_titles=('Aantal Vacatures per Recruiter', 'Fill Rate per Recruiter'),
-        specs=[[{"secondary_y": False}, {"secondary_y": False}]]
-    )
-    
-    # Aantal vacatures
-    fig.add_trace(
-        go.Bar(
-            y=recruiter_stats['Display_Name'],
-            x=recruiter_stats['Totaal_Vacatures'],
-            name='Totaal Vacatures',
-            orientation='h',
-            marker_color='lightblue',
-            text=recruiter_stats['Totaal_Vacatures'],
-            textposition='auto'
-        ),
-        row=1, col=1
-    )
-    
-    # Fill rate
-    fig.add_trace(
-        go.Bar(
-            y=recruiter_stats['Display_Name'],
-            x=recruiter_stats['Fill_Rate'],
-            name='Fill Rate (%)',
-            orientation='h',
-            marker_color='lightgreen',
-            text=[f"{x:.1f}%" for x in recruiter_stats['Fill_Rate']],
-            textposition='auto'
-        ),
-        row=1, col=2
-    )
-    
-    fig.update_layout(height=max(400, len(recruiter_stats) * 35), showlegend=False)
-    fig.update_xaxes(title_text="Aantal Vacatures", row=1, col=1)
-    fig.update_xaxes(title_text="Fill Rate (%)", row=1, col=2)
-    
-    return fig, recruiter_stats
-
-def create_detailed_vacature_analysis(df):
-    """Maakt gedetailleerde vacature analyse met kandidaat metrics"""
-    analysis_data = []
-    
-    for _, row in df.iterrows():
-        # Basis informatie
-        vacature_naam = row['Functie'][:50] + '...' if len(str(row['Functie'])) > 50 else row['Functie']
-        
-        # Totaal kandidaten
-        totaal_kandidaten = row['Aantal reacties'] if pd.notna(row['Aantal reacties']) else 0
-        
-        # Gesprekken (gesprek gevoerd)
-        gesprekken = row['Aantal in status: Gesprek gevoerd'] if pd.notna(row['Aantal in status: Gesprek gevoerd']) else 0
-        
-        # Afwijzingen
-        afgewezen_na_brief = row['Aantal in status: Afgewezen na briefselectie'] if pd.notna(row['Aantal in status: Afgewezen na briefselectie']) else 0
-        afgewezen_na_gesprek = row['Aantal in status: Afgewezen na gesprek'] if pd.notna(row['Aantal in status: Afgewezen na gesprek']) else 0
-        
-        # Aangenomen
-        aangenomen = row['Aantal in status: Aangenomen'] if pd.notna(row['Aantal in status: Aangenomen']) else 0
-        
-        # Bereken rates
-        gesprek_rate = (gesprekken / totaal_kandidaten * 100) if totaal_kandidaten > 0 else 0
-        hire_rate = (aangenomen / totaal_kandidaten * 100) if totaal_kandidaten > 0 else 0
-        
-        analysis_data.append({
-            'Vacature': vacature_naam,
-            'Recruiter': row['Eigenaar'],
-            'Afdeling': row['Afdeling'] if pd.notna(row['Afdeling']) else 'Onbekend',
-            'Status': row['Status vacature'],
-            'Totaal_Kandidaten': int(totaal_kandidaten),
-            'Gesprekken': int(gesprekken),
-            'Afgewezen_na_Brief': int(afgewezen_na_brief),
-            'Afgewezen_na_Gesprek': int(afgewezen_na_gesprek),
-            'Aangenomen': int(aangenomen),
-            'Gesprek_Rate': f"{gesprek_rate:.1f}%",
-            'Hire_Rate': f"{hire_rate:.1f}%",
-            'Aanmaakdatum': row['Datum aanmaak'].strftime('%d-%m-%Y') if pd.notna(row['Datum aanmaak']) else 'Onbekend'
-        })
-    
-    return pd.DataFrame(analysis_data)
-
-def create_afdeling_summary(df):
-    """Maakt samenvatting per afdeling"""
-    if 'Afdeling' not in df.columns:
-        return pd.DataFrame()
-    
-    df_clean = df[df['Afdeling'].notna()]
-    
-    afdeling_stats = df_clean.groupby('Afdeling').agg({
-        'Functie': 'count',
-        'Aantal reacties': 'sum',
-        'Eigenaar': 'nunique'
-    }).rename(columns={
-        'Functie': 'Totaal_Vacatures',
-        'Eigenaar': 'Aantal_Recruiters'
-    })
-    
-    # Vervulde vacatures per afdeling
-    vervulde_per_afdeling = df_clean[df_clean['Status vacature'].isin(['Extern vervuld', 'Intern vervuld'])].groupby('Afdeling').size()
-    afdeling_stats['Vervulde_Vacatures'] = vervulde_per_afdeling.fillna(0)
-    afdeling_stats['Fill_Rate'] = (afdeling_stats['Vervulde_Vacatures'] / afdeling_stats['Totaal_Vacatures'] * 100).round(1)
-    afdeling_stats['Gem_Reacties_per_Vacature'] = (afdeling_stats['Aantal reacties'] / afdeling_stats['Totaal_Vacatures']).round(1)
-    
-    return afdeling_stats.reset_index().sort_values('Totaal_Vacatures', ascending=False)
-
-def create_channel_analysis(df):
-    """Analyseert wervingskanalen"""
-    channels = ['V&VN', 'Indeed', 'Infopuntzorg', 'Zorgselect', 'Facebook', 
-               'Linkedin', 'Twitter', 'Instagram', 'Via medewerker van SEIN', 'Anders']
-    
-    channel_data = []
-    
-    for channel in channels:
-        total_col = f'Totaal per wervingskanaal: {channel}'
-        hire
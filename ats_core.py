@@ -0,0 +1,1304 @@
+"""Kern van het ATS dashboard zonder Streamlit: inlezen, cleaning, anonimisering en aggregaten.
+
+Alles in deze module werkt zonder UI, zodat dezelfde berekeningen in het dashboard,
+de benchmarks en de headless rapportage (ats_report.py) gebruikt worden.
+"""
+import pandas as pd
+from datetime import datetime, date, timedelta
+from concurrent.futures import ProcessPoolExecutor
+from collections import deque
+from functools import lru_cache, wraps
+from contextlib import contextmanager
+import codecs
+import contextvars
+import hashlib
+import json
+import multiprocessing
+import os
+import threading
+import time
+import tracemalloc
+import io
+import html
+import re
+import numpy as np
+
+# Versie van de verwerkingspipeline. Verhoog bij elke wijziging in cleaning,
+# anonimisering of datumconversie zodat oude cache entries niet hergebruikt worden.
+PIPELINE_VERSION = "7"
+
+# Maximaal aantal unieke teksten waarvan de cleaning resultaten onthouden worden
+HTML_CLEAN_CACHE_SIZE = 65536
+
+# Exports worden in chunks van dit aantal rijen ingelezen en verwerkt
+INGEST_CHUNK_ROWS = int(os.environ.get('ATS_CHUNK_ROWS', 50000))
+# Aantal worker processen dat chunks parallel verwerkt (1 = serieel); standaard de CPU's, maximaal 4
+INGEST_WORKERS = int(os.environ.get('ATS_INGEST_WORKERS', min(4, os.cpu_count() or 1)))
+
+# tracemalloc is proces-breed: profilers van gelijktijdige sessies delen hem via een teller,
+# zodat alleen de laatste hem stopt (en alleen als een profiler hem gestart heeft)
+_TRACEMALLOC_LOCK = threading.Lock()
+_tracemalloc_users = 0
+_tracemalloc_started = False
+
+def _acquire_tracemalloc():
+    global _tracemalloc_users, _tracemalloc_started
+    with _TRACEMALLOC_LOCK:
+        if _tracemalloc_users == 0 and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            _tracemalloc_started = True
+        _tracemalloc_users += 1
+
+def _release_tracemalloc():
+    global _tracemalloc_users, _tracemalloc_started
+    with _TRACEMALLOC_LOCK:
+        _tracemalloc_users -= 1
+        if _tracemalloc_users == 0 and _tracemalloc_started:
+            tracemalloc.stop()
+            _tracemalloc_started = False
+
+class StageProfiler:
+    """Meet per benoemde stap de duur, het aantal verwerkte rijen en het piekgeheugen
+
+    Het piekgeheugen komt uit tracemalloc en is proces-breed: gelijktijdige sessies en
+    ingest threads tellen mee en zetten elkaars piek terug.
+    """
+    
+    def __init__(self):
+        self.records = []
+        self.started = datetime.now().isoformat(timespec='seconds')
+        self.context = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._closed = False
+        _acquire_tracemalloc()
+    
+    @contextmanager
+    def stage(self, name, rows=None):
+        # Per thread een stapel open stappen, zodat geneste stappen de piek van hun ouder niet kwijtraken
+        stack = self._local.__dict__.setdefault('stack', [])
+        with _TRACEMALLOC_LOCK:
+            current, peak = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+        if stack:
+            stack[-1]['peak'] = max(stack[-1]['peak'], peak)
+        entry = {'start_memory': current, 'peak': 0}
+        stack.append(entry)
+        info = {'rows': rows}
+        start = time.perf_counter()
+        try:
+            yield info
+        finally:
+            seconds = time.perf_counter() - start
+            entry['peak'] = max(entry['peak'], tracemalloc.get_traced_memory()[1])
+            stack.pop()
+            if stack:
+                stack[-1]['peak'] = max(stack[-1]['peak'], entry['peak'])
+            with self._lock:
+                self.records.append({
+                    'stap': name,
+                    'seconden': seconds,
+                    'rijen': info['rows'],
+                    'piek_mb': max(entry['peak'] - entry['start_memory'], 0) / 1024 / 1024,
+                    'thread': threading.current_thread().name
+                })
+    
+    def summary(self):
+        """Totalen per stap in volgorde van eerste meting"""
+        if not self.records:
+            return pd.DataFrame(columns=['Stap', 'Aanroepen', 'Tijd (ms)', 'Rijen', 'Piek geheugen (MB)'])
+        records = pd.DataFrame(self.records)
+        summary = records.groupby('stap', sort=False).agg(
+            Aanroepen=('stap', 'size'),
+            Tijd=('seconden', 'sum'),
+            Rijen=('rijen', 'sum'),
+            Piek=('piek_mb', 'max')
+        ).reset_index()
+        summary['Tijd'] = (summary['Tijd'] * 1000).round(1)
+        summary['Piek'] = summary['Piek'].round(1)
+        summary['Rijen'] = summary['Rijen'].astype('int64')
+        return summary.rename(columns={'stap': 'Stap', 'Tijd': 'Tijd (ms)', 'Piek': 'Piek geheugen (MB)'})
+    
+    def to_json_lines(self):
+        return ''.join(
+            json.dumps({'run': self.started, **self.context, **record}, ensure_ascii=False) + '\n'
+            for record in self.records
+        )
+    
+    def add_records(self, records):
+        """Voegt metingen toe die elders gemaakt zijn, zoals in een worker proces"""
+        with self._lock:
+            self.records.extend(records)
+    
+    def close(self):
+        if not self._closed:
+            self._closed = True
+            _release_tracemalloc()
+
+# Profiler van de huidige run (None = profiling uit); wordt meegegeven aan achtergrond threads
+ACTIVE_PROFILER = contextvars.ContextVar('active_profiler', default=None)
+
+@contextmanager
+def profile_stage(name, rows=None):
+    """Meet een stap met de actieve profiler, of doet niets als profiling uit staat"""
+    profiler = ACTIVE_PROFILER.get()
+    if profiler is None:
+        yield {'rows': rows}
+        return
+    with profiler.stage(name, rows) as info:
+        yield info
+
+def profiled(name):
+    """Decorator die een analyse- of figuurfunctie als stap meet, met de rijen van het eerste DataFrame argument"""
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if ACTIVE_PROFILER.get() is None:
+                return func(*args, **kwargs)
+            frames = [arg for arg in (*args, *kwargs.values()) if isinstance(arg, pd.DataFrame)]
+            with profile_stage(name, len(frames[0]) if frames else None) as info:
+                result = func(*args, **kwargs)
+                # Zonder DataFrame argument (zoals bij het inlezen) tellen de rijen van het resultaat
+                if info['rows'] is None and isinstance(result, pd.DataFrame):
+                    info['rows'] = len(result)
+                return result
+        return wrapper
+    return decorator
+
+def submit_with_context(executor, func, *args):
+    """executor.submit met de contextvars (zoals de actieve profiler) van de aanroepende thread"""
+    return executor.submit(contextvars.copy_context().run, func, *args)
+
+# Extra cleanup voor veelvoorkomende encoding issues
+HTML_ENTITY_REPLACEMENTS = {
+    '&ouml;': 'ö',
+    '&euml;': 'ë', 
+    '&uuml;': 'ü',
+    '&auml;': 'ä',
+    '&iuml;': 'ï',
+    '&eacute;': 'é',
+    '&egrave;': 'è',
+    '&aacute;': 'á',
+    '&agrave;': 'à',
+    '&uacute;': 'ú',
+    '&ugrave;': 'ù',
+    '&oacute;': 'ó',
+    '&ograve;': 'ò',
+    '&iacute;': 'í',
+    '&igrave;': 'ì',
+    '&ccedil;': 'ç',
+    '&ntilde;': 'ñ',
+    '&amp;': '&',
+    '&quot;': '"',
+    '&lt;': '<',
+    '&gt;': '>',
+    '&nbsp;': ' '
+}
+
+HTML_TAG_PATTERN = re.compile(r'<[^>]+>')
+
+def clean_html_entities(text):
+    """Converteert HTML entities naar normale tekst"""
+    if pd.isna(text) or not isinstance(text, str):
+        return text
+    
+    # HTML entities decoderen
+    text = html.unescape(text)
+    
+    for entity, char in HTML_ENTITY_REPLACEMENTS.items():
+        text = text.replace(entity, char)
+    
+    # Remove HTML tags
+    text = HTML_TAG_PATTERN.sub('', text)
+    
+    return text
+
+@lru_cache(maxsize=HTML_CLEAN_CACHE_SIZE)
+def clean_html_text(text):
+    """Gecachte variant van clean_html_entities voor één unieke string"""
+    return clean_html_entities(text)
+
+def clean_html_column(series):
+    """Cleant HTML entities per unieke waarde in plaats van per cel"""
+    if not (pd.api.types.is_object_dtype(series) or pd.api.types.is_string_dtype(series)):
+        return series
+    
+    codes, uniques = pd.factorize(series)
+    unique_values = pd.Series(np.asarray(uniques, dtype=object), dtype=object)
+    
+    # Alleen waarden met '&' of '<' kunnen veranderen; de rest blijft ongemoeid
+    needs_cleaning = unique_values.str.contains('[&<]', regex=True, na=False).to_numpy(dtype=bool)
+    if not needs_cleaning.any():
+        return series
+    
+    cleaned = unique_values.to_numpy(dtype=object).copy()
+    cleaned[needs_cleaning] = [clean_html_text(value) for value in cleaned[needs_cleaning]]
+    
+    # Map de schone unieke waarden terug naar de rijen; lege cellen blijven zoals ze waren
+    result = cleaned.take(codes)
+    missing = codes == -1
+    result[missing] = series.to_numpy(dtype=object)[missing]
+    
+    return pd.Series(result, index=series.index, name=series.name, dtype=series.dtype)
+
+# Alles behalve letters en gangbare naamtekens wordt uit voornamen verwijderd
+NAME_CHARACTER_PATTERN = re.compile(r'[^a-zA-ZàáâãäåæçèéêëìíîïðñòóôõöøùúûüýþÿĀāĂăĄąĆćĈĉĊċČčĎďĐđĒēĔĕĖėĘęĚěĜĝĞğĠġĢģĤĥĦħĨĩĪīĬĭĮįİıĲĳĴĵĶķĸĹĺĻļĽľĿŀŁłŃńŅņŇňŉŊŋŌōŎŏŐőŒœŔŕŖŗŘřŚśŜŝŞşŠšŢţŤťŦŧŨũŪūŬŭŮůŰűŲųŴŵŶŷŸŹźŻżŽž\-\'\.]')
+
+def anonymize_name(name):
+    """Extract first name only for GDPR compliance"""
+    if pd.isna(name) or not isinstance(name, str) or name.strip() == '':
+        return name
+    
+    # Clean HTML entities first
+    name = clean_html_text(name)
+    
+    # Extract first word (first name)
+    first_name = name.split()[0] if name.split() else name
+    
+    # Remove any remaining special characters but keep letters and common name characters
+    first_name = NAME_CHARACTER_PATTERN.sub('', first_name)
+    
+    return first_name if first_name else 'Anoniem'
+
+def anonymize_name_column(series):
+    """Anonimiseert alleen de unieke namen en geeft een category kolom terug"""
+    codes, uniques = pd.factorize(series)
+    anonymized = [anonymize_name(name) for name in uniques]
+    
+    # Meerdere volledige namen kunnen dezelfde voornaam opleveren: factoriseer opnieuw
+    name_codes, categories = pd.factorize(pd.Series(anonymized, dtype=object))
+    # Lege cellen (code -1) wijzen naar de toegevoegde -1 en blijven leeg
+    row_codes = np.append(name_codes, -1)[codes]
+    
+    anonymized_column = pd.Categorical.from_codes(row_codes, categories=categories)
+    return pd.Series(anonymized_column, index=series.index, name=series.name)
+
+# Gevoelige kolommen die nooit in het dashboard terecht mogen komen
+HIGH_RISK_COLUMNS = [
+    'Mobiel', 'E-mail', 'E-mail werk', 'Gekoppelde kandidaten',
+    'Contactpersoon telefoonnummer', 'Contactpersoon e-mail',
+    'Tweede contactpersoon telefoonnummer', 'Tweede contactpersoon e-mail'
+]
+
+# Naamkolommen die tot alleen de voornaam worden teruggebracht
+MEDIUM_RISK_COLUMNS = [
+    'Eigenaar', 'Vacaturehouder', 'HR-adviseur', 'Eigenaar afdeling',
+    'Selectiecommissielid 1', 'Selectiecommissielid 2', 'Selectiecommissielid 3',
+    'Contactpersoon voor sollicitanten', 'Tweede contactpersoon voor sollicitanten'
+]
+
+def apply_gdpr_compliance(df):
+    """Applies GDPR compliance by removing sensitive data and anonymizing names (per chunk, zonder meldingen)"""
+    # 🔴 REMOVE HIGH RISK COLUMNS (FALLBACK - always remove if present)
+    removed_columns = [col for col in HIGH_RISK_COLUMNS if col in df.columns]
+    df_clean = df.drop(columns=removed_columns) if removed_columns else df
+    
+    # 🟡 ANONYMIZE MEDIUM RISK COLUMNS (first name only)
+    anonymized_columns = [col for col in MEDIUM_RISK_COLUMNS if col in df_clean.columns and df_clean[col].notna().any()]
+    run_column_jobs(anonymize_name_column, df_clean, MEDIUM_RISK_COLUMNS, "Anonimiseren")
+    
+    return df_clean, removed_columns, anonymized_columns
+
+def get_predefined_periods():
+    """Definieert standaard periode opties"""
+    today = date.today()
+    
+    periods = {
+        "Laatste 7 dagen": (today - timedelta(days=7), today),
+        "Laatste 14 dagen": (today - timedelta(days=14), today),
+        "Laatste 30 dagen": (today - timedelta(days=30), today),
+        "Laatste 90 dagen": (today - timedelta(days=90), today),
+        "Huidige maand": (today.replace(day=1), today),
+        "Vorige maand": get_previous_month_range(today),
+        "Huidige kwartaal": get_current_quarter_range(today),
+        "Huidige kalenderjaar": (date(today.year, 1, 1), today),
+        "Laatste jaar": (today - timedelta(days=365), today),
+        "Aangepast": None  # Voor custom date selection
+    }
+    
+    return periods
+
+def get_previous_month_range(current_date):
+    """Berekent vorige maand periode"""
+    if current_date.month == 1:
+        start = date(current_date.year - 1, 12, 1)
+        end = date(current_date.year, 1, 1) - timedelta(days=1)
+    else:
+        start = date(current_date.year, current_date.month - 1, 1)
+        if current_date.month == 2:
+            end = date(current_date.year, 2, 1) - timedelta(days=1)
+        else:
+            end = date(current_date.year, current_date.month, 1) - timedelta(days=1)
+    return start, end
+
+def get_current_quarter_range(current_date):
+    """Berekent huidige kwartaal periode"""
+    quarter = (current_date.month - 1) // 3 + 1
+    start_month = 3 * (quarter - 1) + 1
+    start = date(current_date.year, start_month, 1)
+    return start, current_date
+
+def compute_data_hash(data):
+    """Content hash van de geüploade bytes plus de pipeline versie"""
+    hasher = hashlib.blake2b(digest_size=20)
+    hasher.update(PIPELINE_VERSION.encode())
+    hasher.update(data)
+    return hasher.hexdigest()
+
+def detect_encoding(data, chunk_size=1024 * 1024):
+    """Bepaalt de encoding van de bytes via BOM of strikte validatie, zonder te parsen"""
+    if data.startswith(codecs.BOM_UTF8):
+        return 'utf-8-sig', 'BOM'
+    if data.startswith((codecs.BOM_UTF16_LE, codecs.BOM_UTF16_BE)):
+        return 'utf-16', 'BOM'
+    
+    # Valideer in blokken zodat er nooit een volledige tekstkopie in geheugen staat
+    view = memoryview(data)
+    for encoding in ['utf-8', 'cp1252']:
+        decoder = codecs.getincrementaldecoder(encoding)()
+        try:
+            for start in range(0, len(view), chunk_size):
+                decoder.decode(view[start:start + chunk_size])
+            decoder.decode(b'', final=True)
+            return encoding, 'gevalideerd'
+        except UnicodeDecodeError:
+            continue
+    
+    # Latin-1 (ISO-8859-1) kan elke byte decoderen
+    return 'latin-1', 'fallback'
+
+# Mogelijke namen van de kolom met het vacaturenummer, in volgorde van voorkeur
+VACANCY_KEY_COLUMNS = ['Vacaturenummer', 'Vacature ID', 'Vacaturenr', 'Vacature nummer']
+
+# Inleesschema: alleen kolommen die het dashboard gebruikt worden ingelezen
+TEXT_COLUMNS = VACANCY_KEY_COLUMNS + ['Functie', 'Functietitel', 'Status vacature', 'Eigenaar',
+                                      'Afdeling', 'Eigenaar afdeling', 'Locatie']
+CATEGORY_COLUMNS = ['Status vacature', 'Eigenaar', 'Afdeling', 'Eigenaar afdeling', 'Locatie', 'Functie']
+DATE_COLUMNS = ['Datum aanmaak', 'Startdatum intern', 'Einddatum intern',
+                'Startdatum extern', 'Einddatum extern']
+STATUS_DATE_COLUMNS = [
+    'Nieuw', 'Intake', 'Tekst bij vacaturehouder', 'Tekst akkoord',
+    'Publicatie intern', 'Publicatie in- en extern', 'In procedure',
+    'Intern vervuld', 'Extern vervuld', 'Ingetrokken', 'Niet vervuld'
+]
+COUNT_COLUMN_PATTERN = re.compile(r'^(Aantal reacties|Aantal in status: .+|Totaal per wervingskanaal.*:.+)$')
+SMALL_INT_DTYPES = ['Int8', 'Int16', 'Int32', 'Int64']
+
+def build_ingest_plan(columns):
+    """Bepaalt per kolom uit de header of en als welk type hij ingelezen wordt"""
+    usecols = []
+    dtypes = {}
+    count_columns = []
+    high_risk_columns = []
+    for raw_col in columns:
+        col = raw_col.strip()
+        if col in HIGH_RISK_COLUMNS:
+            # Gevoelige kolommen worden nooit ingelezen
+            high_risk_columns.append(col)
+            continue
+        if col in TEXT_COLUMNS or col in DATE_COLUMNS or col in STATUS_DATE_COLUMNS:
+            # Datums als tekst inlezen; ze worden daarna met een vast formaat geparsed
+            dtypes[raw_col] = str
+        elif COUNT_COLUMN_PATTERN.match(col):
+            count_columns.append(col)
+        else:
+            continue
+        usecols.append(raw_col)
+    return usecols, dtypes, count_columns, high_risk_columns
+
+def to_small_int(series):
+    """Zet een aantal-kolom om naar het kleinste nullable integer type waar de waarden in passen"""
+    values = pd.to_numeric(series, errors='coerce').round()
+    if values.notna().any():
+        low, high = values.min(), values.max()
+    else:
+        low, high = 0, 0
+    for dtype in SMALL_INT_DTYPES:
+        info = np.iinfo(dtype.lower())
+        if info.min <= low and high <= info.max:
+            return values.astype(dtype)
+    return values
+
+# Lege datums in de export ("0000-00-00") en datums in 1900 betekenen geen datum
+DATE_SENTINELS = ['0000-00-00', '00-00-0000']
+DATE_FORMAT = '%d-%m-%Y'
+
+@profiled("Datums parsen")
+def parse_date_values(df, columns):
+    """Parseert alle datumkolommen in één keer over de gestapelde unieke datumstrings"""
+    columns = [col for col in columns if col in df.columns]
+    if not columns:
+        return {}
+    
+    # Elke unieke datumstring wordt één keer geparsed, ongeacht in hoeveel kolommen hij staat
+    stacked = np.concatenate([df[col].to_numpy(dtype=object) for col in columns])
+    codes, unique_strings = pd.factorize(stacked)
+    unique_strings = pd.Series(unique_strings, dtype=object)
+    parsed = pd.to_datetime(unique_strings, format=DATE_FORMAT, errors='coerce')
+    
+    is_sentinel = unique_strings.str.strip().isin(DATE_SENTINELS) | (parsed.dt.year == 1900)
+    parsed[is_sentinel] = pd.NaT
+    
+    # Code -1 (lege cel) wijst naar de NaT achteraan
+    parsed_values = parsed.to_numpy()
+    dates = np.append(parsed_values, np.array(['NaT'], dtype=parsed_values.dtype))[codes]
+    return {col: dates[i * len(df):(i + 1) * len(df)] for i, col in enumerate(columns)}
+
+def count_values(series):
+    """value_counts zonder de lege categorieën van een categorische kolom"""
+    counts = series.value_counts()
+    if isinstance(counts.index, pd.CategoricalIndex):
+        counts = counts[counts > 0]
+        counts.index = counts.index.astype(counts.index.categories.dtype)
+    return counts
+
+@lru_cache(maxsize=None)
+def get_ingest_executor(workers):
+    """Gedeelde pool met worker processen die hele chunks verwerken (None bij één worker: serieel)
+
+    De cleaning is Python code die de GIL vasthoudt, dus alleen aparte processen gebruiken
+    meer cores. Workers worden gestart met 'spawn' zodat ze geen locks of threads van de
+    (Streamlit) server overerven. Spawn voert het hoofdscript opnieuw uit als __mp_main__,
+    dus dat script moet zijn werk achter `if __name__ == "__main__":` zetten (zoals app.py).
+    """
+    if workers <= 1:
+        return None
+    return ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('spawn'))
+
+def run_column_jobs(func, df, columns, stage=None):
+    """Past func toe op elke aanwezige kolom van df"""
+    columns = [col for col in columns if col in df.columns]
+    with profile_stage(stage or func.__name__, len(df)):
+        for col in columns:
+            df[col] = func(df[col])
+    return columns
+
+def to_category(series):
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        return series
+    return series.astype('category')
+
+def process_chunk(chunk, count_columns):
+    """Cleant, anonimiseert en typeert één chunk van de export"""
+    # Data cleaning
+    chunk.columns = chunk.columns.str.strip()
+    
+    # Clean HTML entities in tekst kolommen BEFORE GDPR processing
+    text_columns = ['Functie', 'Functietitel', 'Eigenaar', 'Locatie']
+    run_column_jobs(clean_html_column, chunk, text_columns, "HTML cleaning")
+    
+    # 🔒 APPLY GDPR COMPLIANCE (including fallback removal)
+    chunk, removed_columns, anonymized_columns = apply_gdpr_compliance(chunk)
+    
+    # Aantallen als kleine nullable integers, terugkerende teksten als categorie
+    run_column_jobs(to_small_int, chunk, count_columns, "Aantallen typeren")
+    run_column_jobs(to_category, chunk, CATEGORY_COLUMNS, "Categorieën typeren")
+    
+    # Converteer datums
+    for col, values in parse_date_values(chunk, DATE_COLUMNS + STATUS_DATE_COLUMNS).items():
+        chunk[col] = values
+    
+    return chunk, removed_columns, anonymized_columns
+
+def find_record_end(data, start, target):
+    """Positie na het eerste regeleinde vanaf target dat buiten aanhalingstekens valt (start is een recordgrens)"""
+    end = data.find(b'\n', target)
+    # Bij een oneven aantal aanhalingstekens sinds start staat het regeleinde binnen een veld
+    while end != -1 and data.count(b'"', start, end) % 2 == 1:
+        end = data.find(b'\n', end + 1)
+    return len(data) if end == -1 else end + 1
+
+def split_csv_blocks(data, chunk_size):
+    """Header en (begin, eind) van byteblokken met hele records van ongeveer chunk_size rijen"""
+    header_end = find_record_end(data, 0, 0)
+    sample = data[header_end:header_end + (1 << 20)]
+    row_bytes = len(sample) / max(sample.count(b'\n'), 1)
+    block_bytes = max(int(row_bytes * chunk_size), 1)
+    
+    blocks = []
+    start = header_end
+    while start < len(data):
+        end = find_record_end(data, start, start + block_bytes) if start + block_bytes < len(data) else len(data)
+        blocks.append((start, end))
+        start = end
+    return data[:header_end], blocks
+
+def process_csv_block(header, block, encoding, usecols, dtypes, count_columns, profiling):
+    """Parseert en verwerkt één byteblok van de export in een worker proces
+
+    Geeft het resultaat van process_chunk, de parse tijd en bij profiling de metingen van de stappen terug.
+    """
+    profiler = StageProfiler() if profiling else None
+    token = ACTIVE_PROFILER.set(profiler)
+    try:
+        with profile_stage("CSV lezen") as stage_info:
+            parse_start = time.perf_counter()
+            chunk = pd.read_csv(io.BytesIO(header + block), encoding=encoding, delimiter=';', usecols=usecols, dtype=dtypes)
+            parse_seconds = time.perf_counter() - parse_start
+            stage_info['rows'] = len(chunk)
+        result = process_chunk(chunk, count_columns)
+    finally:
+        ACTIVE_PROFILER.reset(token)
+        if profiler is not None:
+            profiler.close()
+    if profiler is None:
+        return result, parse_seconds, []
+    process_name = multiprocessing.current_process().name
+    return result, parse_seconds, [{**record, 'thread': process_name} for record in profiler.records]
+
+def combine_chunks(chunks):
+    """Voegt verwerkte chunks samen; categorieën worden verenigd in plaats van naar tekst terug te vallen"""
+    if len(chunks) == 1:
+        return chunks[0]
+    
+    columns = chunks[0].columns
+    category_columns = [col for col in columns if isinstance(chunks[0][col].dtype, pd.CategoricalDtype)]
+    combined = pd.concat([chunk.drop(columns=category_columns) for chunk in chunks], ignore_index=True)
+    for col in category_columns:
+        combined[col] = pd.api.types.union_categoricals(
+            [chunk[col].cat.set_categories(chunk[col].cat.categories.astype(object)) for chunk in chunks]
+        )
+    return combined[columns]
+
+@profiled("Inlezen totaal")
+def process_ats_data(data, chunk_size=None, workers=None, on_progress=None):
+    """Laadt en verwerkt de ATS CSV data met GDPR compliance, in chunks van vaste grootte
+
+    on_progress(fractie, rijen) wordt na elke verwerkte chunk aangeroepen. Fouten in de
+    export worden als exceptie doorgegeven; de verwijderde en geanonimiseerde kolommen
+    staan in df.attrs['gdpr'].
+    """
+    chunk_size = chunk_size or INGEST_CHUNK_ROWS
+    workers = workers or INGEST_WORKERS
+    executor = get_ingest_executor(workers)
+    
+    # Bepaal de encoding vooraf zodat het bestand precies één keer geparsed wordt
+    with profile_stage("Encoding detectie"):
+        encoding, encoding_bron = detect_encoding(data)
+    
+    # Header vooraf lezen zodat ongebruikte en gevoelige kolommen niet geparsed worden
+    header = pd.read_csv(io.BytesIO(data), encoding=encoding, delimiter=';', nrows=0).columns
+    usecols, dtypes, count_columns, removed_columns = build_ingest_plan(header)
+    count_columns = [col.strip() for col in count_columns]
+    
+    buffer = io.BytesIO(data)
+    chunks = []
+    anonymized_columns = []
+    parse_seconds = 0.0
+    row_count = 0
+    chunk_count = 0
+    
+    def collect(result):
+        nonlocal row_count, chunk_count
+        chunk, chunk_removed, chunk_anonymized = result
+        chunks.append(chunk)
+        row_count += len(chunk)
+        chunk_count += 1
+        removed_columns.extend(col for col in chunk_removed if col not in removed_columns)
+        anonymized_columns.extend(col for col in chunk_anonymized if col not in anonymized_columns)
+        if on_progress is not None:
+            on_progress(min(buffer.tell() / max(len(data), 1), 1.0), row_count)
+    
+    header_bytes, blocks = split_csv_blocks(data, chunk_size) if executor is not None else (None, [])
+    if len(blocks) > 1:
+        # Worker processen parsen en verwerken elk een blok hele records; alleen bytes gaan erheen
+        # en compacte (categorische) chunks terug. Hooguit twee blokken per worker tegelijk
+        # onderweg, en de resultaten in volgorde van de export.
+        profiler = ACTIVE_PROFILER.get()
+        pending = deque()
+        
+        def collect_oldest():
+            nonlocal parse_seconds
+            block_end, job = pending.popleft()
+            result, block_parse_seconds, records = job.result()
+            parse_seconds += block_parse_seconds
+            if profiler is not None:
+                profiler.add_records(records)
+            buffer.seek(block_end)
+            collect(result)
+        
+        try:
+            for start, end in blocks:
+                pending.append((end, executor.submit(
+                    process_csv_block, header_bytes, data[start:end], encoding, usecols, dtypes,
+                    count_columns, profiler is not None
+                )))
+                if len(pending) >= 2 * workers:
+                    collect_oldest()
+            while pending:
+                collect_oldest()
+        finally:
+            for _, job in pending:
+                job.cancel()
+    else:
+        reader = pd.read_csv(buffer, encoding=encoding, delimiter=';', usecols=usecols, dtype=dtypes, chunksize=chunk_size)
+        while True:
+            with profile_stage("CSV lezen") as stage_info:
+                parse_start = time.perf_counter()
+                chunk = next(reader, None)
+                parse_seconds += time.perf_counter() - parse_start
+                stage_info['rows'] = len(chunk) if chunk is not None else 0
+            if chunk is None:
+                break
+            collect(process_chunk(chunk, count_columns))
+    
+    if not chunks:
+        raise ValueError("De export bevat geen rijen")
+    
+    with profile_stage("Chunks samenvoegen", row_count):
+        df = combine_chunks(chunks)
+    # Losse chunks vrijgeven; de closure houdt de lijst zelf vast
+    chunks.clear()
+    
+    # Bepaal vervuldatum (wanneer vacature werd gesloten)
+    df['Vervuldatum'] = df['Extern vervuld'].fillna(df['Intern vervuld'])
+    df['Sluitdatum'] = df['Vervuldatum'].fillna(df['Niet vervuld']).fillna(df['Ingetrokken'])
+    
+    df.attrs['channel_columns'] = discover_channel_columns(df.columns)
+    df.attrs['gdpr'] = {
+        'verwijderd': removed_columns,
+        'geanonimiseerd': anonymized_columns
+    }
+    df.attrs['ingest'] = {
+        'encoding': encoding,
+        'encoding_bron': encoding_bron,
+        'parse_seconds': parse_seconds,
+        'chunks': chunk_count,
+        'workers': workers,
+        'kolommen_overgeslagen': len(header) - len(usecols),
+        'geheugen_bytes': int(df.memory_usage(deep=True).sum())
+    }
+    
+    return df
+
+def get_date_range_from_data(df):
+    """Bepaalt de datum range van de dataset"""
+    date_columns = ['Datum aanmaak', 'Startdatum intern', 'Startdatum extern']
+    min_dates = []
+    max_dates = []
+    
+    for col in date_columns:
+        if col in df.columns and df[col].notna().any():
+            min_dates.append(df[col].min())
+            max_dates.append(df[col].max())
+    
+    if min_dates:
+        min_date = min(min_dates).date()
+        max_date = max(max_dates).date()
+        return min_date, max_date
+    
+    return date.today() - timedelta(days=365), date.today()
+
+@profiled("Periode filter")
+def filter_data_by_date_range(df, start_date, end_date, event_index=None):
+    """Filtert data op basis van geselecteerde datum range"""
+    if event_index is not None:
+        # Posities direct uit de gesorteerde aanmaakdatums van de event index
+        return df.iloc[event_index.rows_created_between(start_date, end_date)].copy()
+    
+    start_date = pd.Timestamp(start_date)
+    end_date = pd.Timestamp(end_date)
+    
+    # Filter op aanmaakdatum
+    mask = (df['Datum aanmaak'] >= start_date) & (df['Datum aanmaak'] <= end_date)
+    return df[mask].copy()
+
+@profiled("Metrics")
+def calculate_metrics(df, start_date, end_date, event_index=None):
+    """Berekent key metrics voor de geselecteerde periode"""
+    if event_index is None:
+        event_index = DailyEventIndex(df)
+    
+    status_counts = event_index.status_counts
+    total_vacatures = event_index.total_vacatures
+    vervulde_vacatures = int(status_counts.reindex(['Extern vervuld', 'Intern vervuld'], fill_value=0).sum())
+    openstaande_vacatures = int(status_counts.reindex(['Publicatie in- en extern', 'In procedure', 'Publicatie intern'], fill_value=0).sum())
+    niet_vervulde_vacatures = int(status_counts.get('Niet vervuld', 0))
+    
+    fill_rate = (vervulde_vacatures / total_vacatures * 100) if total_vacatures > 0 else 0
+    
+    # Nieuwe vacatures in periode
+    nieuwe_vacatures = event_index.count_created(start_date, end_date)
+    
+    # Gesloten vacatures in periode (vervuld of niet vervuld)
+    gesloten_in_periode = event_index.count_closed(start_date, end_date)
+    
+    return {
+        'total_vacatures': total_vacatures,
+        'vervulde_vacatures': vervulde_vacatures,
+        'openstaande_vacatures': openstaande_vacatures,
+        'niet_vervulde_vacatures': niet_vervulde_vacatures,
+        'fill_rate': fill_rate,
+        'nieuwe_vacatures': nieuwe_vacatures,
+        'gesloten_vacatures': gesloten_in_periode
+    }
+
+# Soorten sluiting, in de volgorde waarin Sluitdatum wordt samengesteld
+CLOSE_TYPES = ['Vervuld', 'Niet vervuld', 'Ingetrokken']
+CLOSE_TYPE_COLUMNS = ['Vervuldatum', 'Niet vervuld', 'Ingetrokken']
+
+def get_close_type_codes(df):
+    """Index in CLOSE_TYPES per vacature (-1 als de vacature niet gesloten is)"""
+    conditions = [df[col].notna().to_numpy() if col in df.columns else np.zeros(len(df), dtype=bool)
+                  for col in CLOSE_TYPE_COLUMNS]
+    return np.select(conditions, range(len(CLOSE_TYPES)), default=-1)
+
+def get_day_offsets(dates, periode_start):
+    """Aantal dagen sinds periode_start per datum (NaN voor lege datums)"""
+    return ((dates - periode_start) // pd.Timedelta(days=1)).to_numpy(dtype='float64', na_value=np.nan)
+
+def to_day_number(value):
+    """Zet een datum om naar een dagnummer (dagen sinds 1970-01-01)"""
+    return int(np.datetime64(pd.Timestamp(value).date(), 'D').astype('int64'))
+
+def get_day_numbers(dates):
+    """Dagnummers van een datum kolom plus een masker van de gevulde waarden"""
+    valid = dates.notna().to_numpy()
+    days = dates.to_numpy(dtype='datetime64[ns]').astype('datetime64[D]').astype('int64')
+    return days, valid
+
+class DailyEventIndex:
+    """Dag-geïndexeerde aanmaak- en sluitevents van één dataset voor snelle periode queries"""
+    
+    @profiled("Event index opbouwen")
+    def __init__(self, df):
+        self.total_vacatures = len(df)
+        self.status_counts = count_values(df['Status vacature'])
+        
+        # Gesorteerde aanmaakdagen plus de bijbehorende rijposities
+        created_days, created_valid = get_day_numbers(df['Datum aanmaak'])
+        created_positions = np.flatnonzero(created_valid)
+        order = np.argsort(created_days[created_positions], kind='stable')
+        self.created_positions = created_positions[order]
+        self.created_days = created_days[self.created_positions]
+        
+        # Sluitevents: een vacature telt als gesloten in een periode als één van zijn
+        # sluitdatums erin valt. Per vacature worden de unieke sluitdagen gesorteerd;
+        # alleen herhaalde events (met een eerdere sluitdag) zijn nodig om dubbel
+        # tellen te corrigeren.
+        close_matrix = np.full((len(df), len(CLOSE_TYPE_COLUMNS)), np.iinfo('int64').max, dtype='int64')
+        for col_index, col in enumerate(CLOSE_TYPE_COLUMNS):
+            if col in df.columns:
+                days, valid = get_day_numbers(df[col])
+                close_matrix[valid, col_index] = days[valid]
+        close_matrix.sort(axis=1)
+        
+        event_valid = close_matrix != np.iinfo('int64').max
+        event_valid[:, 1:] &= close_matrix[:, 1:] != close_matrix[:, :-1]
+        self.close_days = np.sort(close_matrix[event_valid])
+        
+        repeat_days = close_matrix[:, 1:][event_valid[:, 1:]]
+        repeat_prev_days = close_matrix[:, :-1][event_valid[:, 1:]]
+        order = np.argsort(repeat_days, kind='stable')
+        self.repeat_close_days = repeat_days[order]
+        self.repeat_prev_days = repeat_prev_days[order]
+        
+        # Aantallen per dag over de volledige span van de dataset
+        all_days = np.concatenate([self.created_days, self.close_days])
+        if len(all_days) > 0:
+            span_start = pd.Timestamp(np.datetime64(int(all_days.min()), 'D'))
+            span_end = pd.Timestamp(np.datetime64(int(all_days.max()), 'D'))
+            self.daily = compute_daily_activity(df, span_start, span_end).set_index('Datum')
+        else:
+            self.daily = pd.DataFrame(
+                columns=['Nieuwe_Vacatures', 'Gesloten_Vacatures'] + CLOSE_TYPES,
+                index=pd.DatetimeIndex([], name='Datum')
+            )
+    
+    def count_created(self, start_date, end_date):
+        """Aantal vacatures aangemaakt tussen start_date en end_date (inclusief)"""
+        lo = np.searchsorted(self.created_days, to_day_number(start_date), side='left')
+        hi = np.searchsorted(self.created_days, to_day_number(end_date), side='right')
+        return int(hi - lo)
+    
+    def rows_created_between(self, start_date, end_date):
+        """Rijposities (in originele volgorde) van vacatures aangemaakt in de periode"""
+        lo = np.searchsorted(self.created_days, to_day_number(start_date), side='left')
+        hi = np.searchsorted(self.created_days, to_day_number(end_date), side='right')
+        return np.sort(self.created_positions[lo:hi])
+    
+    def count_closed(self, start_date, end_date):
+        """Aantal vacatures met minstens één sluitdatum tussen start_date en end_date"""
+        start_day = to_day_number(start_date)
+        end_day = to_day_number(end_date)
+        lo = np.searchsorted(self.close_days, start_day, side='left')
+        hi = np.searchsorted(self.close_days, end_day, side='right')
+        
+        # Herhaalde events waarvan de vorige sluitdag ook in de periode valt zijn dubbel geteld
+        repeat_lo = np.searchsorted(self.repeat_close_days, start_day, side='left')
+        repeat_hi = np.searchsorted(self.repeat_close_days, end_day, side='right')
+        double_counted = np.count_nonzero(self.repeat_prev_days[repeat_lo:repeat_hi] >= start_day)
+        
+        return int(hi - lo - double_counted)
+    
+    def daily_activity(self, start_date, end_date):
+        """Zelfde resultaat als compute_daily_activity, maar uit de voorberekende dagtellingen"""
+        date_range = pd.date_range(start=pd.Timestamp(start_date), end=pd.Timestamp(end_date), freq='D')
+        daily_data = self.daily.reindex(date_range, fill_value=0).astype('int64')
+        daily_data.index.name = 'Datum'
+        return daily_data.reset_index()
+
+@profiled("Dagelijkse activiteit")
+def compute_daily_activity(df, start_date, end_date):
+    """Telt nieuwe en gesloten vacatures (per type sluiting) per dag in de periode"""
+    periode_start = pd.Timestamp(start_date)
+    periode_end = pd.Timestamp(end_date)
+    date_range = pd.date_range(start=periode_start, end=periode_end, freq='D')
+    n_days = len(date_range)
+    
+    # Nieuwe vacatures per dag via bincount over de dag-index
+    nieuw_offsets = get_day_offsets(df['Datum aanmaak'], periode_start)
+    in_periode = (nieuw_offsets >= 0) & (nieuw_offsets < n_days)
+    nieuwe_per_dag = np.bincount(nieuw_offsets[in_periode].astype('int64'), minlength=n_days)
+    
+    # Gesloten vacatures: één samengestelde sluitdatum plus het type sluiting,
+    # geteld in één bincount over (type, dag)
+    close_offsets = get_day_offsets(df['Sluitdatum'], periode_start)
+    close_types = get_close_type_codes(df)
+    in_periode = (close_offsets >= 0) & (close_offsets < n_days) & (close_types >= 0)
+    flat_index = close_types[in_periode] * n_days + close_offsets[in_periode].astype('int64')
+    gesloten_per_type = np.bincount(flat_index, minlength=len(CLOSE_TYPES) * n_days).reshape(len(CLOSE_TYPES), n_days)
+    
+    daily_data = pd.DataFrame({
+        'Datum': date_range,
+        'Nieuwe_Vacatures': nieuwe_per_dag,
+        'Gesloten_Vacatures': gesloten_per_type.sum(axis=0)
+    })
+    for type_index, close_type in enumerate(CLOSE_TYPES):
+        daily_data[close_type] = gesloten_per_type[type_index]
+    
+    return daily_data
+
+@profiled("Performance tabel")
+def create_vacature_performance_table(df):
+    """Maakt gedetailleerde vacature performance tabel met getypeerde kolommen"""
+    # Doorlooptijd in hele dagen (leeg als aanmaak- of sluitdatum ontbreekt)
+    doorlooptijd = (df['Sluitdatum'] - df['Datum aanmaak']).dt.days.astype('Int64')
+    
+    # Conversie rate: 1 hire op het aantal reacties (NaN zonder reacties)
+    totaal_reacties = count_column(df, 'Aantal reacties')
+    aangenomen = df['Status vacature'].isin(['Extern vervuld', 'Intern vervuld'])
+    conversie_rate = (aangenomen.astype('int64') / totaal_reacties.where(totaal_reacties > 0) * 100).astype('float64')
+    
+    # Bepaal status categorie
+    status_categorie = np.select(
+        [aangenomen, df['Status vacature'].isin(['Niet vervuld', 'Ingetrokken'])],
+        ['Vervuld', 'Gesloten'],
+        default='Actief'
+    )
+    
+    if 'Locatie' in df.columns:
+        locatie = df['Locatie'].astype(object).fillna('Onbekend')
+    else:
+        locatie = pd.Series('Onbekend', index=df.index)
+    
+    performance_table = pd.DataFrame({
+        'Vacature': truncate_text_column(df['Functie']),
+        'Status': df['Status vacature'],
+        'Status_Categorie': status_categorie,
+        'Recruiter': df['Eigenaar'],
+        'Aanmaakdatum': df['Datum aanmaak'],
+        'Sluitdatum': df['Sluitdatum'],
+        'Doorlooptijd': doorlooptijd,
+        'Totaal_Reacties': totaal_reacties,
+        'Conversie_Rate': conversie_rate,
+        'Locatie': locatie
+    })
+    
+    return performance_table.reset_index(drop=True)
+
+def format_performance_table(performance_table):
+    """Zet de getypeerde performance tabel om naar leesbare tekst voor export"""
+    formatted = performance_table.copy()
+    formatted['Aanmaakdatum'] = performance_table['Aanmaakdatum'].dt.strftime('%d-%m-%Y').fillna('Onbekend')
+    formatted['Sluitdatum'] = performance_table['Sluitdatum'].dt.strftime('%d-%m-%Y').fillna('-')
+    
+    doorlooptijd = performance_table['Doorlooptijd']
+    formatted['Doorlooptijd'] = (doorlooptijd.astype(str) + ' dagen').where(doorlooptijd.notna(), '-')
+    
+    conversie_rate = performance_table['Conversie_Rate']
+    formatted['Conversie_Rate'] = conversie_rate.map('{:.1f}%'.format, na_action='ignore').fillna('-')
+    
+    return formatted
+
+# Statussen waarmee een vacature als vervuld telt
+FILLED_STATUSES = ['Extern vervuld', 'Intern vervuld']
+
+# Recruiters met minder vacatures worden voor relevantie niet getoond
+RECRUITER_MIN_VACATURES = 3
+
+@profiled("Recruiter statistieken")
+def compute_recruiter_stats(df):
+    """Berekent statistieken per recruiter (inclusief afdeling) in één gegroepeerde aggregatie"""
+    # Filter alleen actieve recruiters
+    df_clean = df[df['Eigenaar'].notna() & (df['Eigenaar'] != ' ') & (df['Eigenaar'] != '')]
+    
+    # Vervuld als 0/1 kolom, zodat het aantal vervulde vacatures een gewone som in dezelfde groupby is
+    recruiter_stats = df_clean[['Eigenaar', 'Afdeling', 'Functie']].assign(
+        **{'Aantal reacties': count_column(df_clean, 'Aantal reacties')},
+        Vervuld=df_clean['Status vacature'].isin(FILLED_STATUSES).astype('int64')
+    ).groupby(['Eigenaar', 'Afdeling'], observed=True).agg(
+        Totaal_Vacatures=('Functie', 'count'),
+        **{'Aantal reacties': ('Aantal reacties', 'sum')},
+        Vervulde_Vacatures=('Vervuld', 'sum')
+    ).reset_index()
+    return summarise_recruiter_stats(recruiter_stats)
+
+def summarise_recruiter_stats(recruiter_stats):
+    """Voegt rates toe aan totalen per (Eigenaar, Afdeling), filtert kleine recruiters en sorteert"""
+    recruiter_stats = recruiter_stats.copy()
+    recruiter_stats['Fill_Rate'] = (recruiter_stats['Vervulde_Vacatures'] / recruiter_stats['Totaal_Vacatures'] * 100).round(1)
+    recruiter_stats['Gem_Reacties'] = (recruiter_stats['Aantal reacties'] / recruiter_stats['Totaal_Vacatures']).round(1)
+    
+    # Grootste recruiters eerst, zodat de chart per pagina de top-N kan tonen
+    recruiter_stats = recruiter_stats[recruiter_stats['Totaal_Vacatures'] >= RECRUITER_MIN_VACATURES]
+    return recruiter_stats.sort_values('Totaal_Vacatures', ascending=False, kind='stable').reset_index(drop=True)
+
+def truncate_text_column(series, max_length=50):
+    """Kort lange teksten in tot max_length tekens plus '...'"""
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        # Per categorie inkorten; ingekorte titels kunnen samenvallen, dus de categorieën opnieuw factoriseren
+        truncated = truncate_text_column(pd.Series(series.cat.categories.astype(object)), max_length)
+        category_codes, categories = pd.factorize(truncated)
+        codes = series.cat.codes.to_numpy()
+        codes = np.where(codes >= 0, category_codes[np.maximum(codes, 0)], -1)
+        return pd.Series(pd.Categorical.from_codes(codes, categories), index=series.index, name=series.name)
+    too_long = series.str.len() > max_length
+    return series.where(~too_long, series.str[:max_length] + '...')
+
+def count_column(df, col):
+    """Geeft een aantal-kolom terug als integers, met 0 voor lege of ontbrekende waarden"""
+    if col not in df.columns:
+        return pd.Series(0, index=df.index, dtype='int64')
+    return df[col].fillna(0).astype('int64')
+
+# Aantal-kolommen van de detail analyse en de export kolommen waar ze uit komen
+DETAIL_COUNT_COLUMNS = {
+    'Totaal_Kandidaten': 'Aantal reacties',
+    'Gesprekken': 'Aantal in status: Gesprek gevoerd',
+    'Afgewezen_na_Brief': 'Aantal in status: Afgewezen na briefselectie',
+    'Afgewezen_na_Gesprek': 'Aantal in status: Afgewezen na gesprek',
+    'Aangenomen': 'Aantal in status: Aangenomen'
+}
+
+@profiled("Detail analyse")
+def create_detailed_vacature_analysis(df):
+    """Maakt gedetailleerde vacature analyse met kandidaat metrics"""
+    totaal_kandidaten = count_column(df, 'Aantal reacties')
+    gesprekken = count_column(df, 'Aantal in status: Gesprek gevoerd')
+    aangenomen = count_column(df, 'Aantal in status: Aangenomen')
+    
+    # Rates als getallen; de opmaak als percentage gebeurt in st.column_config
+    heeft_kandidaten = totaal_kandidaten > 0
+    noemer = totaal_kandidaten.where(heeft_kandidaten, 1)
+    gesprek_rate = (gesprekken / noemer * 100).where(heeft_kandidaten, 0.0)
+    hire_rate = (aangenomen / noemer * 100).where(heeft_kandidaten, 0.0)
+    
+    analysis = pd.DataFrame({
+        'Vacature': truncate_text_column(df['Functie']),
+        'Recruiter': df['Eigenaar'],
+        'Afdeling': df['Afdeling'].astype(object).fillna('Onbekend'),
+        'Status': df['Status vacature'],
+        'Totaal_Kandidaten': totaal_kandidaten,
+        'Gesprekken': gesprekken,
+        'Afgewezen_na_Brief': count_column(df, 'Aantal in status: Afgewezen na briefselectie'),
+        'Afgewezen_na_Gesprek': count_column(df, 'Aantal in status: Afgewezen na gesprek'),
+        'Aangenomen': aangenomen,
+        'Gesprek_Rate': gesprek_rate.astype('float64'),
+        'Hire_Rate': hire_rate.astype('float64'),
+        'Aanmaakdatum': df['Datum aanmaak']
+    })
+    
+    return analysis.reset_index(drop=True)
+
+# Niveaus voor de uitsplitsing per afdeling, van grof naar fijn
+AFDELING_LEVELS = ['Afdeling', 'Eigenaar afdeling', 'Locatie']
+
+@profiled("Afdeling kubus")
+def build_afdeling_cube(df):
+    """Aggregeert vacatures, reacties en vervulde vacatures in één groupby per (afdelingsniveaus, recruiter)
+
+    Alle afdelingsoverzichten worden uit deze kubus opgeteld. De recruiter blijft een
+    dimensie, zodat ook het aantal unieke recruiters per groep uit de kubus volgt.
+    """
+    if 'Afdeling' not in df.columns:
+        return pd.DataFrame()
+    
+    levels = [level for level in AFDELING_LEVELS if level in df.columns]
+    df_clean = df[df['Afdeling'].notna()]
+    cube = aggregate_cells(
+        {dimension: df_clean[dimension] for dimension in levels + ['Eigenaar']},
+        {
+            'Totaal_Vacatures': df_clean['Functie'].notna().to_numpy(),
+            'Aantal reacties': count_column(df_clean, 'Aantal reacties').to_numpy(),
+            'Vervulde_Vacatures': df_clean['Status vacature'].isin(FILLED_STATUSES).to_numpy()
+        }
+    )
+    return label_afdeling_sublevels(cube)
+
+def aggregate_cells(dimensions, measures):
+    """Telt meetwaarden op per unieke combinatie van dimensies: één cel per combinatie, gesorteerd op de dimensies
+
+    dimensions en measures zijn {naam: kolom} met kolommen van gelijke lengte;
+    lege dimensiewaarden vormen een eigen cel.
+    """
+    # Eén celnummer per rij: de dimensies worden één voor één gekoppeld en na elke stap opnieuw
+    # genummerd, zodat het nummer begrensd blijft door de combinaties die echt voorkomen
+    # (het product van alle cardinaliteiten kan int64 overschrijden)
+    factorized = [pd.factorize(values, sort=True, use_na_sentinel=False) for values in dimensions.values()]
+    cell_of_row = np.zeros(len(factorized[0][0]), dtype='int64')
+    for codes, uniques in factorized:
+        # Gesorteerd hernummeren houdt de cellen gesorteerd op de dimensies
+        cell_of_row, _ = pd.factorize(cell_of_row * max(len(uniques), 1) + codes, sort=True)
+    cell_count = int(cell_of_row.max()) + 1 if len(cell_of_row) else 0
+    
+    # Eén rij per cel voor de dimensiewaarden (alle rijen van een cel hebben dezelfde codes)
+    cell_row = np.zeros(cell_count, dtype='int64')
+    cell_row[cell_of_row] = np.arange(len(cell_of_row))
+    aggregated = pd.DataFrame({
+        name: uniques.take(codes[cell_row])
+        for name, (codes, uniques) in zip(dimensions, factorized)
+    })
+    for name, weights in measures.items():
+        aggregated[name] = np.bincount(cell_of_row, weights=weights, minlength=cell_count).astype('int64')
+    return aggregated
+
+def label_afdeling_sublevels(cube):
+    """Toont lege sub-niveaus (eigenaar afdeling, locatie) als eigen groep in plaats van ze weg te laten"""
+    for level in AFDELING_LEVELS[1:]:
+        if level in cube.columns:
+            cube[level] = cube[level].astype(object).fillna('Onbekend')
+    return cube
+
+@profiled("Afdeling samenvatting")
+def create_afdeling_summary(df, depth=1, cube=None):
+    """Maakt samenvatting per afdeling; depth 2 en 3 splitsen verder uit naar eigenaar afdeling en locatie
+
+    Een eerder gebouwde kubus (build_afdeling_cube) kan worden meegegeven, zodat
+    meerdere niveaus zonder nieuwe groupby over de vacatures worden berekend.
+    """
+    if cube is None:
+        cube = build_afdeling_cube(df)
+    if 'Afdeling' not in cube.columns:
+        return pd.DataFrame()
+    
+    levels = [level for level in AFDELING_LEVELS if level in cube.columns][:depth]
+    afdeling_stats = cube.groupby(levels, observed=True, dropna=False).agg(
+        Totaal_Vacatures=('Totaal_Vacatures', 'sum'),
+        **{'Aantal reacties': ('Aantal reacties', 'sum')},
+        Aantal_Recruiters=('Eigenaar', 'nunique'),
+        Vervulde_Vacatures=('Vervulde_Vacatures', 'sum')
+    )
+    afdeling_stats['Fill_Rate'] = (afdeling_stats['Vervulde_Vacatures'] / afdeling_stats['Totaal_Vacatures'] * 100).round(1)
+    afdeling_stats['Gem_Reacties_per_Vacature'] = (afdeling_stats['Aantal reacties'] / afdeling_stats['Totaal_Vacatures']).round(1)
+    afdeling_stats = afdeling_stats.reset_index()
+    
+    if len(levels) == 1:
+        return afdeling_stats.sort_values('Totaal_Vacatures', ascending=False)
+    
+    # In de uitsplitsing blijven afdelingen bij elkaar, de grootste afdeling eerst
+    afdeling_totaal = afdeling_stats.groupby('Afdeling', observed=True)['Totaal_Vacatures'].transform('sum')
+    return afdeling_stats.assign(Afdeling_Totaal=afdeling_totaal).sort_values(
+        ['Afdeling_Totaal', 'Afdeling', 'Totaal_Vacatures'], ascending=[False, True, False], kind='stable'
+    ).drop(columns='Afdeling_Totaal')
+
+# Kanaal kolommen: "Totaal per wervingskanaal: X" plus de (aangenomen) en (afgewezen) varianten
+CHANNEL_COLUMN_PATTERN = re.compile(r'^Totaal per wervingskanaal(?: \((aangenomen|afgewezen)\))?:\s*(.+)$')
+CHANNEL_MEASURES = ['totaal', 'aangenomen', 'afgewezen']
+
+def discover_channel_columns(columns):
+    """Vindt alle wervingskanaal kolommen als {kanaal: {meting: kolomnaam}}"""
+    channel_columns = {}
+    for col in columns:
+        match = CHANNEL_COLUMN_PATTERN.match(col)
+        if match:
+            measure = match.group(1) or 'totaal'
+            channel_columns.setdefault(match.group(2).strip(), {})[measure] = col
+    return channel_columns
+
+def get_channel_columns(df):
+    """Kanaal kolommen zoals bij het inlezen ontdekt, of opnieuw bepaald voor andere frames"""
+    channel_columns = df.attrs.get('channel_columns')
+    if channel_columns is None:
+        return discover_channel_columns(df.columns)
+    
+    # attrs reizen mee met kolomselecties, dus houd alleen kolommen die nog bestaan
+    present = set(df.columns)
+    channel_columns = {
+        channel: {measure: col for measure, col in cols.items() if col in present}
+        for channel, cols in channel_columns.items()
+    }
+    return {channel: cols for channel, cols in channel_columns.items() if cols}
+
+@profiled("Kanaal statistieken")
+def compute_channel_stats(df):
+    """Berekent sollicitanten, hires en conversie per wervingskanaal"""
+    channel_columns = get_channel_columns(df)
+    columns = get_channel_measure_columns(channel_columns)
+    
+    # Eén gevectoriseerde som over alle kanaal kolommen
+    sums = df[columns].to_numpy(dtype='float64', na_value=0).sum(axis=0) if columns else []
+    return build_channel_stats(channel_columns, pd.Series(sums, index=columns, dtype='float64'))
+
+def get_channel_measure_columns(channel_columns):
+    return [col for measures in channel_columns.values() for col in measures.values()]
+
+def build_channel_stats(channel_columns, column_totals):
+    """Kanaal tabel uit totalen per kanaal kolom (een Series met de kolomnaam als index)"""
+    channels = list(channel_columns)
+    
+    # Kanaal × meting matrix; ontbrekende metingen tellen als 0
+    matrix = np.array([
+        [column_totals.get(channel_columns[channel].get(measure), 0) for channel in channels]
+        for measure in CHANNEL_MEASURES
+    ], dtype='float64').reshape(len(CHANNEL_MEASURES), len(channels))
+    
+    channel_df = pd.DataFrame({
+        'Kanaal': channels,
+        'Totaal_Sollicitanten': matrix[0].astype('int64'),
+        'Aangenomen': matrix[1].astype('int64'),
+        'Afgewezen': matrix[2].astype('int64')
+    })
+    channel_df = channel_df[channel_df['Totaal_Sollicitanten'] > 0].copy()
+    channel_df['Conversie_Rate'] = channel_df['Aangenomen'] / channel_df['Totaal_Sollicitanten'] * 100
+    
+    return channel_df.sort_values('Totaal_Sollicitanten', ascending=False)
+
+# Dimensies van de vacature kubus naast de aanmaakdag
+CUBE_DIMENSIONS = ['Status vacature', 'Afdeling', 'Eigenaar afdeling', 'Eigenaar', 'Locatie']
+# Meetwaarden waaruit de recruiter- en afdelingsoverzichten worden opgeteld
+SUMMARY_MEASURES = ['Totaal_Vacatures', 'Aantal reacties', 'Vervulde_Vacatures']
+STATUS_COUNT_PREFIX = 'Aantal in status:'
+
+class VacatureCube:
+    """Vooraf opgetelde meetwaarden per (aanmaakdag, status, afdeling, eigenaar afdeling, recruiter, locatie)
+
+    De cellen staan op aanmaakdag gesorteerd, zodat een periode een aaneengesloten blok
+    is. Status-, recruiter-, afdeling- en kanaaloverzichten en de totalen achter de
+    detailfilters zijn sommen over cellen in plaats van over de losse vacatures.
+    Vacatures zonder aanmaakdatum vallen, net als bij het filteren op periode, buiten elke periode.
+    """
+    
+    @profiled("Vacature kubus opbouwen")
+    def __init__(self, df):
+        days, valid = get_day_numbers(df['Datum aanmaak'])
+        positions = np.flatnonzero(valid)
+        self.dimensions = [dimension for dimension in CUBE_DIMENSIONS if dimension in df.columns]
+        self.channel_columns = get_channel_columns(df)
+        self.status_count_columns = [col for col in df.columns if col.startswith(STATUS_COUNT_PREFIX)]
+        
+        def measure(col):
+            return count_column(df, col).to_numpy()[positions]
+        
+        measures = {
+            'Vacatures': np.ones(len(positions), dtype='int64'),
+            'Totaal_Vacatures': df['Functie'].notna().to_numpy()[positions] if 'Functie' in df.columns else np.ones(len(positions), dtype='int64'),
+            'Vervulde_Vacatures': df['Status vacature'].isin(FILLED_STATUSES).to_numpy()[positions],
+            'Aantal reacties': measure('Aantal reacties')
+        }
+        for col in self.status_count_columns + get_channel_measure_columns(self.channel_columns):
+            measures[col] = measure(col)
+        
+        self.cells = aggregate_cells(
+            {'Dag': days[positions], **{dimension: df[dimension].iloc[positions] for dimension in self.dimensions}},
+            measures
+        )
+        # Kleinste integer type per kolom: de kubus blijft naast de dataset in het geheugen
+        for col in ['Dag', *measures]:
+            self.cells[col] = pd.to_numeric(self.cells[col], downcast='integer')
+        self.days = self.cells['Dag'].to_numpy()
+        self.total_vacatures = len(positions)
+    
+    def cells_between(self, start_date, end_date, filters=None):
+        """Cellen met een aanmaakdag tussen start_date en end_date (inclusief), optioneel gefilterd op {dimensie: waarden}"""
+        lo = np.searchsorted(self.days, to_day_number(start_date), side='left')
+        hi = np.searchsorted(self.days, to_day_number(end_date), side='right')
+        cells = self.cells.iloc[lo:hi]
+        for dimension, values in (filters or {}).items():
+            cells = cells[cells[dimension].isin(values)]
+        return cells
+    
+    def aggregate(self, start_date, end_date, by, measures, filters=None):
+        """Sommen van measures per combinatie van de dimensies in by (lege waarden als eigen groep)"""
+        cells = self.cells_between(start_date, end_date, filters)
+        return aggregate_cells(
+            {dimension: cells[dimension] for dimension in by},
+            {measure: cells[measure].to_numpy() for measure in measures}
+        )
+    
+    def totals(self, start_date, end_date, measures, filters=None):
+        """Sommen van measures over de hele periode als Series"""
+        return self.cells_between(start_date, end_date, filters)[measures].sum()
+    
+    @profiled("Status aantallen (kubus)")
+    def status_counts(self, start_date, end_date):
+        """Aantal vacatures per status, in het formaat van count_values"""
+        counts = self.aggregate(start_date, end_date, ['Status vacature'], ['Vacatures'])
+        counts = counts[counts['Status vacature'].notna() & (counts['Vacatures'] > 0)]
+        counts = counts.set_index('Status vacature')['Vacatures'].sort_values(ascending=False, kind='stable').rename('count')
+        if isinstance(counts.index, pd.CategoricalIndex):
+            counts.index = counts.index.astype(counts.index.categories.dtype)
+        return counts
+    
+    @profiled("Recruiter statistieken (kubus)")
+    def recruiter_stats(self, start_date, end_date):
+        """compute_recruiter_stats voor de periode, opgeteld uit de cellen"""
+        recruiter_stats = self.aggregate(start_date, end_date, ['Eigenaar', 'Afdeling'], SUMMARY_MEASURES)
+        active = recruiter_stats['Eigenaar'].notna() & ~recruiter_stats['Eigenaar'].isin([' ', ''])
+        return summarise_recruiter_stats(recruiter_stats[active & recruiter_stats['Afdeling'].notna()])
+    
+    @profiled("Afdeling cellen (kubus)")
+    def afdeling_cube(self, start_date, end_date):
+        """build_afdeling_cube voor de periode, opgeteld uit de cellen"""
+        if 'Afdeling' not in self.dimensions:
+            return pd.DataFrame()
+        levels = [level for level in AFDELING_LEVELS if level in self.dimensions]
+        cube = self.aggregate(start_date, end_date, levels + ['Eigenaar'], SUMMARY_MEASURES)
+        return label_afdeling_sublevels(cube[cube['Afdeling'].notna()].reset_index(drop=True))
+    
+    @profiled("Kanaal statistieken (kubus)")
+    def channel_stats(self, start_date, end_date):
+        """compute_channel_stats voor de periode, opgeteld uit de cellen"""
+        columns = get_channel_measure_columns(self.channel_columns)
+        return build_channel_stats(self.channel_columns, self.totals(start_date, end_date, columns))
+    
+    def detail_totals(self, start_date, end_date, status_filter=None, afdeling_filter=None):
+        """Totalen van de aantal-kolommen van de detail analyse voor de status- en afdelingsfilters (None = alles)"""
+        filters = {}
+        if status_filter is not None:
+            filters['Status vacature'] = status_filter
+        if afdeling_filter and 'Afdeling' in self.dimensions:
+            filters['Afdeling'] = afdeling_filter
+        measures = [col for col in DETAIL_COUNT_COLUMNS.values() if col in self.cells.columns]
+        totals = self.totals(start_date, end_date, measures, filters)
+        return pd.Series({name: int(totals.get(col, 0)) for name, col in DETAIL_COUNT_COLUMNS.items()})
+
+# Download formaten: {formaat: (omschrijving, bestandsextensie, MIME type)}
+EXPORT_FORMATS = {
+    'csv': ('CSV', 'csv', 'text/csv'),
+    'csv_gz': ('CSV (gzip)', 'csv.gz', 'application/gzip'),
+    'parquet': ('Parquet', 'parquet', 'application/vnd.apache.parquet'),
+    'xlsx': ('Excel', 'xlsx', 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet')
+}
+# Formaten waarin tabellen als opgemaakte tekst worden geëxporteerd; de overige houden hun kolomtypes
+TEXT_EXPORT_FORMATS = ['csv', 'csv_gz']
+# Een Excel werkblad heeft maximaal 1.048.576 rijen, inclusief de kopregel
+XLSX_MAX_ROWS = 1048575
+
+def write_export(table, export_format, file, sheet_name='Data'):
+    """Schrijft een tabel direct naar een binair bestandsobject, gecomprimeerd waar het formaat dat toelaat"""
+    if export_format == 'csv':
+        # Ongecomprimeerd, zodat Excel het bestand direct kan openen
+        table.to_csv(file, index=False, sep=';')
+    elif export_format == 'csv_gz':
+        # pandas schrijft de CSV in blokken door de gzip stream, zonder volledige tekst kopie;
+        # niveau 6 is ruim twee keer zo snel als het standaard niveau 9 bij vrijwel gelijke grootte
+        table.to_csv(file, index=False, sep=';', compression={'method': 'gzip', 'mtime': 0, 'compresslevel': 6})
+    elif export_format == 'parquet':
+        table.to_parquet(file, index=False, compression='zstd')
+    elif export_format == 'xlsx':
+        if len(table) > XLSX_MAX_ROWS:
+            raise ValueError(f"Te veel rijen voor Excel: {len(table):,} (maximaal {XLSX_MAX_ROWS:,})")
+        table.to_excel(file, index=False, sheet_name=sheet_name, engine='xlsxwriter')
+    else:
+        raise ValueError(f"Onbekend export formaat: {export_format} (kies uit {', '.join(EXPORT_FORMATS)})")
@@ -0,0 +1,166 @@
+"""Headless rapportage: KPI's en tabellen van ATS exports zonder Streamlit.
+
+Eén export of een map met exports wordt verwerkt met dezelfde pipeline als het
+dashboard. Per export komen de KPI's (calculate_metrics) en de recruiter-,
+afdeling-, kanaal- en performance tabellen als CSV, Parquet of JSON in een eigen map;
+de afdelingen ook uitgesplitst naar eigenaar afdeling en locatie.
+
+    python ats_report.py export.csv --period "Laatste 30 dagen" -o rapport/
+    python ats_report.py exports/ --format parquet --processes 4 -o rapporten/
+"""
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date
+
+from ats_core import (
+    compute_data_hash, process_ats_data, get_predefined_periods, get_date_range_from_data,
+    filter_data_by_date_range, calculate_metrics, DailyEventIndex, compute_recruiter_stats,
+    AFDELING_LEVELS, build_afdeling_cube, create_afdeling_summary, compute_channel_stats, create_vacature_performance_table
+)
+
+OUTPUT_FORMATS = ['csv', 'parquet', 'json']
+FULL_PERIOD = 'Alles'
+
+def load_export(path, workers=None):
+    """Leest en verwerkt één export van schijf"""
+    with open(path, 'rb') as export_file:
+        data = export_file.read()
+    df = process_ats_data(data, workers=workers)
+    df.attrs['data_hash'] = compute_data_hash(data)
+    return df
+
+def resolve_period(df, period=None):
+    """Bepaalt (start, eind) voor een standaard periode, 'YYYY-MM-DD:YYYY-MM-DD' of de volledige dataset
+
+    Net als in het dashboard worden standaard periodes begrensd op de datums in de export.
+    """
+    min_date, max_date = get_date_range_from_data(df)
+    if period is None or period == FULL_PERIOD:
+        return min_date, max_date
+
+    if ':' in period:
+        start_text, end_text = period.split(':', 1)
+        start_date, end_date = date.fromisoformat(start_text), date.fromisoformat(end_text)
+        if start_date > end_date:
+            raise ValueError("Startdatum moet voor einddatum liggen")
+        return start_date, end_date
+
+    periods = {name: period_range for name, period_range in get_predefined_periods().items() if period_range is not None}
+    if period not in periods:
+        raise ValueError(f"Onbekende periode '{period}' (kies uit {', '.join([FULL_PERIOD, *periods])} of YYYY-MM-DD:YYYY-MM-DD)")
+    period_start, period_end = periods[period]
+    if period_end < min_date or period_start > max_date:
+        raise ValueError(f"Periode '{period}' valt buiten de datums in de export ({min_date} t/m {max_date})")
+    return max(period_start, min_date), min(period_end, max_date)
+
+def build_report(df_full, start_date, end_date):
+    """KPI's en tabellen voor één periode, zoals het dashboard ze toont"""
+    event_index = DailyEventIndex(df_full)
+    df = filter_data_by_date_range(df_full, start_date, end_date, event_index)
+
+    kpis = {
+        'periode_start': start_date.isoformat(),
+        'periode_eind': end_date.isoformat(),
+        'vacatures_in_periode': len(df),
+        **calculate_metrics(df_full, start_date, end_date, event_index)
+    }
+    afdeling_cube = build_afdeling_cube(df)
+    tables = {
+        'recruiters': compute_recruiter_stats(df),
+        'afdelingen': create_afdeling_summary(df, cube=afdeling_cube),
+        'afdelingen_uitgesplitst': create_afdeling_summary(df, len(AFDELING_LEVELS), cube=afdeling_cube),
+        'kanalen': compute_channel_stats(df),
+        'performance': create_vacature_performance_table(df)
+    }
+    return kpis, tables
+
+def write_table(table, path, output_format):
+    if output_format == 'csv':
+        table.to_csv(path, index=False, sep=';')
+    elif output_format == 'parquet':
+        table.to_parquet(path, index=False)
+    else:
+        table.to_json(path, orient='records', date_format='iso', force_ascii=False, indent=2)
+
+def write_report(kpis, tables, output_dir, output_format='csv'):
+    """Schrijft kpis.json plus één bestand per tabel naar output_dir"""
+    if output_format not in OUTPUT_FORMATS:
+        raise ValueError(f"Onbekend formaat: {output_format} (kies uit {', '.join(OUTPUT_FORMATS)})")
+    os.makedirs(output_dir, exist_ok=True)
+    with open(os.path.join(output_dir, 'kpis.json'), 'w', encoding='utf-8') as kpi_file:
+        json.dump(kpis, kpi_file, ensure_ascii=False, indent=2)
+    for name, table in tables.items():
+        write_table(table, os.path.join(output_dir, f"{name}.{output_format}"), output_format)
+
+def generate_report(path, output_dir, period=None, output_format='csv', workers=None):
+    """Volledige run voor één export; geeft een samenvatting terug (ook bij fouten, voor batch runs)"""
+    start = time.perf_counter()
+    summary = {'bestand': os.path.basename(path), 'map': output_dir}
+    try:
+        df_full = load_export(path, workers)
+        start_date, end_date = resolve_period(df_full, period)
+        kpis, tables = build_report(df_full, start_date, end_date)
+        write_report(kpis, tables, output_dir, output_format)
+    except Exception as e:
+        summary['fout'] = f"{type(e).__name__}: {e}"
+    else:
+        summary.update(rijen=len(df_full), data_hash=df_full.attrs['data_hash'], gdpr=df_full.attrs['gdpr'], kpis=kpis)
+    summary['seconden'] = round(time.perf_counter() - start, 3)
+    return summary
+
+def find_exports(input_dir):
+    return sorted(
+        os.path.join(input_dir, file_name) for file_name in os.listdir(input_dir)
+        if file_name.lower().endswith('.csv')
+    )
+
+def run_directory(input_dir, output_dir, period=None, output_format='csv', processes=None):
+    """Verwerkt alle exports in input_dir parallel over processen; elke export krijgt een eigen map"""
+    paths = find_exports(input_dir)
+    output_dirs = [os.path.join(output_dir, os.path.splitext(os.path.basename(path))[0]) for path in paths]
+
+    if processes == 1 or len(paths) < 2:
+        summaries = [generate_report(path, out, period, output_format) for path, out in zip(paths, output_dirs)]
+    else:
+        with ProcessPoolExecutor(max_workers=processes) as executor:
+            # De exports zijn al over processen verdeeld, dus elke export wordt serieel ingelezen
+            jobs = [executor.submit(generate_report, path, out, period, output_format, 1) for path, out in zip(paths, output_dirs)]
+            summaries = [job.result() for job in jobs]
+
+    os.makedirs(output_dir, exist_ok=True)
+    with open(os.path.join(output_dir, 'overzicht.json'), 'w', encoding='utf-8') as overview_file:
+        json.dump(summaries, overview_file, ensure_ascii=False, indent=2)
+    return summaries
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Maak KPI's en tabellen van ATS exports zonder dashboard")
+    parser.add_argument('input', help="CSV export of map met CSV exports")
+    parser.add_argument('-o', '--output', default='rapport', help="Uitvoermap")
+    parser.add_argument('--period', default=FULL_PERIOD,
+                        help=f"Standaard periode (bijv. 'Laatste 30 dagen'), YYYY-MM-DD:YYYY-MM-DD of '{FULL_PERIOD}'")
+    parser.add_argument('--format', choices=OUTPUT_FORMATS, default='csv', help="Formaat van de tabellen")
+    parser.add_argument('--processes', type=int, default=None,
+                        help="Aantal processen voor een map met exports (standaard het aantal CPU's)")
+    args = parser.parse_args(argv)
+
+    if os.path.isdir(args.input):
+        summaries = run_directory(args.input, args.output, args.period, args.format, args.processes)
+        failed = [summary for summary in summaries if 'fout' in summary]
+        for summary in summaries:
+            status = summary.get('fout') or f"{summary['rijen']:,} vacatures"
+            print(f"{summary['bestand']}: {status} ({summary['seconden']:.1f} s)")
+        return 1 if failed else 0
+
+    summary = generate_report(args.input, args.output, args.period, args.format)
+    if 'fout' in summary:
+        print(f"Fout bij het verwerken van {summary['bestand']}: {summary['fout']}", file=sys.stderr)
+        return 1
+    print(json.dumps(summary['kpis'], ensure_ascii=False, indent=2))
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
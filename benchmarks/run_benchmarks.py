@@ -0,0 +1,234 @@
+"""Benchmarks van het inlezen, de analyses en volledige pagina runs op synthetische exports.
+
+Per exportgrootte worden load_and_process_data (koud, uit snapshot en uit cache),
+calculate_metrics, create_daily_activity_chart, de analyse builders, de vacature kubus en volledige
+pagina runs via Streamlit's AppTest gemeten. De resultaten komen als JSON in
+benchmarks/results/ zodat runs van verschillende commits te vergelijken zijn:
+
+    python benchmarks/run_benchmarks.py --rows 1000 10000 100000 1000000
+    python benchmarks/run_benchmarks.py --rows 10000 --compare benchmarks/results/<eerdere run>.json
+"""
+import argparse
+import json
+import logging
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+BENCHMARK_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_DIR = os.path.dirname(BENCHMARK_DIR)
+APP_PATH = os.path.join(REPO_DIR, 'app.py')
+RESULTS_DIR = os.path.join(BENCHMARK_DIR, 'results')
+DEFAULT_ROWS = [1000, 10000, 100000, 1000000]
+
+# Snapshots van de benchmark mogen de lokale store van het dashboard niet raken;
+# de map moet vast staan voordat app.py geïmporteerd wordt
+os.environ.setdefault('ATS_SNAPSHOT_DIR', tempfile.mkdtemp(prefix='ats_benchmark_'))
+sys.path.insert(0, REPO_DIR)
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+from streamlit.testing.v1 import AppTest
+
+import app
+import ats_core
+from synthetic_export import generate_export
+
+# Zonder Streamlit server waarschuwt elke st.* aanroep over de ontbrekende ScriptRunContext
+for logger_name in list(logging.root.manager.loggerDict):
+    if logger_name.startswith('streamlit'):
+        logging.getLogger(logger_name).setLevel(logging.ERROR)
+
+class SyntheticUpload:
+    """Minimale vervanger van Streamlit's UploadedFile voor load_and_process_data"""
+
+    def __init__(self, data, name):
+        self.data = data
+        self.name = name
+        self.size = len(data)
+
+    def getvalue(self):
+        return self.data
+
+def time_call(func, repeat, setup=None):
+    """Looptijden in seconden van repeat aanroepen, met een optionele setup vóór elke aanroep"""
+    timings = []
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return timings
+
+def remove_snapshot(data_hash):
+    for path in app.get_snapshot_paths(data_hash):
+        if os.path.exists(path):
+            os.remove(path)
+
+def get_selectbox(at, label):
+    return next(selectbox for selectbox in at.sidebar.selectbox if selectbox.label == label)
+
+def benchmark_full_page(data_hash, repeat):
+    """Volledige pagina runs via AppTest: eerste run na het kiezen van de snapshot, een periode wissel en een rerun"""
+    timings = {'Volledige pagina (eerste run)': [], 'Volledige pagina (periode wissel)': [], 'Volledige pagina (rerun)': []}
+    for _ in range(repeat):
+        # Lege resource caches, zodat de eerste run de snapshot laadt en de event index opbouwt
+        st.cache_resource.clear()
+        at = AppTest.from_file(APP_PATH, default_timeout=3600)
+        at.run()
+        get_selectbox(at, "Open eerder verwerkte export").select(data_hash)
+
+        start = time.perf_counter()
+        at.run()
+        timings['Volledige pagina (eerste run)'].append(time.perf_counter() - start)
+
+        period_box = get_selectbox(at, "Kies periode")
+        if "Laatste jaar" in period_box.options:
+            period_box.select("Laatste jaar")
+        start = time.perf_counter()
+        at.run()
+        timings['Volledige pagina (periode wissel)'].append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        at.run()
+        timings['Volledige pagina (rerun)'].append(time.perf_counter() - start)
+
+        if at.exception:
+            raise RuntimeError(f"Dashboard gaf een fout: {at.exception[0].value}")
+    return timings
+
+def benchmark_size(rows, repeat, encoding, full_page):
+    """Alle metingen voor één exportgrootte als {case: [seconden, ...]}"""
+    data = generate_export(rows, seed=rows, encoding=encoding)
+    upload = SyntheticUpload(data, f"synthetisch_{rows}.csv")
+    data_hash = app.compute_data_hash(data)
+    cache = app.get_ingest_cache()
+    results = {}
+
+    def cold_setup():
+        cache.clear()
+        remove_snapshot(data_hash)
+
+    results['load_and_process_data (koud)'] = time_call(lambda: app.load_and_process_data(upload), repeat, cold_setup)
+    results['load_and_process_data (snapshot)'] = time_call(lambda: app.load_and_process_data(upload), repeat, cache.clear)
+    results['load_and_process_data (cache)'] = time_call(lambda: app.load_and_process_data(upload), repeat)
+
+    df_full = app.load_and_process_data(upload)
+    start_date, end_date = app.get_date_range_from_data(df_full)
+    event_index = app.DailyEventIndex(df_full)
+    df = app.filter_data_by_date_range(df_full, start_date, end_date, event_index)
+    cube = app.VacatureCube(df_full)
+
+    cases = {
+        'DailyEventIndex': lambda: app.DailyEventIndex(df_full),
+        'filter_data_by_date_range': lambda: app.filter_data_by_date_range(df_full, start_date, end_date, event_index),
+        'calculate_metrics': lambda: app.calculate_metrics(df_full, start_date, end_date, event_index),
+        'create_daily_activity_chart': lambda: app.create_daily_activity_chart(df_full, start_date, end_date, event_index),
+        'create_daily_activity_chart (zonder index)': lambda: app.create_daily_activity_chart(df_full, start_date, end_date),
+        'create_status_chart': lambda: app.create_status_chart(df),
+        'create_recruitment_performance_chart': lambda: app.create_recruitment_performance_chart(df),
+        'create_channel_analysis': lambda: app.create_channel_analysis(df),
+        'create_detailed_vacature_analysis': lambda: app.create_detailed_vacature_analysis(df),
+        'create_vacature_performance_table': lambda: app.create_vacature_performance_table(df),
+        'create_afdeling_summary': lambda: app.create_afdeling_summary(df),
+        'create_afdeling_charts': lambda: app.create_afdeling_charts(app.create_afdeling_summary(df)),
+        'VacatureCube': lambda: app.VacatureCube(df_full),
+        'VacatureCube overzichten': lambda: (
+            cube.status_counts(start_date, end_date),
+            cube.recruiter_stats(start_date, end_date),
+            cube.afdeling_cube(start_date, end_date),
+            cube.channel_stats(start_date, end_date)
+        ),
+    }
+    for case, func in cases.items():
+        results[case] = time_call(func, repeat)
+
+    if full_page:
+        results.update(benchmark_full_page(data_hash, repeat))
+
+    return results, len(data)
+
+def get_git_commit():
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'], cwd=REPO_DIR, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def summarise(timings):
+    return {
+        'min_s': min(timings),
+        'mediaan_s': statistics.median(timings),
+        'metingen_s': timings
+    }
+
+def print_results(records, baseline=None):
+    """Tabel met de mediaan per case, plus de verhouding tot een eerdere run"""
+    table = pd.DataFrame(records)
+    table['mediaan (ms)'] = (table['mediaan_s'] * 1000).round(1)
+    columns = ['rijen', 'case', 'mediaan (ms)']
+    if baseline is not None:
+        previous = pd.DataFrame(baseline['resultaten'])[['rijen', 'case', 'mediaan_s']].rename(columns={'mediaan_s': 'vorige_s'})
+        table = table.merge(previous, on=['rijen', 'case'], how='left')
+        table['t.o.v. vorige'] = (table['mediaan_s'] / table['vorige_s']).map('{:.2f}x'.format, na_action='ignore').fillna('-')
+        columns.append('t.o.v. vorige')
+    print(table[columns].to_string(index=False))
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark het ATS dashboard op synthetische exports")
+    parser.add_argument('--rows', type=int, nargs='+', default=DEFAULT_ROWS, help="Exportgroottes in vacatures")
+    parser.add_argument('--repeat', type=int, default=3, help="Aantal metingen per case")
+    parser.add_argument('--encoding', default='utf-8', help="Encoding van de synthetische exports")
+    parser.add_argument('--skip-full-page', action='store_true', help="Sla de volledige pagina runs via AppTest over")
+    parser.add_argument('--output', default=None, help="Resultaat bestand (standaard benchmarks/results/<tijdstip>.json)")
+    parser.add_argument('--compare', default=None, help="Eerder resultaat bestand om mee te vergelijken")
+    args = parser.parse_args()
+
+    records = []
+    for rows in args.rows:
+        print(f"▶ {rows:,} vacatures...", flush=True)
+        results, export_bytes = benchmark_size(rows, args.repeat, args.encoding, not args.skip_full_page)
+        for case, timings in results.items():
+            records.append({'rijen': rows, 'export_bytes': export_bytes, 'case': case, **summarise(timings)})
+
+    run = {
+        'tijdstip': datetime.now().isoformat(timespec='seconds'),
+        'commit': get_git_commit(),
+        'pipeline_version': ats_core.PIPELINE_VERSION,
+        'herhalingen': args.repeat,
+        'encoding': args.encoding,
+        'omgeving': {
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'cpu_count': os.cpu_count(),
+            'pandas': pd.__version__,
+            'numpy': np.__version__,
+            'streamlit': st.__version__,
+            'ingest_workers': ats_core.INGEST_WORKERS,
+            'chunk_rows': ats_core.INGEST_CHUNK_ROWS
+        },
+        'resultaten': records
+    }
+
+    output = args.output or os.path.join(RESULTS_DIR, f"{datetime.now().strftime('%Y%m%d_%H%M%S')}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, 'w', encoding='utf-8') as output_file:
+        json.dump(run, output_file, ensure_ascii=False, indent=2)
+
+    baseline = None
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as baseline_file:
+            baseline = json.load(baseline_file)
+    print_results(records, baseline)
+    print(f"Resultaten geschreven naar {output}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,221 @@
+"""Genereert synthetische ATS exports (puntkomma gescheiden) voor benchmarks.
+
+De exports volgen de structuur van een echte ATS export: vacature velden, alle
+statusdatums, "Aantal in status" tellingen, totalen per wervingskanaal,
+gevoelige contactkolommen, HTML entities in teksten en een instelbare encoding.
+
+    python benchmarks/synthetic_export.py --rows 100000 --encoding cp1252 -o export.csv
+"""
+import argparse
+import io
+from datetime import date
+
+import numpy as np
+import pandas as pd
+
+# Encodings zoals ze uit verschillende ATS versies komen; 'gemengd' is een UTF-8
+# export waarvan een deel van de rijen als CP1252 is weggeschreven
+ENCODINGS = ['utf-8', 'utf-8-sig', 'cp1252', 'gemengd']
+
+FUNCTIES = [
+    'Co&ouml;rdinator Facilitair', 'Medewerker Financi&euml;le Administratie', 'Adviseur P&amp;O',
+    '<b>Senior</b> Beleidsmedewerker', 'Begeleider Cli&euml;ntondersteuning', 'Coördinator Zorg',
+    'Verpleegkundige', 'Teamleider Klantcontact', 'Data Analist', 'Projectleider ICT',
+    'Medewerker Receptie', 'Jurist Omgevingsrecht', 'Communicatieadviseur', 'Controller',
+    'Functioneel Beheerder', 'Stagiair Marketing &amp; Communicatie', 'Officemanager',
+    'Casemanager Jeugd', 'Re&iuml;ntegratieconsulent', 'Beleidsadviseur Duurzaamheid',
+    # Lange titels (meer dan 50 tekens) die in de tabellen worden ingekort
+    'Senior Beleidsmedewerker Energietransitie en Klimaatadaptatie Regio Noord',
+    'Senior Beleidsmedewerker Energietransitie en Klimaatadaptatie Regio Zuid',
+    'Co&ouml;rdinerend Specialist Informatiebeveiliging, Privacy &amp; Gegevensbescherming'
+]
+NIVEAUS = ['', ' Junior', ' Medior', ' Senior', ' (32 uur)', ' (tijdelijk)', ' (tijdelijk, met uitzicht op een vast dienstverband)']
+
+VOORNAMEN = ['Jan', 'Sanne', 'Ren&eacute;', 'Zoë', 'Daan', 'Fleur', 'Jürgen', 'Noor', 'Bram',
+             'Ilse', 'Mehmet', 'Fatima', 'Sjoerd', 'Anouk', 'Chloë', 'Thijs', 'Eva', 'Niels']
+ACHTERNAMEN = ['de Vries', 'Jansen', 'van den Berg', 'Bakker', 'Visser', 'Smit', 'Meijer',
+               'de Boer', 'Mulder', 'Bos', 'Vos', 'Peters', 'Hendriks', 'van Dijk', 'Öztürk']
+
+AFDELINGEN = ['Financiën', 'HR', 'ICT', 'Zorg', 'Facilitair', 'Communicatie', 'Juridische Zaken',
+              'Klantcontact', 'Jeugd', 'Ruimtelijke Ordening', 'Sociaal Domein', 'Directie']
+LOCATIES = ['Utrecht', 'Den Haag', 'Rotterdam', 'Amsterdam', '&#39;s-Hertogenbosch', 'Groningen',
+            'Zwolle', 'Arnhem', 'Leeuwarden', 'Maastricht']
+
+# Statussen met hun kans; open statussen lopen de fases door tot en met hun eigen fase
+STATUSSEN = {
+    'Nieuw': 0.03, 'Intake': 0.02, 'Tekst bij vacaturehouder': 0.02, 'Tekst akkoord': 0.02,
+    'Publicatie intern': 0.05, 'Publicatie in- en extern': 0.12, 'In procedure': 0.14,
+    'Extern vervuld': 0.30, 'Intern vervuld': 0.12, 'Niet vervuld': 0.10, 'Ingetrokken': 0.08
+}
+FASES = ['Nieuw', 'Intake', 'Tekst bij vacaturehouder', 'Tekst akkoord',
+         'Publicatie intern', 'Publicatie in- en extern', 'In procedure']
+EINDSTATUSSEN = ['Extern vervuld', 'Intern vervuld', 'Niet vervuld', 'Ingetrokken']
+
+KANALEN = {'Website': 0.35, 'LinkedIn': 0.2, 'Indeed': 0.18, 'Werken bij': 0.12,
+           'Referral': 0.05, 'Uitzendbureau': 0.05, 'Nationale Vacaturebank': 0.05}
+KANDIDAAT_STATUSSEN = ['Nieuw', 'Gesprek gevoerd', 'Afgewezen na briefselectie',
+                       'Afgewezen na gesprek', 'Aanbod', 'Aangenomen']
+
+# Kolommen die het dashboard niet gebruikt, zodat het overslaan ervan ook meegemeten wordt
+OVERIGE_KOLOMMEN = {
+    'Uren per week': ['32', '36', '24-36', '40'],
+    'Salarisschaal': ['8', '9', '10', '11', '12'],
+    'Opmerkingen': ['', 'Herplaatsingskandidaat gaat voor', 'Zie intake &amp; profiel', '']
+}
+
+LEGE_DATUMS = ['', '0000-00-00']
+
+def build_names(rng, count):
+    """Unieke volledige namen (voornaam + achternaam, eventueel met volgnummer)"""
+    names = [f"{voornaam} {achternaam}" for voornaam in VOORNAMEN for achternaam in ACHTERNAMEN]
+    rng.shuffle(names)
+    return [names[i % len(names)] + (f" {i // len(names) + 1}" if i >= len(names) else '')
+            for i in range(count)]
+
+def pick(rng, values, size, p=None):
+    """Kiest size waarden als object array (ook voor lijsten met strings van verschillende lengte)"""
+    values = np.asarray(values, dtype=object)
+    return values[rng.choice(len(values), size=size, p=p)]
+
+def format_days(days, origin, valid, rng):
+    """Zet dagnummers om naar DD-MM-YYYY; lege datums worden '' of '0000-00-00'"""
+    labels = pd.date_range(origin, periods=int(days.max()) + 1 if len(days) else 1, freq='D').strftime('%d-%m-%Y')
+    labels = np.asarray(labels, dtype=object)
+    result = labels[np.where(valid, days, 0)]
+    result[~valid] = pick(rng, LEGE_DATUMS, int((~valid).sum()))
+    return result
+
+def generate_frame(rows, seed=0, end_date=None, span_days=730):
+    """Bouwt de export als DataFrame van strings, met aanmaakdatums in de span_days tot end_date"""
+    rng = np.random.default_rng(seed)
+    end_date = end_date or date.today()
+    origin = pd.Timestamp(end_date) - pd.Timedelta(days=span_days)
+
+    # Aantal recruiters en managers groeit mee met de export, zoals in grote organisaties
+    recruiters = build_names(rng, int(np.clip(rows // 150, 8, 600)))
+    managers = build_names(rng, len(AFDELINGEN) * 3)
+
+    statussen = pick(rng, list(STATUSSEN), rows, p=np.array(list(STATUSSEN.values())))
+    afdeling_codes = rng.integers(0, len(AFDELINGEN), rows)
+
+    columns = {
+        'Vacaturenummer': np.char.add('V', np.arange(100000, 100000 + rows).astype(str)).astype(object),
+        'Functie': np.char.add(pick(rng, FUNCTIES, rows).astype(str), pick(rng, NIVEAUS, rows).astype(str)).astype(object),
+        'Functietitel': pick(rng, FUNCTIES, rows),
+        'Status vacature': statussen,
+        'Eigenaar': pick(rng, recruiters, rows),
+        'Afdeling': np.asarray(AFDELINGEN, dtype=object)[afdeling_codes],
+        'Eigenaar afdeling': np.asarray(managers, dtype=object)[afdeling_codes * 3 + rng.integers(0, 3, rows)],
+        'Locatie': pick(rng, LOCATIES, rows),
+        'Vacaturehouder': pick(rng, managers, rows),
+        'HR-adviseur': pick(rng, recruiters, rows),
+        'Selectiecommissielid 1': pick(rng, managers, rows),
+        'E-mail': np.char.add(np.arange(rows).astype(str), '@voorbeeld.nl').astype(object),
+        'Mobiel': np.char.add('06', rng.integers(10000000, 99999999, rows).astype(str)).astype(object),
+    }
+    for col, values in OVERIGE_KOLOMMEN.items():
+        columns[col] = pick(rng, values, rows)
+
+    # Statusdatums: elke fase volgt een paar dagen op de vorige, tot en met de bereikte fase
+    created = rng.integers(0, span_days + 1, rows)
+    fase_days = created[:, None] + np.concatenate(
+        [np.zeros((rows, 1), dtype='int64'), rng.integers(1, 10, (rows, len(FASES) - 1)).cumsum(axis=1)], axis=1
+    )
+    status_index = pd.Series(statussen).map({status: i for i, status in enumerate(FASES)}).fillna(len(FASES) - 1).to_numpy()
+    end_day = span_days
+
+    columns['Datum aanmaak'] = format_days(created, origin, np.ones(rows, dtype=bool), rng)
+    for fase_index, fase in enumerate(FASES):
+        days = np.minimum(fase_days[:, fase_index], end_day)
+        columns[fase] = format_days(days, origin, status_index >= fase_index, rng)
+    close_days = np.minimum(fase_days[:, -1] + rng.integers(5, 60, rows), end_day)
+    for status in EINDSTATUSSEN:
+        columns[status] = format_days(close_days, origin, statussen == status, rng)
+
+    # Publicatieperiodes intern en extern
+    for soort, fase_index in [('intern', FASES.index('Publicatie intern')), ('extern', FASES.index('Publicatie in- en extern'))]:
+        published = status_index >= fase_index
+        start = np.minimum(fase_days[:, fase_index], end_day)
+        columns[f'Startdatum {soort}'] = format_days(start, origin, published, rng)
+        columns[f'Einddatum {soort}'] = format_days(np.minimum(start + 14, end_day), origin, published, rng)
+
+    # Reacties en hun verdeling over kandidaat statussen en wervingskanalen
+    reacties = rng.negative_binomial(3, 0.1, rows) * (status_index >= FASES.index('Publicatie intern'))
+    gesprekken = rng.binomial(reacties, 0.15)
+    aangenomen = np.where(np.isin(statussen, ['Extern vervuld', 'Intern vervuld']), np.minimum(gesprekken, 1 + rng.binomial(1, 0.1, rows)), 0)
+    afgewezen_brief = rng.binomial(reacties - gesprekken, 0.8)
+    kandidaat_tellingen = {
+        'Nieuw': reacties - gesprekken - afgewezen_brief,
+        'Gesprek gevoerd': gesprekken,
+        'Afgewezen na briefselectie': afgewezen_brief,
+        'Afgewezen na gesprek': gesprekken - aangenomen,
+        'Aanbod': aangenomen,
+        'Aangenomen': aangenomen
+    }
+    columns['Aantal reacties'] = reacties
+    for status in KANDIDAAT_STATUSSEN:
+        columns[f'Aantal in status: {status}'] = kandidaat_tellingen[status]
+
+    kanaal_totalen = rng.multinomial(reacties, list(KANALEN.values()))
+    kanaal_aangenomen = rng.multinomial(aangenomen, list(KANALEN.values()))
+    kanaal_aangenomen = np.minimum(kanaal_aangenomen, kanaal_totalen)
+    kanaal_afgewezen = rng.binomial(kanaal_totalen - kanaal_aangenomen, 0.85)
+    for kanaal_index, kanaal in enumerate(KANALEN):
+        columns[f'Totaal per wervingskanaal: {kanaal}'] = kanaal_totalen[:, kanaal_index]
+        columns[f'Totaal per wervingskanaal (aangenomen): {kanaal}'] = kanaal_aangenomen[:, kanaal_index]
+        columns[f'Totaal per wervingskanaal (afgewezen): {kanaal}'] = kanaal_afgewezen[:, kanaal_index]
+
+    df = pd.DataFrame(columns)
+
+    # Een klein deel van de aantallen is leeg, zoals bij vacatures die nooit gepubliceerd zijn
+    count_columns = [col for col in df.columns if col.startswith(('Aantal', 'Totaal per wervingskanaal'))]
+    for col in count_columns:
+        values = df[col].astype(str).to_numpy(dtype=object)
+        values[rng.random(rows) < 0.01] = ''
+        df[col] = values
+
+    return df
+
+def encode_export(df, encoding='utf-8', seed=0):
+    """Schrijft de export naar bytes in de gevraagde encoding"""
+    if encoding not in ENCODINGS:
+        raise ValueError(f"Onbekende encoding: {encoding} (kies uit {', '.join(ENCODINGS)})")
+
+    text = io.StringIO()
+    df.to_csv(text, sep=';', index=False)
+    text = text.getvalue()
+    if encoding != 'gemengd':
+        return text.encode(encoding, errors='replace')
+
+    # Gemengd: de header en de meeste rijen als UTF-8, een willekeurig blok rijen als CP1252
+    lines = text.splitlines(keepends=True)
+    rng = np.random.default_rng(seed)
+    cp1252_start = int(rng.integers(1, max(len(lines) - 1, 2)))
+    cp1252_end = min(cp1252_start + max(len(lines) // 20, 1), len(lines))
+    return b''.join([
+        ''.join(lines[:cp1252_start]).encode('utf-8'),
+        ''.join(lines[cp1252_start:cp1252_end]).encode('cp1252', errors='replace'),
+        ''.join(lines[cp1252_end:]).encode('utf-8')
+    ])
+
+def generate_export(rows, seed=0, encoding='utf-8', end_date=None):
+    """Synthetische ATS export van rows vacatures als bytes, deterministisch per seed"""
+    return encode_export(generate_frame(rows, seed=seed, end_date=end_date), encoding=encoding, seed=seed)
+
+def main():
+    parser = argparse.ArgumentParser(description="Genereer een synthetische ATS export")
+    parser.add_argument('--rows', type=int, default=10000, help="Aantal vacatures")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--encoding', choices=ENCODINGS, default='utf-8')
+    parser.add_argument('--end-date', type=date.fromisoformat, default=None,
+                        help="Laatste aanmaakdatum (YYYY-MM-DD), standaard vandaag")
+    parser.add_argument('-o', '--output', default='synthetische_export.csv')
+    args = parser.parse_args()
+
+    data = generate_export(args.rows, seed=args.seed, encoding=args.encoding, end_date=args.end_date)
+    with open(args.output, 'wb') as export_file:
+        export_file.write(data)
+    print(f"{args.rows:,} vacatures ({len(data) / 1024 / 1024:.1f} MB, {args.encoding}) geschreven naar {args.output}")
+
+if __name__ == "__main__":
+    main()